@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark the public dataflow functions in tradingagents/dataflows/interface.py
+
+Generates synthetic offline data of configurable size (years of daily bars,
+Reddit posts per day, Finnhub history, SimFin-sized statement CSVs) with
+benchmarks/synthetic_data.py, then calls every offline interface function
+repeatedly and reports latency percentiles, result size and the peak Python
+memory allocated per call. Latency is timed without tracing; memory comes from
+separate tracemalloc-traced calls. CoinGecko functions run against replayed
+responses, with the shared response cache cleared before each call so the
+request and formatting path is measured every time.
+
+Functions that only exist online (Google News scraping, live Yahoo Finance,
+the OpenAI web-search helpers) are listed as skipped.
+
+Usage: python benchmarks/bench_dataflows.py --years 20 --reddit-posts 5000 --simfin-companies 5000
+"""
+
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from synthetic_data import (
+    coingecko_responses,
+    replay_coingecko,
+    use_data_dir,
+    write_finnhub_data,
+    write_price_data,
+    write_reddit_data,
+    write_simfin_data,
+)
+from tradingagents.dataflows import coingecko_utils, interface
+
+SKIPPED = {
+    "get_google_news": "scrapes Google News live",
+    "get_YFin_data_online": "downloads from Yahoo Finance",
+    "get_stock_news_openai": "calls the LLM provider",
+    "get_global_news_openai": "calls the LLM provider",
+    "get_fundamentals_openai": "calls the LLM provider",
+}
+
+
+def benchmarks(ticker, coin, date, look_back):
+    """(function name, zero-argument call) for every offline interface function."""
+    return [
+        ("get_finnhub_news", lambda: interface.get_finnhub_news(ticker, date, look_back)),
+        (
+            "get_finnhub_company_insider_sentiment",
+            lambda: interface.get_finnhub_company_insider_sentiment(ticker, date, look_back),
+        ),
+        (
+            "get_finnhub_company_insider_transactions",
+            lambda: interface.get_finnhub_company_insider_transactions(ticker, date, look_back),
+        ),
+        ("get_simfin_balance_sheet", lambda: interface.get_simfin_balance_sheet(ticker, "quarterly", date)),
+        ("get_simfin_cashflow", lambda: interface.get_simfin_cashflow(ticker, "quarterly", date)),
+        (
+            "get_simfin_income_statements",
+            lambda: interface.get_simfin_income_statements(ticker, "quarterly", date),
+        ),
+        ("get_reddit_global_news", lambda: interface.get_reddit_global_news(date, 7, 10)),
+        ("get_reddit_company_news", lambda: interface.get_reddit_company_news(ticker, date, 7, 10)),
+        (
+            "get_stock_stats_indicators_window",
+            lambda: interface.get_stock_stats_indicators_window(ticker, "rsi", date, look_back, False),
+        ),
+        ("get_stockstats_indicator", lambda: interface.get_stockstats_indicator(ticker, "macd", date, False)),
+        ("get_YFin_data_window", lambda: interface.get_YFin_data_window(ticker, date, look_back)),
+        ("get_YFin_data", lambda: interface.get_YFin_data(ticker, "2015-01-01", date)),
+        ("get_crypto_market_analysis", lambda: interface.get_crypto_market_analysis(coin, date)),
+        ("get_crypto_price_history", lambda: interface.get_crypto_price_history(coin, date, look_back)),
+        ("get_crypto_technical_analysis", lambda: interface.get_crypto_technical_analysis(coin, date, look_back)),
+        ("get_crypto_news_analysis", lambda: interface.get_crypto_news_analysis(coin, date, 7)),
+        ("get_crypto_fundamentals_analysis", lambda: interface.get_crypto_fundamentals_analysis(coin, date)),
+    ]
+
+
+def uncovered(names):
+    """Public interface functions that are neither benchmarked nor skipped."""
+    public = {
+        name
+        for name, member in inspect.getmembers(interface, inspect.isfunction)
+        if member.__module__ == interface.__name__ and not name.startswith("_")
+    }
+    return sorted(public - set(names) - set(SKIPPED))
+
+
+def percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def result_size(result):
+    if isinstance(result, str):
+        return f"{len(result.encode('utf-8')) / 1024:.1f} KB"
+    if hasattr(result, "shape"):
+        return f"{result.shape[0]} rows"
+    return "-"
+
+
+def call(fn):
+    # CoinGecko responses are cached process-wide; clear so each call does the work
+    with coingecko_utils._response_cache_lock:
+        coingecko_utils._response_cache.clear()
+    # Progress bars and "not found" prints would drown the report
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        return fn()
+
+
+def bench(fn, repeat, memory_samples):
+    result = call(fn)  # warm-up: imports, page cache
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call(fn)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    peaks = []
+    tracemalloc.start()
+    for _ in range(memory_samples):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        call(fn)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": percentile(latencies, 0.50),
+        "p90_ms": percentile(latencies, 0.90),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": latencies[-1],
+        "peak_alloc_mb": max(peaks) / (1024 * 1024) if peaks else float("nan"),
+        "result": result_size(result),
+    }
+
+
+def directory_size_mb(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticker", default="AAPL", help="Stock ticker for the offline data")
+    parser.add_argument("--coin", default="BTC", help="Crypto symbol for the CoinGecko functions")
+    parser.add_argument("--date", default="2025-03-20", help="Current date (offline YFin data ends 2025-03-25)")
+    parser.add_argument("--look-back", type=int, default=30, help="Look-back days for windowed functions")
+    parser.add_argument("--years", type=float, default=10, help="Years of daily bars")
+    parser.add_argument("--finnhub-days", type=int, default=730, help="Days of Finnhub history")
+    parser.add_argument("--news-per-day", type=int, default=50, help="Finnhub headlines per day")
+    parser.add_argument("--reddit-days", type=int, default=30, help="Days in the Reddit dumps")
+    parser.add_argument("--reddit-posts", type=int, default=2000, help="Reddit posts per day and category")
+    parser.add_argument(
+        "--simfin-companies", type=int, default=500, help="Companies per SimFin CSV (full US set is ~5000)"
+    )
+    parser.add_argument("--simfin-periods", type=int, default=40, help="Quarterly reports per company")
+    parser.add_argument("--crypto-days", type=int, default=365, help="Days in the CoinGecko price charts")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per function")
+    parser.add_argument("--memory-samples", type=int, default=3, help="Traced calls per function")
+    parser.add_argument("--only", nargs="*", help="Only benchmark functions whose name contains one of these")
+    parser.add_argument("--output", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="bench_dataflows_")
+    print("🗂️  Generating synthetic data...")
+    timings = {}
+    for label, write in (
+        ("price bars", lambda: write_price_data(data_dir, [args.ticker], args.years)),
+        (
+            "finnhub",
+            lambda: write_finnhub_data(
+                data_dir, [args.ticker], args.date, args.finnhub_days, args.news_per_day
+            ),
+        ),
+        (
+            "reddit",
+            lambda: write_reddit_data(
+                data_dir, [args.ticker], args.date, args.reddit_days, args.reddit_posts
+            ),
+        ),
+        (
+            "simfin",
+            lambda: write_simfin_data(
+                data_dir, [args.ticker], args.simfin_companies, args.simfin_periods
+            ),
+        ),
+    ):
+        start = time.perf_counter()
+        write()
+        timings[label] = time.perf_counter() - start
+    use_data_dir(data_dir)
+    coin_id = coingecko_utils.CoinGeckoAPI().major_coin_ids.get(args.coin.lower(), args.coin.lower())
+    replay_coingecko(coingecko_responses([coin_id], args.date, args.crypto_days))
+    print(
+        f"   {directory_size_mb(data_dir):.0f} MB in {data_dir} ("
+        + ", ".join(f"{label} {seconds:.1f}s" for label, seconds in timings.items())
+        + ")"
+    )
+
+    cases = benchmarks(args.ticker, args.coin, args.date, args.look_back)
+    missing = uncovered(name for name, _ in cases)
+    if missing:
+        print(f"⚠️  Not covered by this benchmark: {', '.join(missing)}")
+    if args.only:
+        cases = [(name, fn) for name, fn in cases if any(part in name for part in args.only)]
+
+    print(f"\n📊 {len(cases)} functions, {args.repeat} timed calls each")
+    print("=" * 96)
+    print(
+        f"{'function':<42} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} "
+        f"{'alloc MB':>9} {'result':>10}"
+    )
+    results = {}
+    for name, fn in cases:
+        try:
+            stats = bench(fn, args.repeat, args.memory_samples)
+        except Exception as e:
+            print(f"{name:<42} ❌ {type(e).__name__}: {e}")
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+        results[name] = stats
+        print(
+            f"{name:<42} {stats['p50_ms']:>9.2f} {stats['p90_ms']:>9.2f} {stats['p99_ms']:>9.2f} "
+            f"{stats['max_ms']:>9.2f} {stats['peak_alloc_mb']:>9.2f} {stats['result']:>10}"
+        )
+    for name, reason in SKIPPED.items():
+        print(f"{name:<42} skipped: {reason}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results, "skipped": SKIPPED}, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Benchmark end-to-end graph runs without LLM providers or data services
+
+Runs TradingAgentsGraph.propagate and propagate_many against a scripted chat
+model (benchmarks/fake_llm.py) with offline data: synthetic YFin, Finnhub,
+Reddit and SimFin files plus replayed CoinGecko responses
+(benchmarks/synthetic_data.py). With the default zero latency every measured
+second is framework overhead (orchestration, prompts, memories, dataflows),
+so regressions there show up directly. Reports runs per minute, per-stage
+overhead, peak RSS and Python allocations (tracemalloc; pass --no-trace for
+untraced timings).
+
+Google News is never called because it always scrapes the live site, and
+the Reddit company tool is not called for crypto tickers, which have no
+company entry in the Reddit data. Pass
+--data-dir and --coingecko-fixture to replay recorded data instead of the
+synthetic sets.
+
+Usage: python benchmarks/bench_end_to_end.py --tickers AAPL BTC --runs 4 --batch 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fake_llm import ScriptedChatModel
+from synthetic_data import coingecko_responses, replay_coingecko, use_data_dir, write_offline_data
+from tradingagents.dataflows.coingecko_utils import CoinGeckoAPI
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+# Tools that only exist online; the scripted model never calls them
+NETWORK_TOOLS = ["get_google_news"]
+# Tools with synthetic data for stocks only; not called for crypto tickers
+STOCK_ONLY_TOOLS = ["get_reddit_stock_info"]
+
+
+class ScriptedGraph(TradingAgentsGraph):
+    """TradingAgentsGraph that uses one scripted model for both LLM roles."""
+
+    def __init__(self, llm, **kwargs):
+        self.scripted_llm = llm
+        super().__init__(**kwargs)
+
+    def _create_llms(self, config):
+        return self.scripted_llm, self.scripted_llm
+
+
+def peak_rss_mb():
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def build_config(args, workdir, data_dir):
+    config = DEFAULT_CONFIG.copy()
+    config.update(
+        {
+            "results_dir": os.path.join(workdir, "results"),
+            "data_dir": data_dir,
+            "data_cache_dir": os.path.join(workdir, "data_cache"),
+            "online_tools": False,
+            "embedding_provider": "local",
+            "memory_backend": "numpy",
+            "memory_mode": "ephemeral",
+            "max_debate_rounds": args.debate_rounds,
+            "max_risk_discuss_rounds": args.debate_rounds,
+            "report_digest": args.report_digest,
+            "checkpointing": False,
+            "report_cache": False,
+            "llm_cache": False,
+            "embedding_cache_persist": False,
+        }
+    )
+    return config
+
+
+def prepare_data(args, workdir):
+    """Write or locate the offline data and start replaying CoinGecko."""
+    data_dir = args.data_dir
+    if data_dir is None:
+        data_dir = os.path.join(workdir, "data")
+        start = time.perf_counter()
+        write_offline_data(
+            data_dir,
+            args.tickers,
+            args.date,
+            years=args.years,
+            news_per_day=args.news_per_day,
+            reddit_posts_per_day=args.reddit_posts,
+        )
+        print(f"🗂️  Synthetic data written to {data_dir} in {time.perf_counter() - start:.1f}s")
+    use_data_dir(data_dir)
+
+    if args.coingecko_fixture:
+        with open(args.coingecko_fixture) as f:
+            responses = json.load(f)
+    else:
+        coin_ids = CoinGeckoAPI().major_coin_ids
+        responses = coingecko_responses(
+            [coin_ids[t.lower()] for t in args.tickers if t.lower() in coin_ids], args.date
+        )
+    replay_coingecko(responses)
+    return data_dir
+
+
+def measure(label, run, trace, trace_top):
+    """Time a phase and record its memory use; run returns (profiles, error count)."""
+    if trace:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot() if trace and trace_top else None
+    start = time.perf_counter()
+    profiles, errors = run()
+    elapsed = time.perf_counter() - start
+    current = peak = float("nan")
+    top = []
+    if trace:
+        current, peak = tracemalloc.get_traced_memory()
+        if trace_top:
+            stats = tracemalloc.take_snapshot().compare_to(before, "lineno")
+            top = [str(stat) for stat in stats[:trace_top]]
+        tracemalloc.stop()
+    return {
+        "phase": label,
+        "runs": len(profiles),
+        "errors": errors,
+        "seconds": elapsed,
+        "runs_per_minute": len(profiles) / elapsed * 60 if elapsed else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "traced_peak_mb": peak / (1024 * 1024),
+        "traced_retained_mb": current / (1024 * 1024),
+        "top_allocations": top,
+        "profiles": profiles,
+    }
+
+
+def stage_table(profiles):
+    """Mean per-run time of each node, split into LLM time and overhead."""
+    totals = defaultdict(lambda: defaultdict(float))
+    tools = defaultdict(lambda: defaultdict(float))
+    for profile in profiles:
+        for node, stats in profile["nodes"].items():
+            for key in ("calls", "wall_seconds", "llm_seconds", "llm_queue_seconds", "errors"):
+                totals[node][key] += stats[key]
+        for tool, stats in profile["tools"].items():
+            for key in ("calls", "wall_seconds", "output_bytes", "errors"):
+                tools[tool][key] += stats[key]
+    runs = max(1, len(profiles))
+    stages = {
+        node: {
+            "calls_per_run": stats["calls"] / runs,
+            "wall_ms": stats["wall_seconds"] / runs * 1000,
+            "llm_ms": (stats["llm_seconds"] + stats["llm_queue_seconds"]) / runs * 1000,
+            "overhead_ms": (
+                stats["wall_seconds"] - stats["llm_seconds"] - stats["llm_queue_seconds"]
+            ) / runs * 1000,
+            "errors": stats["errors"],
+        }
+        for node, stats in totals.items()
+    }
+    tool_stats = {
+        tool: {
+            "calls_per_run": stats["calls"] / runs,
+            "ms_per_call": stats["wall_seconds"] / max(1, stats["calls"]) * 1000,
+            "kb_per_call": stats["output_bytes"] / max(1, stats["calls"]) / 1024,
+            "errors": stats["errors"],
+        }
+        for tool, stats in tools.items()
+    }
+    return stages, tool_stats
+
+
+def print_phase(result):
+    print(f"\n📊 {result['phase']}")
+    print("=" * 78)
+    print(
+        f"runs {result['runs']}  errors {result['errors']}  {result['seconds']:.2f}s  "
+        f"{result['runs_per_minute']:.1f} runs/min"
+    )
+    print(
+        f"peak RSS {result['peak_rss_mb']:.0f} MB  traced peak {result['traced_peak_mb']:.1f} MB  "
+        f"retained {result['traced_retained_mb']:.1f} MB"
+    )
+    stages, tools = stage_table(result["profiles"])
+    print(f"\n{'stage':<28} {'calls':>6} {'wall ms':>10} {'llm ms':>10} {'overhead ms':>12}")
+    for node, stats in sorted(stages.items(), key=lambda item: -item[1]["overhead_ms"]):
+        print(
+            f"{node:<28} {stats['calls_per_run']:>6.1f} {stats['wall_ms']:>10.1f} "
+            f"{stats['llm_ms']:>10.1f} {stats['overhead_ms']:>12.1f}"
+        )
+    if tools:
+        print(f"\n{'tool':<42} {'calls':>6} {'ms/call':>10} {'KB/call':>9} {'errors':>7}")
+        for tool, stats in sorted(tools.items(), key=lambda item: -item[1]["ms_per_call"]):
+            print(
+                f"{tool:<42} {stats['calls_per_run']:>6.1f} {stats['ms_per_call']:>10.1f} "
+                f"{stats['kb_per_call']:>9.1f} {stats['errors']:>7.0f}"
+            )
+    for line in result["top_allocations"]:
+        print(f"  {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tickers", nargs="+", default=["AAPL", "BTC"], help="Tickers to cycle through")
+    parser.add_argument("--date", default="2024-05-10", help="Trade date (offline YFin data ends 2025-03-25)")
+    parser.add_argument("--analysts", nargs="+", default=["market", "social", "news", "fundamentals"])
+    parser.add_argument("--runs", type=int, default=4, help="Sequential propagate runs")
+    parser.add_argument("--batch", type=int, default=8, help="propagate_many jobs (0 = skip)")
+    parser.add_argument("--concurrency", type=int, default=4, help="propagate_many concurrency")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before measuring")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per LLM call")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Simulated seconds per output token")
+    parser.add_argument("--output-tokens", type=int, default=200, help="Tokens per LLM answer")
+    parser.add_argument("--debate-rounds", type=int, default=1)
+    parser.add_argument("--report-digest", action="store_true")
+    parser.add_argument("--years", type=float, default=10, help="Years of daily bars per ticker")
+    parser.add_argument("--news-per-day", type=int, default=20, help="Finnhub headlines per day")
+    parser.add_argument("--reddit-posts", type=int, default=200, help="Reddit posts per day and category")
+    parser.add_argument("--data-dir", help="Existing offline data directory to use instead of synthetic data")
+    parser.add_argument("--coingecko-fixture", help="JSON of recorded CoinGecko responses keyed by endpoint")
+    parser.add_argument(
+        "--no-trace", action="store_true", help="Skip allocation tracing, which slows runs down"
+    )
+    parser.add_argument("--trace-top", type=int, default=0, help="Show the N largest allocation sites per phase")
+    parser.add_argument("--output", help="Write the results as JSON")
+    args = parser.parse_args()
+    for name in ("data_dir", "coingecko_fixture", "output"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+
+    workdir = tempfile.mkdtemp(prefix="bench_e2e_")
+    data_dir = prepare_data(args, workdir)
+    # State logs and run profiles are written relative to the working directory
+    os.chdir(workdir)
+
+    llm = ScriptedChatModel(
+        latency=args.latency,
+        token_latency=args.token_latency,
+        output_tokens=args.output_tokens,
+        default_date=args.date,
+        skip_tools=NETWORK_TOOLS,
+        skip_tools_by_ticker={
+            ticker.upper(): STOCK_ONLY_TOOLS
+            for ticker in args.tickers
+            if ticker.lower() in CoinGeckoAPI().major_coin_ids
+        },
+    )
+    start = time.perf_counter()
+    graph = ScriptedGraph(
+        llm, selected_analysts=args.analysts, config=build_config(args, workdir, data_dir)
+    )
+    print(f"🏗️  Graph built in {time.perf_counter() - start:.2f}s (peak RSS {peak_rss_mb():.0f} MB)")
+
+    tickers = [args.tickers[i % len(args.tickers)] for i in range(max(args.runs, args.batch, args.warmup))]
+    for ticker in tickers[: args.warmup]:
+        graph.propagate(ticker, args.date)
+
+    def sequential():
+        profiles = [
+            graph.propagate(ticker, args.date, return_profile=True)[2]
+            for ticker in tickers[: args.runs]
+        ]
+        return profiles, 0
+
+    def batch():
+        results = list(
+            graph.propagate_many(
+                [(ticker, args.date) for ticker in tickers[: args.batch]],
+                max_concurrency=args.concurrency,
+            )
+        )
+        return [r["profile"] for r in results], sum(1 for r in results if r["error"])
+
+    results = []
+    if args.runs:
+        results.append(measure("propagate (sequential)", sequential, not args.no_trace, args.trace_top))
+    if args.batch:
+        results.append(
+            measure(
+                f"propagate_many (concurrency {args.concurrency})",
+                batch,
+                not args.no_trace,
+                args.trace_top,
+            )
+        )
+
+    print(
+        f"\n⚙️  {len(args.analysts)} analysts, {args.debate_rounds} debate round(s), "
+        f"latency {args.latency}s + {args.token_latency}s/token, {args.output_tokens} tokens/answer"
+    )
+    for result in results:
+        print_phase(result)
+
+    if args.output:
+        for result in results:
+            result["stages"], result["tools"] = stage_table(result.pop("profiles"))
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "phases": results}, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark the agent memory backends (Chroma vs NumPy)
+
+Uses synthetic embeddings, so no embeddings endpoint is needed. Reports
+cold start (import + store creation), bulk add and query latency.
+
+Usage: python benchmarks/bench_memory_backends.py --size 2000 --dim 4096
+"""
+
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tradingagents.agents.utils.memory_store import create_memory_store
+
+
+def bench_backend(backend, vectors, queries, n_matches, persistent):
+    config = {
+        "memory_backend": backend,
+        "results_dir": tempfile.mkdtemp(prefix=f"bench_{backend}_"),
+        "session_id": "bench",
+    }
+
+    start = time.perf_counter()
+    if backend == "chroma":
+        importlib.import_module("chromadb")
+    store = create_memory_store("bench_memory", config, persistent=persistent)
+    cold_start = time.perf_counter() - start
+
+    documents = [f"situation {i}" for i in range(len(vectors))]
+    recommendations = [f"advice {i}" for i in range(len(vectors))]
+    start = time.perf_counter()
+    store.add(documents, recommendations, vectors.tolist())
+    add_time = time.perf_counter() - start
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        store.query(query.tolist(), n_matches)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    store.query_batch(queries.tolist(), n_matches)
+    batch_time = (time.perf_counter() - start) * 1000
+
+    reload_time = None
+    if persistent:
+        start = time.perf_counter()
+        create_memory_store("bench_memory", config, persistent=True)
+        reload_time = time.perf_counter() - start
+
+    return {
+        "cold_start_s": cold_start,
+        "add_s": add_time,
+        "query_p50_ms": statistics.median(latencies),
+        "query_p95_ms": float(np.percentile(latencies, 95)),
+        "batch_query_ms": batch_time,
+        "reload_s": reload_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=2000, help="Stored situations")
+    parser.add_argument("--dim", type=int, default=4096, help="Embedding size")
+    parser.add_argument("--queries", type=int, default=100, help="Query count")
+    parser.add_argument("--matches", type=int, default=2, help="Matches per query")
+    parser.add_argument("--persistent", action="store_true", help="Benchmark on-disk stores")
+    parser.add_argument(
+        "--backends", nargs="+", default=["numpy", "chroma"], help="Backends to compare"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.size, args.dim)).astype(np.float32)
+    queries = rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+
+    print(f"📊 {args.size} situations, {args.dim} dims, {args.queries} queries, top-{args.matches}")
+    print("=" * 60)
+    for backend in args.backends:
+        try:
+            result = bench_backend(backend, vectors, queries, args.matches, args.persistent)
+        except ImportError as e:
+            print(f"{backend:>8}: skipped ({e})")
+            continue
+        print(f"{backend:>8}:")
+        for key, value in result.items():
+            if value is not None:
+                print(f"    {key:<16} {value:10.4f}")
+
+
+if __name__ == "__main__":
+    main()
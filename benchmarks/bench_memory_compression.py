@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark compact vector storage for the NumPy memory backend
+
+Compares float32, float16 and int8 storage, with and without PCA, on bytes
+per vector, query latency and recall@k against exact float32 search.
+
+By default the corpus is synthetic: clustered vectors on a low-rank subspace
+plus noise, which is closer to real sentence embeddings than isotropic noise.
+Pass --embeddings with an .npy file of real embeddings for decision-grade
+numbers.
+
+Usage: python benchmarks/bench_memory_compression.py --size 4000 --dim 4096
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tradingagents.agents.utils.memory_store import NumpyMemoryStore, measure_recall
+
+
+def synthetic_corpus(size, dim, rank, clusters, rng):
+    basis = rng.standard_normal((rank, dim)).astype(np.float32)
+    centers = rng.standard_normal((clusters, rank)).astype(np.float32) * 3
+    labels = rng.integers(0, clusters, size)
+    latent = centers[labels] + rng.standard_normal((size, rank)).astype(np.float32)
+    noise = rng.standard_normal((size, dim)).astype(np.float32) * 0.5
+    return latent @ basis + noise
+
+
+def bench_variant(corpus, queries, k, dtype, pca_dims):
+    store = NumpyMemoryStore("bench", {"memory_dtype": dtype, "memory_pca_dims": pca_dims})
+    documents = [str(i) for i in range(len(corpus))]
+    start = time.perf_counter()
+    store.add(documents, documents, corpus)
+    add_time = time.perf_counter() - start
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        store.query(query, k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "bytes_per_vector": store.nbytes / max(1, store.count()),
+        "add_s": add_time,
+        "query_p50_ms": statistics.median(latencies),
+        "recall_at_k": measure_recall(corpus, queries, k, dtype, pca_dims),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=4000, help="Stored situations")
+    parser.add_argument("--dim", type=int, default=4096, help="Embedding size")
+    parser.add_argument("--queries", type=int, default=200, help="Query count")
+    parser.add_argument("--k", type=int, default=5, help="Matches per query")
+    parser.add_argument(
+        "--pca-dims", type=int, nargs="*", default=[0, 256], help="PCA sizes to try (0 = off)"
+    )
+    parser.add_argument("--embeddings", help="Optional .npy file of real embeddings")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    if args.embeddings:
+        data = np.load(args.embeddings).astype(np.float32)
+        rng.shuffle(data)
+        queries, corpus = data[: args.queries], data[args.queries :]
+    else:
+        data = synthetic_corpus(args.size + args.queries, args.dim, 64, 50, rng)
+        queries, corpus = data[: args.queries], data[args.queries :]
+
+    print(f"📊 {len(corpus)} situations, {corpus.shape[1]} dims, {len(queries)} queries, recall@{args.k}")
+    print("=" * 78)
+    print(f"{'dtype':>8} {'pca':>5} {'bytes/vec':>10} {'add s':>8} {'p50 ms':>8} {'recall':>8}")
+    for pca_dims in args.pca_dims:
+        for dtype in ("float32", "float16", "int8"):
+            result = bench_variant(corpus, queries, args.k, dtype, pca_dims)
+            print(
+                f"{dtype:>8} {pca_dims or '-':>5} {result['bytes_per_vector']:>10.0f} "
+                f"{result['add_s']:>8.3f} {result['query_p50_ms']:>8.3f} {result['recall_at_k']:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
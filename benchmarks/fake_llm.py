@@ -0,0 +1,146 @@
+"""
+Scripted chat model for offline benchmarks
+
+Stands in for the real chat models so a full graph run can be timed without
+a provider. With tools bound and no tool results in the conversation yet it
+calls every bound tool once, with arguments filled from the prompt (ticker and
+trade date) and the tool schema; otherwise it answers with a filler report of
+a fixed token count that ends in a trade proposal. Latency is simulated with
+a per-call delay plus a per-output-token delay.
+"""
+
+import itertools
+import re
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+# The analysts state the ticker and date in their system prompts
+_TICKER = re.compile(
+    r"(?:want to look at is|looking at the company|want to analyze is)\s+([A-Za-z0-9.\-]+)"
+)
+_DATE = re.compile(r"current date is\s+(\d{4}-\d{2}-\d{2})")
+
+_FILLER = (
+    "The trend remains constructive with momentum above the medium term average "
+    "while volume confirms accumulation and risk stays balanced against support"
+).split()
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Deterministic chat model with configurable latency and output size."""
+
+    latency: float = 0.0
+    token_latency: float = 0.0
+    output_tokens: int = 200
+    decision: str = "BUY"
+    default_ticker: str = "AAPL"
+    default_date: str = "2024-05-10"
+    # Values for specific tool arguments, e.g. {"indicator": "macd"}
+    tool_arguments: Dict[str, Any] = {}
+    # Bound tools never called, e.g. ones that always go to the network
+    skip_tools: List[str] = []
+    # Bound tools never called for specific tickers, e.g. stock-only tools for coins
+    skip_tools_by_ticker: Dict[str, List[str]] = {}
+    bound_tools: List[Dict[str, Any]] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.model_copy(
+            update={"bound_tools": [convert_to_openai_tool(tool) for tool in tools]}
+        )
+
+    def _report(self, ticker: str) -> str:
+        words = list(itertools.islice(itertools.cycle(_FILLER), max(0, self.output_tokens - 8)))
+        return (
+            f"{ticker}: " + " ".join(words)
+            + f"\n\nFINAL TRANSACTION PROPOSAL: **{self.decision}**"
+        )
+
+    def _argument(self, name: str, spec: Dict[str, Any], ticker: str, date: str):
+        if name in self.tool_arguments:
+            return self.tool_arguments[name]
+        if "enum" in spec:
+            return self.decision if self.decision in spec["enum"] else spec["enum"][0]
+        if name in ("ticker", "symbol", "query"):
+            return ticker
+        if name in ("curr_date", "end_date"):
+            return date
+        if name == "start_date":
+            start = datetime.strptime(date, "%Y-%m-%d") - timedelta(days=30)
+            return start.strftime("%Y-%m-%d")
+        if name == "indicator":
+            return "rsi"
+        if name == "freq":
+            return "quarterly"
+        kind = spec.get("type")
+        if kind == "integer":
+            return 7
+        if kind == "number":
+            return 0.5
+        if kind == "boolean":
+            return False
+        return self._report(ticker)
+
+    def _tool_calls(self, ticker: str, date: str) -> List[Dict[str, Any]]:
+        calls = []
+        skipped = set(self.skip_tools) | set(self.skip_tools_by_ticker.get(ticker.upper(), []))
+        for tool in self.bound_tools:
+            function = tool["function"]
+            if function["name"] in skipped:
+                continue
+            parameters = function.get("parameters", {})
+            properties = parameters.get("properties", {})
+            required = parameters.get("required", list(properties))
+            calls.append(
+                {
+                    "name": function["name"],
+                    "args": {
+                        name: self._argument(name, properties[name], ticker, date)
+                        for name in required
+                    },
+                    "id": f"call_{uuid.uuid4().hex[:12]}",
+                }
+            )
+        return calls
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt = "\n".join(str(message.content) for message in messages)
+        ticker_match = _TICKER.search(prompt)
+        date_match = _DATE.search(prompt)
+        ticker = ticker_match.group(1) if ticker_match else self.default_ticker
+        date = date_match.group(1) if date_match else self.default_date
+
+        tool_calls = []
+        if not any(isinstance(m, ToolMessage) for m in messages):
+            tool_calls = self._tool_calls(ticker, date)
+        if tool_calls:
+            message = AIMessage(content="", tool_calls=tool_calls)
+            completion_tokens = 20 * len(tool_calls)
+        else:
+            message = AIMessage(content=self._report(ticker))
+            completion_tokens = self.output_tokens
+
+        time.sleep(self.latency + self.token_latency * completion_tokens)
+        prompt_tokens = len(prompt) // 4
+        message.usage_metadata = {
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
@@ -0,0 +1,352 @@
+"""
+Synthetic offline datasets for the benchmarks
+
+Writes data in the layouts the offline dataflows read from data_dir (YFin
+price CSVs, Finnhub JSON, Reddit JSONL dumps and SimFin CSVs) and builds
+CoinGecko API responses that can be replayed in place of the live API.
+Everything is generated from a seed, so runs are reproducible; sizes are
+parameters so the same generators drive small end-to-end runs and large
+dataflow microbenchmarks.
+"""
+
+import calendar
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+# File name the offline YFin dataflows expect, whatever range the file covers
+YFIN_FILE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+YFIN_LAST_DATE = "2025-03-25"
+
+REDDIT_SUBREDDITS = {
+    "global_news": ["worldnews", "economics"],
+    "company_news": ["stocks", "investing"],
+}
+
+SIMFIN_STATEMENTS = {
+    # statement directory: (file prefix, line items)
+    "balance_sheet": (
+        "balance",
+        [
+            "Cash, Cash Equivalents & Short Term Investments",
+            "Accounts & Notes Receivable",
+            "Inventories",
+            "Total Current Assets",
+            "Property, Plant & Equipment, Net",
+            "Long Term Investments & Receivables",
+            "Total Noncurrent Assets",
+            "Total Assets",
+            "Payables & Accruals",
+            "Short Term Debt",
+            "Total Current Liabilities",
+            "Long Term Debt",
+            "Total Noncurrent Liabilities",
+            "Total Liabilities",
+            "Share Capital & Additional Paid-In Capital",
+            "Retained Earnings",
+            "Total Equity",
+            "Total Liabilities & Equity",
+        ],
+    ),
+    "cash_flow": (
+        "cashflow",
+        [
+            "Net Income/Starting Line",
+            "Depreciation & Amortization",
+            "Non-Cash Items",
+            "Change in Working Capital",
+            "Net Cash from Operating Activities",
+            "Change in Fixed Assets & Intangibles",
+            "Net Cash from Investing Activities",
+            "Dividends Paid",
+            "Cash from (Repayment of) Debt",
+            "Cash from (Repurchase of) Equity",
+            "Net Cash from Financing Activities",
+            "Net Change in Cash",
+        ],
+    ),
+    "income_statements": (
+        "income",
+        [
+            "Revenue",
+            "Cost of Revenue",
+            "Gross Profit",
+            "Operating Expenses",
+            "Selling, General & Administrative",
+            "Research & Development",
+            "Depreciation & Amortization",
+            "Operating Income (Loss)",
+            "Non-Operating Income (Loss)",
+            "Interest Expense, Net",
+            "Pretax Income (Loss)",
+            "Income Tax (Expense) Benefit, Net",
+            "Net Income",
+        ],
+    ),
+}
+
+_WORDS = (
+    "market earnings guidance revenue growth margin outlook analyst rating "
+    "demand supply chain inflation rates fed policy chip cloud consumer "
+    "regulation lawsuit merger buyback dividend forecast quarter record "
+    "shares investors volatility rally selloff upgrade downgrade"
+).split()
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _days(end_date, days):
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    return [end - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+
+
+def price_frame(years, end_date=YFIN_LAST_DATE, seed=0):
+    """Daily OHLCV bars on business days over the given number of years."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=end_date, periods=max(1, int(years * 252)))
+    returns = rng.normal(0.0004, 0.02, len(dates))
+    close = 100 * np.exp(np.cumsum(returns))
+    open_ = close * (1 + rng.normal(0, 0.005, len(dates)))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, len(dates))))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, len(dates))))
+    return pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": open_.round(4),
+            "High": high.round(4),
+            "Low": low.round(4),
+            "Close": close.round(4),
+            "Adj Close": close.round(4),
+            "Volume": rng.integers(1_000_000, 50_000_000, len(dates)),
+        }
+    )
+
+
+def write_price_data(data_dir, symbols, years=10, end_date=YFIN_LAST_DATE, seed=0):
+    directory = os.path.join(data_dir, "market_data", "price_data")
+    os.makedirs(directory, exist_ok=True)
+    for i, symbol in enumerate(symbols):
+        frame = price_frame(years, end_date, seed + i)
+        frame.to_csv(os.path.join(directory, YFIN_FILE.format(symbol=symbol)), index=False)
+
+
+def write_finnhub_data(data_dir, tickers, end_date, days=365, news_per_day=20, seed=0):
+    """Finnhub news, insider sentiment and insider transactions keyed by day."""
+    rng = random.Random(seed)
+    days_list = _days(end_date, days)
+    for ticker in tickers:
+        news, sentiment, transactions = {}, {}, {}
+        for day in days_list:
+            key = day.strftime("%Y-%m-%d")
+            news[key] = [
+                {"headline": f"{ticker} {_text(rng, 8)}", "summary": _text(rng, 60)}
+                for _ in range(news_per_day)
+            ]
+            sentiment[key] = [
+                {
+                    "year": day.year,
+                    "month": day.month,
+                    "change": rng.randint(-50_000, 50_000),
+                    "mspr": round(rng.uniform(-100, 100), 4),
+                }
+            ]
+            transactions[key] = [
+                {
+                    "filingDate": key,
+                    "name": f"Insider {rng.randint(1, 40)}",
+                    "change": rng.randint(-20_000, 20_000),
+                    "share": rng.randint(1_000, 1_000_000),
+                    "transactionPrice": round(rng.uniform(10, 500), 2),
+                    "transactionCode": rng.choice("SPMAG"),
+                }
+                for _ in range(rng.randint(0, 3))
+            ]
+        for data_type, data in (
+            ("news_data", news),
+            ("insider_senti", sentiment),
+            ("insider_trans", transactions),
+        ):
+            directory = os.path.join(data_dir, "finnhub_data", data_type)
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f"{ticker}_data_formatted.json"), "w") as f:
+                json.dump(data, f)
+
+
+def write_reddit_data(data_dir, tickers, end_date, days=30, posts_per_day=200, seed=0):
+    """Reddit JSONL dumps; about a quarter of company posts mention one of the tickers."""
+    from tradingagents.dataflows.reddit_utils import ticker_to_company
+
+    rng = random.Random(seed)
+    days_list = _days(end_date, days)
+    for category, subreddits in REDDIT_SUBREDDITS.items():
+        directory = os.path.join(data_dir, "reddit_data", category)
+        os.makedirs(directory, exist_ok=True)
+        per_subreddit = max(1, posts_per_day // len(subreddits))
+        for subreddit in subreddits:
+            with open(os.path.join(directory, f"{subreddit}.jsonl"), "w") as f:
+                for day in days_list:
+                    # Posts are matched on their UTC date
+                    base = calendar.timegm(day.timetuple())
+                    for i in range(per_subreddit):
+                        title = _text(rng, 10)
+                        if category == "company_news" and tickers and rng.random() < 0.25:
+                            ticker = rng.choice(tickers)
+                            name = ticker_to_company.get(ticker, ticker).split(" OR ")[0]
+                            title = f"{name} {title}"
+                        post = {
+                            "created_utc": base + 3600 + i,
+                            "title": title,
+                            "selftext": _text(rng, 80) if rng.random() < 0.7 else "",
+                            "url": f"https://reddit.com/r/{subreddit}/{base}_{i}",
+                            "ups": rng.randint(0, 50_000),
+                        }
+                        f.write(json.dumps(post) + "\n")
+
+
+def simfin_frame(statement, tickers, companies=100, periods=40, end_date=YFIN_LAST_DATE, seed=0):
+    """A SimFin statement table for the given tickers plus filler companies.
+
+    periods is the number of reports per company (quarters for the quarterly
+    files); the full SimFin US set is a few thousand companies.
+    """
+    _, line_items = SIMFIN_STATEMENTS[statement]
+    rng = np.random.default_rng(seed)
+    names = list(tickers) + [f"SYN{i:04d}" for i in range(max(0, companies - len(tickers)))]
+    end = pd.Timestamp(end_date)
+    report_dates = pd.date_range(end=end - pd.Timedelta(days=45), periods=periods, freq="91D")
+    rows = len(names) * periods
+    frame = pd.DataFrame(
+        {
+            "Ticker": np.repeat(names, periods),
+            "SimFinId": np.repeat(np.arange(len(names)) + 10_000, periods),
+            "Currency": "USD",
+            "Fiscal Year": np.tile(report_dates.year, len(names)),
+            "Fiscal Period": np.tile(["Q%d" % q for q in report_dates.quarter], len(names)),
+            "Report Date": np.tile(report_dates.strftime("%Y-%m-%d"), len(names)),
+            "Publish Date": np.tile(
+                (report_dates + pd.Timedelta(days=40)).strftime("%Y-%m-%d"), len(names)
+            ),
+            "Shares (Basic)": rng.integers(10_000_000, 5_000_000_000, rows),
+            "Shares (Diluted)": rng.integers(10_000_000, 5_000_000_000, rows),
+        }
+    )
+    for item in line_items:
+        frame[item] = rng.normal(0, 5e9, rows).round(0)
+    return frame
+
+
+def write_simfin_data(data_dir, tickers, companies=100, periods=40, end_date=YFIN_LAST_DATE, seed=0):
+    for i, (statement, (prefix, _)) in enumerate(SIMFIN_STATEMENTS.items()):
+        directory = os.path.join(
+            data_dir, "fundamental_data", "simfin_data_all", statement, "companies", "us"
+        )
+        os.makedirs(directory, exist_ok=True)
+        for freq in ("quarterly", "annual"):
+            count = periods if freq == "quarterly" else max(1, periods // 4)
+            frame = simfin_frame(statement, tickers, companies, count, end_date, seed + i)
+            frame.to_csv(os.path.join(directory, f"us-{prefix}-{freq}.csv"), sep=";", index=False)
+
+
+def write_offline_data(
+    data_dir,
+    tickers,
+    end_date,
+    years=10,
+    news_days=365,
+    news_per_day=20,
+    reddit_days=30,
+    reddit_posts_per_day=200,
+    simfin_companies=100,
+    simfin_periods=40,
+    seed=0,
+):
+    """Write every offline dataset the stock tools read for the given tickers."""
+    write_price_data(data_dir, tickers, years, YFIN_LAST_DATE, seed)
+    write_finnhub_data(data_dir, tickers, end_date, news_days, news_per_day, seed)
+    write_reddit_data(data_dir, tickers, end_date, reddit_days, reddit_posts_per_day, seed)
+    write_simfin_data(data_dir, tickers, simfin_companies, simfin_periods, YFIN_LAST_DATE, seed)
+
+
+def coingecko_responses(coin_ids, end_date, days=365, seed=0):
+    """CoinGecko responses keyed by endpoint path, in the API's JSON shapes."""
+    rng = np.random.default_rng(seed)
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    stamps = [int((end - timedelta(days=d)).timestamp() * 1000) for d in range(days, -1, -1)]
+    responses = {
+        "/search/trending": {
+            "coins": [
+                {"item": {"name": f"Trending {i}", "symbol": f"TR{i}", "market_cap_rank": i * 10}}
+                for i in range(1, 8)
+            ]
+        },
+        "/global": {
+            "data": {
+                "total_market_cap": {"usd": 2.5e12},
+                "total_volume": {"usd": 9.0e10},
+                "market_cap_percentage": {"btc": 52.3},
+                "active_cryptocurrencies": 13_000,
+            }
+        },
+    }
+    for coin_id in coin_ids:
+        prices = (30_000 * np.exp(np.cumsum(rng.normal(0, 0.03, len(stamps))))).round(2)
+        chart = {
+            "prices": [[t, float(p)] for t, p in zip(stamps, prices)],
+            "total_volumes": [[t, float(rng.uniform(1e9, 5e10))] for t in stamps],
+            "market_caps": [[t, float(p * 19.5e6)] for t, p in zip(stamps, prices)],
+        }
+        responses[f"/coins/{coin_id}/market_chart/range"] = chart
+        responses[f"/coins/{coin_id}/market_chart"] = chart
+        responses[f"/coins/{coin_id}"] = {
+            "name": coin_id.title(),
+            "market_data": {
+                "current_price": {"usd": float(prices[-1])},
+                "market_cap": {"usd": float(prices[-1] * 19.5e6)},
+                "total_volume": {"usd": 3.1e10},
+                "price_change_percentage_24h": 1.2,
+                "price_change_percentage_7d": -3.4,
+                "price_change_percentage_30d": 8.9,
+                "market_cap_rank": 1,
+                "circulating_supply": 19.5e6,
+                "total_supply": 21e6,
+                "ath": {"usd": float(prices.max())},
+                "atl": {"usd": float(prices.min())},
+            },
+        }
+    return responses
+
+
+def replay_coingecko(responses):
+    """Serve CoinGecko requests from recorded responses instead of the network.
+
+    responses maps endpoint paths (e.g. "/coins/bitcoin/market_chart") to
+    response JSON; unknown endpoints return {} like a failed request does.
+    The shared response cache is cleared so every run goes through the
+    dataflow code.
+    """
+    from tradingagents.dataflows import coingecko_utils
+
+    def fetch(api, url, params=None):
+        return responses.get(url[len(api.base_url):], {})
+
+    coingecko_utils.CoinGeckoAPI._fetch = fetch
+    with coingecko_utils._response_cache_lock:
+        coingecko_utils._response_cache.clear()
+
+
+def use_data_dir(data_dir):
+    """Point the offline dataflows at data_dir.
+
+    interface.py copies DATA_DIR at import time, so set_config alone does not
+    redirect it.
+    """
+    from tradingagents.dataflows import interface
+
+    interface.set_config({"data_dir": data_dir})
+    interface.DATA_DIR = data_dir
@@ -21,6 +21,9 @@ from rich.align import Align
 from rich.rule import Rule
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tradingagents.graph.backtest import Backtester, summarize_backtest
+from tradingagents.graph.sharded_backtest import run_sharded_backtest
+from tradingagents.graph.checkpointing import BRANCH_STAGES, make_thread_id
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
@@ -731,12 +734,14 @@ def extract_content_string(content):
     else:
         return str(content)
 
-def run_analysis():
+def run_analysis(checkpoint: bool = False):
     # First get all user selections
     selections = get_user_selections()
 
     # Create config with selected research depth
     config = DEFAULT_CONFIG.copy()
+    # Checkpointed runs can be branched later with the `branch` command
+    config["checkpointing"] = checkpoint
     config["max_debate_rounds"] = selections["research_depth"]
     config["max_risk_discuss_rounds"] = selections["research_depth"]
     config["quick_think_llm"] = selections["shallow_thinker"]
@@ -839,7 +844,12 @@ def run_analysis():
         init_agent_state = graph.propagator.create_initial_state(
             selections["ticker"], selections["analysis_date"]
         )
-        args = graph.propagator.get_graph_args()
+        thread_id = None
+        if graph.checkpointer is not None:
+            thread_id = make_thread_id(
+                selections["ticker"], selections["analysis_date"], graph.config_hash
+            )
+        args = graph.propagator.get_graph_args(thread_id=thread_id)
 
         # Stream the analysis
         trace = []
@@ -1075,7 +1085,7 @@ def run_analysis():
 
         # Get final state and decision
         final_state = trace[-1]
-        decision = graph.process_signal(final_state["final_trade_decision"])
+        decision = graph.get_signal(final_state)
 
         # Update all agent statuses to completed
         for agent in message_buffer.agent_status:
@@ -1097,8 +1107,148 @@ def run_analysis():
 
 
 @app.command()
-def analyze():
-    run_analysis()
+def analyze(
+    checkpoint: bool = typer.Option(
+        False, help="Checkpoint the run so its stages can be re-run with `branch`"
+    ),
+):
+    run_analysis(checkpoint)
+
+
+@app.command()
+def backtest(
+    tickers: str = typer.Argument(..., help="Comma-separated tickers, e.g. BTC,ETH"),
+    start_date: str = typer.Argument(..., help="First trade date (YYYY-MM-DD)"),
+    end_date: str = typer.Argument(..., help="Last trade date (YYYY-MM-DD)"),
+    holding_days: int = typer.Option(1, help="Trading days each position is held"),
+    name: Optional[str] = typer.Option(
+        None, help="Run name; re-using a name resumes that run from its checkpoint"
+    ),
+    workers: int = typer.Option(
+        1, help="Worker processes; >1 shards tickers across a process pool"
+    ),
+):
+    """Walk a date range, reflecting on each decision once its return is realized."""
+    ticker_list = [t.strip().upper() for t in tickers.split(",") if t.strip()]
+    run_name = name or f"{'_'.join(ticker_list)}_{start_date}_{end_date}"
+    config = DEFAULT_CONFIG.copy()
+    run_dir = Path(config["results_dir"]) / "backtests" / run_name
+    checkpoint_path = run_dir / "checkpoint.json"
+    # Lessons learned before an interruption must survive a resume
+    config["memory_mode"] = "persistent"
+    config["memory_dir"] = str(run_dir / "memory")
+
+    if workers > 1:
+        records = run_sharded_backtest(
+            config,
+            ticker_list,
+            start_date,
+            end_date,
+            str(run_dir),
+            num_workers=workers,
+            holding_days=holding_days,
+        )
+        checkpoint_path = run_dir / "shards"
+    else:
+        graph = TradingAgentsGraph(config=config)
+        backtester = Backtester(graph, str(checkpoint_path), holding_days=holding_days)
+        records = backtester.run(ticker_list, start_date, end_date)
+
+    table = Table(title=f"Backtest {run_name}", box=box.SIMPLE_HEAD)
+    for column in ["Date", "Ticker", "Decision", "Market Return", "Strategy Return"]:
+        table.add_column(column)
+    for r in records:
+        table.add_row(
+            r["trade_date"],
+            r["ticker"],
+            r["decision"],
+            "N/A" if r["market_return"] is None else f"{r['market_return']:+.2%}",
+            "N/A" if r["strategy_return"] is None else f"{r['strategy_return']:+.2%}",
+        )
+    console.print(table)
+
+    summary = summarize_backtest(records)
+    console.print(
+        f"Steps: {summary['steps']}  Cumulative return: {summary['cumulative_return']:+.2%}  "
+        f"Hit rate: {summary['hit_rate']:.1%}"
+    )
+    console.print(f"Checkpoint: {checkpoint_path}")
+
+
+@app.command()
+def branch(
+    ticker: str = typer.Argument(..., help="Ticker of the checkpointed run"),
+    analysis_date: str = typer.Argument(..., help="Analysis date of the run (YYYY-MM-DD)"),
+    stage: str = typer.Argument(
+        ..., help=f"Stage to re-run from: {', '.join(BRANCH_STAGES)}"
+    ),
+    research_depth: int = typer.Option(1, help="Research depth of the source run"),
+    provider: str = typer.Option(
+        DEFAULT_CONFIG["llm_provider"], help="LLM provider of the source run"
+    ),
+    backend_url: str = typer.Option(
+        DEFAULT_CONFIG["backend_url"], help="Backend URL of the source run"
+    ),
+    analysts: str = typer.Option(
+        ",".join(analyst.value for _, analyst in ANALYST_ORDER),
+        help="Comma-separated analysts of the source run, e.g. market,news",
+    ),
+    deep_model: str = typer.Option(
+        DEFAULT_CONFIG["deep_think_llm"], help="Deep-thinking model of the source run"
+    ),
+    quick_model: str = typer.Option(
+        DEFAULT_CONFIG["quick_think_llm"], help="Quick-thinking model of the source run"
+    ),
+    debate_rounds: Optional[int] = typer.Option(None, help="Debate rounds for the branch"),
+    risk_rounds: Optional[int] = typer.Option(None, help="Risk discussion rounds for the branch"),
+    branch_deep_model: Optional[str] = typer.Option(
+        None, help="Deep-thinking model for the branch"
+    ),
+    branch_quick_model: Optional[str] = typer.Option(
+        None, help="Quick-thinking model for the branch"
+    ),
+):
+    """Re-run a stage of a checkpointed run with different parameters.
+
+    The source run options must match the run being branched (an `analyze
+    --checkpoint` run), since they identify its checkpoint.
+    """
+    selected = {a.strip().lower() for a in analysts.split(",") if a.strip()}
+    unknown = selected - {analyst.value for _, analyst in ANALYST_ORDER}
+    if unknown:
+        raise typer.BadParameter(f"Unknown analysts: {', '.join(sorted(unknown))}")
+    # Same order as the interactive selection, which the checkpoint id depends on
+    selected_analysts = [analyst.value for _, analyst in ANALYST_ORDER if analyst.value in selected]
+
+    config = DEFAULT_CONFIG.copy()
+    config["checkpointing"] = True
+    config["max_debate_rounds"] = research_depth
+    config["max_risk_discuss_rounds"] = research_depth
+    config["llm_provider"] = provider.lower()
+    config["backend_url"] = backend_url
+    config["deep_think_llm"] = deep_model
+    config["quick_think_llm"] = quick_model
+
+    overrides = {}
+    if debate_rounds is not None:
+        overrides["max_debate_rounds"] = debate_rounds
+    if risk_rounds is not None:
+        overrides["max_risk_discuss_rounds"] = risk_rounds
+    if branch_deep_model:
+        overrides["deep_think_llm"] = branch_deep_model
+    if branch_quick_model:
+        overrides["quick_think_llm"] = branch_quick_model
+
+    graph = TradingAgentsGraph(selected_analysts, config=config)
+    final_state, decision = graph.branch(ticker.upper(), analysis_date, stage, overrides)
+
+    console.print(
+        Panel(
+            Markdown(final_state["final_trade_decision"]),
+            title=f"Branch '{stage}' of {ticker.upper()} {analysis_date}: {decision}",
+            border_style="blue",
+        )
+    )
 
 
 if __name__ == "__main__":
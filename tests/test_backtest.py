@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.price_store import PriceStore
+from tradingagents.graph.backtest import Backtester, normalize_action, summarize_backtest
+
+CLOSES = [100.0, 110.0, 99.0, 99.0, 120.0]
+DATES = ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08"]
+
+
+class _Graph:
+    def __init__(self, decisions=None):
+        self.decisions = decisions or {}
+        self.events = []
+
+    def propagate(self, ticker, trade_date):
+        self.events.append(("propagate", ticker, trade_date))
+        return {"market_report": f"{ticker} {trade_date}"}, self.decisions.get(trade_date, "BUY")
+
+    def reflect_and_remember(self, returns, state=None):
+        self.events.append(("reflect", state["market_report"], returns))
+
+
+@pytest.fixture
+def price_store(tmp_path):
+    pd.DataFrame({"Date": DATES, "Close": CLOSES}).to_csv(
+        tmp_path / "AAPL-YFin-data-2024-01-01-2024-01-31.csv", index=False
+    )
+    return PriceStore([str(tmp_path)])
+
+
+def test_steps_are_scored_from_realized_returns(tmp_path, price_store):
+    graph = _Graph({"2024-01-03": "SELL", "2024-01-04": "HOLD"})
+    backtester = Backtester(graph, str(tmp_path / "checkpoint.json"), price_store, reflect=False)
+    records = backtester.run(["AAPL"], "2024-01-02", "2024-01-08")
+
+    assert [r["decision"] for r in records] == ["BUY", "SELL", "HOLD", "BUY", "BUY"]
+    assert records[0]["strategy_return"] == pytest.approx(0.1)
+    assert records[1]["strategy_return"] == pytest.approx(0.1)
+    assert records[2]["strategy_return"] == 0
+    # The last day has no exit price yet
+    assert records[-1]["market_return"] is None
+
+    summary = summarize_backtest(records)
+    assert summary["scored_steps"] == 4
+    assert summary["cumulative_return"] == pytest.approx(1.1 * 1.1 * (120 / 99) - 1)
+
+
+def test_resumed_run_skips_completed_steps(tmp_path, price_store):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    first = Backtester(_Graph(), checkpoint, price_store)
+    first.run(["AAPL"], "2024-01-02", "2024-01-04")
+
+    graph = _Graph()
+    records = Backtester(graph, checkpoint, price_store).run(["AAPL"], "2024-01-02", "2024-01-04")
+    assert len(records) == 3
+    assert not [event for event in graph.events if event[0] == "propagate"]
+
+    with pytest.raises(ValueError):
+        Backtester(graph, checkpoint, price_store, holding_days=2).run(
+            ["AAPL"], "2024-01-02", "2024-01-04"
+        )
+
+
+def test_reflections_wait_for_the_exit_date(tmp_path, price_store):
+    graph = _Graph()
+    backtester = Backtester(graph, str(tmp_path / "checkpoint.json"), price_store, holding_days=2)
+    backtester.run(["AAPL"], "2024-01-02", "2024-01-08")
+
+    # A step's lesson is applied only once the walk reaches its exit date,
+    # two trading days later, before that day's decision
+    assert graph.events[:5] == [
+        ("propagate", "AAPL", "2024-01-02"),
+        ("propagate", "AAPL", "2024-01-03"),
+        ("reflect", "AAPL 2024-01-02", pytest.approx(-0.01)),
+        ("propagate", "AAPL", "2024-01-04"),
+        ("reflect", "AAPL 2024-01-03", pytest.approx(-0.1)),
+    ]
+    assert len([event for event in graph.events if event[0] == "reflect"]) == 3
+
+
+def test_normalize_action():
+    assert normalize_action("Final call: SELL") == "SELL"
+    assert normalize_action("unclear") == "HOLD"
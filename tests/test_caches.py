@@ -0,0 +1,91 @@
+import time
+from datetime import date, timedelta
+
+from langchain_core.outputs import ChatGeneration
+from langchain_core.messages import AIMessage
+
+from tradingagents.graph.llm_cache import LLMResponseCache, consume_cache_hit, create_cache_scoped_node
+from tradingagents.graph.report_cache import ReportCache, create_cached_analyst
+
+
+def _generations(text):
+    return [ChatGeneration(message=AIMessage(content=text))]
+
+
+def test_llm_cache_round_trip(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.sqlite"))
+    assert cache.lookup("prompt", "model") is None
+    assert not consume_cache_hit()
+
+    cache.update("prompt", "model", _generations("answer"))
+    hit = cache.lookup("prompt", "model")
+    assert hit[0].message.content == "answer"
+    assert consume_cache_hit()
+    assert not consume_cache_hit()
+    assert cache.lookup("prompt", "other model") is None
+    assert cache.get_stats() == {"hits": 1, "misses": 2, "writes": 1, "hit_rate": 1 / 3}
+
+
+def test_llm_cache_entries_expire(tmp_path, monkeypatch):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.sqlite"), ttl_seconds=60)
+    cache.update("prompt", "model", _generations("answer"))
+    assert cache.lookup("prompt", "model") is not None
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.lookup("prompt", "model") is None
+
+
+def test_llm_cache_limited_to_nodes(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.sqlite"), nodes=["Trader"])
+
+    def node(state):
+        cache.update(state, "model", _generations(state))
+        return cache.lookup(state, "model")
+
+    assert create_cache_scoped_node(node, "Trader")("in trader") is not None
+    assert create_cache_scoped_node(node, "Bull Researcher")("in bull") is None
+    # Outside any node nothing is cached either
+    assert node("outside") is None
+
+
+def test_report_cache_keeps_past_reports_and_expires_live_ones(tmp_path, monkeypatch):
+    cache = ReportCache(str(tmp_path / "report_cache.sqlite"), ttl_seconds=60)
+    today = date.today().isoformat()
+    past = (date.today() - timedelta(days=30)).isoformat()
+    cache.put("past", past, "old report")
+    cache.put("live", today, "live report")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.get("past") == "old report"
+    assert cache.get("live") is None
+    assert cache.get("missing") is None
+
+
+def test_report_cache_key_covers_its_inputs():
+    base = ("AAPL", "2024-05-10", "market", "model", "english", "data")
+    key = ReportCache.make_key(*base)
+    assert ReportCache.make_key("aapl", *base[1:]) == key
+    for i in range(1, len(base)):
+        changed = list(base)
+        changed[i] = changed[i] + "x"
+        assert ReportCache.make_key(*changed) != key
+
+
+def test_cached_analyst_skips_the_node_on_a_hit(tmp_path):
+    cache = ReportCache(str(tmp_path / "report_cache.sqlite"))
+    calls = []
+
+    def analyst(state):
+        calls.append(state)
+        return {"messages": [AIMessage(content="report")], "market_report": "report"}
+
+    node = create_cached_analyst(analyst, "market", cache, "model", "english", "data")
+    state = {"company_of_interest": "AAPL", "trade_date": "2024-05-10"}
+    node(state)
+    result = node(state)
+
+    assert len(calls) == 1
+    assert result["market_report"] == "report"
+    assert not result["messages"][0].tool_calls
@@ -0,0 +1,39 @@
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from tradingagents.graph.concurrency import LLMConcurrencyLimiter
+
+
+def test_limiter_caps_in_flight_calls():
+    limiter = LLMConcurrencyLimiter(2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    limiter.on_llm_start({}, ["prompt"], run_id=first)
+    limiter.on_chat_model_start({}, [[]], run_id=second)
+    assert limiter.in_flight == 2
+
+    started = threading.Event()
+    waiter = threading.Thread(
+        target=lambda: (limiter.on_llm_start({}, ["prompt"], run_id=third), started.set())
+    )
+    waiter.start()
+    assert not started.wait(0.05)
+
+    limiter.on_llm_error(RuntimeError("boom"), run_id=first)
+    assert started.wait(1)
+    waiter.join()
+    assert limiter.in_flight == 2
+    assert limiter.queue_time(third) >= 0.04
+
+    # Ending a call twice must not free a second slot
+    limiter.on_llm_end(None, run_id=second)
+    limiter.on_llm_end(None, run_id=second)
+    limiter.on_llm_end(None, run_id=third)
+    assert limiter.in_flight == 0
+
+
+def test_limiter_rejects_zero_slots():
+    with pytest.raises(ValueError):
+        LLMConcurrencyLimiter(0)
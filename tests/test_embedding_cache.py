@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from tradingagents.agents.utils.embedding_cache import DiskEmbeddingCache, EmbeddingCache
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+
+
+def test_entries_are_float32_arrays():
+    cache = EmbeddingCache()
+    cache.put("model", "text", [0.5, 0.25, 1.0])
+
+    vector = cache.get("model", "text")
+    assert isinstance(vector, np.ndarray)
+    assert vector.dtype == np.float32
+    assert cache.size_bytes == vector.nbytes == 12
+    with pytest.raises(ValueError):
+        vector[0] = 0.0
+
+
+def test_lru_is_bounded_by_bytes():
+    # Room for two 16-dim float32 vectors
+    cache = EmbeddingCache(max_bytes=2 * 16 * 4)
+    for text in ("a", "b"):
+        cache.put("model", text, np.ones(16))
+    cache.get("model", "a")
+    cache.put("model", "c", np.ones(16))
+
+    assert cache.get("model", "b") is None
+    assert cache.get("model", "a") is not None
+    assert cache.get("model", "c") is not None
+    assert cache.size_bytes == 2 * 16 * 4
+
+
+def test_misses_are_filled_from_the_disk_cache(tmp_path):
+    disk = DiskEmbeddingCache(str(tmp_path / "embeddings.sqlite"))
+    EmbeddingCache(backing=disk).put("model", "text", [0.5, 0.25])
+
+    cache = EmbeddingCache(backing=disk)
+    np.testing.assert_array_equal(cache.get("model", "text"), [0.5, 0.25])
+    assert cache.misses == 1
+    cache.get("model", "text")
+    assert cache.hits == 1
+    assert disk.get_stats()["hits"] == 1
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_memories_share_one_embedding_per_text(backend, monkeypatch):
+    config = {
+        "embedding_provider": "local",
+        "local_embedding_dim": 64,
+        "memory_backend": backend,
+        "session_id": "test_embedding_cache",
+        "results_dir": "unused",
+    }
+    cache = EmbeddingCache()
+    memories = [
+        FinancialSituationMemory(f"memory_{i}_{backend}", config, cache) for i in range(3)
+    ]
+    calls = []
+    for memory in memories:
+        embed = memory.local_embedder.embed
+        monkeypatch.setattr(
+            memory.local_embedder, "embed", lambda texts, embed=embed: calls.append(texts) or embed(texts)
+        )
+        memory.add_situations([("Rates rising", "Trim duration")])
+
+    for memory in memories:
+        assert memory.get_memories("Rates rising", n_matches=1)[0]["recommendation"] == "Trim duration"
+    assert calls == [["Rates rising"]]
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    # Room for four 16-dim float32 vectors
+    disk = DiskEmbeddingCache(str(tmp_path / "embeddings.sqlite"), max_bytes=4 * 64)
+    for i in range(4):
+        disk.put("model", f"text{i}", np.full(16, i))
+    disk.get("model", "text0")
+    disk.put("model", "text4", np.full(16, 4))
+
+    # Eviction frees down to 90% of the budget, so the two oldest entries go
+    assert disk.get("model", "text1") is None
+    assert disk.get("model", "text2") is None
+    np.testing.assert_array_equal(disk.get("model", "text0"), np.zeros(16))
+    stats = disk.get_stats()
+    assert stats["evictions"] == 2
+    assert stats["size_bytes"] == 3 * 64
+
+
+def test_disk_cache_size_covers_other_writers(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    first = DiskEmbeddingCache(path, max_bytes=4 * 64)
+    second = DiskEmbeddingCache(path, max_bytes=4 * 64)
+    for i in range(3):
+        first.put("model", f"first{i}", np.ones(16))
+    for i in range(3):
+        second.put("model", f"second{i}", np.ones(16))
+
+    # Neither instance wrote past the budget alone, yet the file stays within it
+    assert first.size_bytes == second.size_bytes <= 4 * 64
+    assert first.get_stats()["evictions"] + second.get_stats()["evictions"] >= 2
+
+
+def test_disk_cache_float16_halves_the_size(tmp_path):
+    disk = DiskEmbeddingCache(str(tmp_path / "embeddings.sqlite"), dtype="float16")
+    disk.put("model", "text", [0.5, 0.25, 1.0, 2.0])
+
+    assert disk.size_bytes == 8
+    vector = disk.get("model", "text")
+    assert vector.dtype == np.float32
+    np.testing.assert_array_equal(vector, [0.5, 0.25, 1.0, 2.0])
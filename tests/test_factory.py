@@ -0,0 +1,81 @@
+import pytest
+
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.factory import GRAPH_CONFIG_KEYS, GraphFactory
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+ANALYSTS = ["market", "news"]
+
+
+class _RecordingConfig(dict):
+    """Config dict that records which keys are read."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read = set()
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+
+def _config(tmp_path, **overrides):
+    return {
+        **DEFAULT_CONFIG,
+        "api_key": "test-key",
+        "embedding_provider": "local",
+        "local_embedding_dim": 64,
+        "results_dir": str(tmp_path),
+        **overrides,
+    }
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {
+            "memory_backend": "numpy",
+            "memory_mode": "persistent",
+            "llm_cache": True,
+            "llm_cache_nodes": ["Trader"],
+            "report_cache": True,
+            "embedding_cache_persist": True,
+            "report_digest": True,
+        },
+    ],
+)
+def test_pool_key_covers_every_key_read_while_building(tmp_path, overrides):
+    config = _RecordingConfig(_config(tmp_path, **overrides))
+    TradingAgentsGraph(ANALYSTS, config=config)
+
+    # session_id is set by the factory itself for each pooled graph
+    assert config.read - {"session_id"} <= set(GRAPH_CONFIG_KEYS)
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [("memory_backend", "numpy"), ("embedding_cache_persist", True), ("checkpointing", True)],
+)
+def test_build_settings_change_the_pool_key(tmp_path, key, value):
+    config = _config(tmp_path)
+    assert GraphFactory.make_key(ANALYSTS, config) != GraphFactory.make_key(
+        ANALYSTS, {**config, key: value}
+    )
+
+
+def test_sessions_share_a_pooled_graph(tmp_path):
+    factory = GraphFactory(max_graphs=1)
+    config = _config(tmp_path)
+    first = factory.create_session(ANALYSTS, config, "a")
+    second = factory.create_session(ANALYSTS, {**config, "session_id": "other"}, "b")
+    assert first.graph is second.graph
+
+    # Pooled graphs beyond max_graphs are evicted least recently used first
+    third = factory.create_session(ANALYSTS, {**config, "memory_backend": "numpy"}, "c")
+    assert third.graph is not first.graph
+    assert len(factory) == 1
@@ -0,0 +1,107 @@
+import pytest
+
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+
+SITUATION = (
+    "Tech sector showing high volatility with increasing institutional selling "
+    "pressure and rising treasury yields"
+)
+
+
+def _memory(backend, **overrides):
+    config = {
+        "embedding_provider": "local",
+        "local_embedding_dim": 256,
+        "memory_backend": backend,
+        "session_id": f"test_{backend}_{len(overrides)}",
+        "results_dir": "unused",
+        **overrides,
+    }
+    return FinancialSituationMemory(f"test_memory_{backend}", config)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_near_duplicate_is_merged(backend):
+    memory = _memory(backend, memory_dedup_threshold=0.9)
+    memory.add_situations([(SITUATION, "Reduce exposure")], returns=[0.02])
+    memory.add_situations([(SITUATION + " today", "Trim exposure further")], returns=[-0.04])
+
+    assert memory.get_stats()["merges"] == 1
+    assert memory.get_stats()["size"] == 1
+    match = memory.get_memories(SITUATION + " today", n_matches=1)[0]
+    assert match["recommendation"] == "Trim exposure further"
+    # The entry now holds the new lesson's embedding, not a re-embedded one
+    assert match["similarity_score"] == pytest.approx(1.0, abs=1e-3)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_distinct_situations_are_kept(backend):
+    memory = _memory(backend, memory_dedup_threshold=0.9)
+    memory.add_situations(
+        [
+            (SITUATION, "Reduce exposure"),
+            ("Strong dollar weighing on emerging market currencies", "Hedge currency risk"),
+        ]
+    )
+
+    assert memory.get_stats() == {"evictions": 0, "merges": 0, "size": 2}
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_merged_return_averages_only_known_returns(backend):
+    memory = _memory(backend, memory_dedup_threshold=0.9)
+    memory.add_situations([(SITUATION, "Reduce exposure")], returns=[0.02])
+    memory.add_situations([(SITUATION + " today", "Trim exposure")])
+    memory.add_situations([(SITUATION + " again", "Trim exposure further")], returns=[-0.04])
+
+    (entry,) = memory.situation_store.entries()
+    assert memory.get_stats()["merges"] == 2
+    assert entry["return"] == pytest.approx(-0.01)
+
+
+LESSONS = [
+    ("Tech sector selling off on rising treasury yields", "Reduce exposure"),
+    ("Strong dollar weighing on emerging market currencies", "Hedge currency risk"),
+    ("Oil prices spiking after supply cuts", "Add energy exposure"),
+    ("Retail earnings beating estimates across the board", "Buy consumer names"),
+]
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+@pytest.mark.parametrize(
+    "policy, kept",
+    [
+        ("oldest", {"Add energy exposure", "Buy consumer names"}),
+        # Largest moves are kept whatever their sign
+        ("smallest_move", {"Reduce exposure", "Buy consumer names"}),
+    ],
+)
+def test_eviction_policy(backend, policy, kept):
+    memory = _memory(backend, memory_capacity=2, memory_eviction=policy)
+    memory.add_situations(LESSONS, returns=[-0.08, 0.01, -0.005, 0.05])
+
+    assert memory.get_stats() == {"evictions": 2, "merges": 0, "size": 2}
+    stored = {
+        match["recommendation"]
+        for situation, _ in LESSONS
+        for match in memory.get_memories(situation, n_matches=2)
+    }
+    assert stored == kept
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_least_retrieved_eviction_keeps_recalled_lessons(backend):
+    memory = _memory(backend, memory_capacity=2, memory_eviction="least_retrieved")
+    memory.add_situations(LESSONS[:2])
+    memory.get_memories(LESSONS[0][0], n_matches=1)
+    memory.add_situations(LESSONS[2:3])
+
+    stored = {entry["id"] for entry in memory.situation_store.entries()}
+    assert len(stored) == 2
+    assert memory.get_memories(LESSONS[0][0], n_matches=1)[0]["recommendation"] == "Reduce exposure"
+    assert memory.get_memories(LESSONS[1][0], n_matches=2)[0]["recommendation"] != "Hedge currency risk"
+
+
+def test_unknown_eviction_policy_is_rejected():
+    with pytest.raises(ValueError):
+        _memory("numpy", memory_eviction="lowest_return")
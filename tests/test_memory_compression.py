@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from tradingagents.agents.utils.memory_store import NumpyMemoryStore, measure_recall
+
+
+def _corpus(size=600, dim=256, rank=16, clusters=20, seed=0):
+    """Clustered vectors on a low-rank subspace plus noise, like sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    basis = rng.standard_normal((rank, dim)).astype(np.float32)
+    centers = rng.standard_normal((clusters, rank)).astype(np.float32) * 3
+    latent = centers[rng.integers(0, clusters, size)] + rng.standard_normal((size, rank))
+    noise = rng.standard_normal((size, dim)).astype(np.float32) * 0.5
+    data = latent.astype(np.float32) @ basis + noise
+    return data[100:].tolist(), data[:100].tolist()
+
+
+@pytest.mark.parametrize(
+    "dtype, pca_dims, threshold",
+    [
+        ("float32", 0, 1.0),
+        ("float16", 0, 0.99),
+        ("int8", 0, 0.95),
+        ("float32", 32, 0.95),
+        ("float16", 32, 0.95),
+        ("int8", 32, 0.9),
+    ],
+)
+def test_recall_at_k(dtype, pca_dims, threshold):
+    corpus, queries = _corpus()
+    assert measure_recall(corpus, queries, k=5, dtype=dtype, pca_dims=pca_dims) >= threshold
+
+
+@pytest.mark.parametrize("dtype, itemsize", [("float32", 4), ("float16", 2), ("int8", 1)])
+def test_compact_storage_size(dtype, itemsize):
+    corpus, _ = _corpus()
+    store = NumpyMemoryStore("memory", {"memory_dtype": dtype, "memory_pca_dims": 32})
+    store.add([str(i) for i in range(len(corpus))], [""] * len(corpus), corpus)
+
+    # 32 components plus a float32 scale per row
+    assert store.nbytes == len(corpus) * (32 * itemsize + 4)
+
+
+def test_pca_store_reloads(tmp_path):
+    corpus, queries = _corpus()
+    config = {"results_dir": str(tmp_path), "memory_pca_dims": 32}
+    store = NumpyMemoryStore("memory", config, persistent=True)
+    documents = [str(i) for i in range(len(corpus))]
+    store.add(documents, documents, corpus)
+    store.add(["extra"], ["extra"], [queries[0]])
+
+    reloaded = NumpyMemoryStore("memory", config, persistent=True)
+    assert reloaded.query_batch(queries, 5) == store.query_batch(queries, 5)
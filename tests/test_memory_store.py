@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from tradingagents.agents.utils.memory_store import NumpyMemoryStore, open_shared_store
+
+
+def _vectors(n, dim=16, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+
+def _config(tmp_path, **overrides):
+    return {"results_dir": str(tmp_path), **overrides}
+
+
+def test_add_and_query_returns_nearest():
+    store = NumpyMemoryStore("memory", {})
+    vectors = _vectors(10)
+    store.add([f"s{i}" for i in range(10)], [f"r{i}" for i in range(10)], vectors.tolist())
+
+    assert store.count() == 10
+    match = store.query(vectors[3].tolist(), 1)[0]
+    assert match["matched_situation"] == "s3"
+    assert match["recommendation"] == "r3"
+    assert match["similarity_score"] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_grows_past_initial_capacity():
+    store = NumpyMemoryStore("memory", {})
+    vectors = _vectors(200)
+    for i, vector in enumerate(vectors):
+        store.add([f"s{i}"], [f"r{i}"], [vector.tolist()])
+
+    assert store.count() == 200
+    assert store.query(vectors[150].tolist(), 1)[0]["matched_situation"] == "s150"
+
+
+def test_persistent_store_reloads_from_log(tmp_path):
+    vectors = _vectors(5)
+    store = NumpyMemoryStore("memory", _config(tmp_path), persistent=True)
+    ids = store.add([f"s{i}" for i in range(5)], [f"r{i}" for i in range(5)], vectors.tolist())
+    store.merge(ids[1], "s1 merged", "r1 merged", vectors[1].tolist(), 0.1)
+    store.delete([ids[4]])
+
+    reloaded = NumpyMemoryStore("memory", _config(tmp_path), persistent=True)
+    assert reloaded.count() == 4
+    assert reloaded.query(vectors[1].tolist(), 1)[0]["matched_situation"] == "s1 merged"
+    assert [entry["id"] for entry in reloaded.entries()] == ids[:4]
+    # New entries continue the sequence instead of reusing deleted ids
+    assert reloaded.add(["s5"], ["r5"], [vectors[4].tolist()]) == ["5"]
+
+
+def test_persistent_store_reloads_after_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(NumpyMemoryStore, "COMPACT_EVERY", 3)
+    vectors = _vectors(7)
+    store = NumpyMemoryStore("memory", _config(tmp_path), persistent=True)
+    for i, vector in enumerate(vectors):
+        store.add([f"s{i}"], [f"r{i}"], [vector.tolist()])
+
+    assert (tmp_path / "memory" / "memory.npz").exists()
+    reloaded = NumpyMemoryStore("memory", _config(tmp_path), persistent=True)
+    assert reloaded.count() == 7
+    for i, vector in enumerate(vectors):
+        assert reloaded.query(vector.tolist(), 1)[0]["matched_situation"] == f"s{i}"
+
+
+def test_torn_log_line_is_ignored(tmp_path):
+    vectors = _vectors(2)
+    store = NumpyMemoryStore("memory", _config(tmp_path), persistent=True)
+    store.add(["s0", "s1"], ["r0", "r1"], vectors.tolist())
+    with open(store._log_path(store._generation), "a") as f:
+        f.write('{"op": "add", "documents": ["tor')
+
+    reloaded = NumpyMemoryStore("memory", _config(tmp_path), persistent=True)
+    assert reloaded.count() == 2
+
+    # The next write compacts the torn log away instead of appending after it
+    more = _vectors(1, seed=1)
+    reloaded.add(["s2"], ["r2"], more.tolist())
+    again = NumpyMemoryStore("memory", _config(tmp_path), persistent=True)
+    assert again.count() == 3
+    assert again.query(more[0].tolist(), 1)[0]["matched_situation"] == "s2"
+
+
+def test_opening_a_shared_base_does_not_write(tmp_path):
+    config = {**_config(tmp_path), "memory_backend": "numpy"}
+    store = NumpyMemoryStore("base", config, persistent=True)
+    store.add(["s0", "s1"], ["r0", "r1"], _vectors(2).tolist())
+    with open(store._log_path(store._generation), "a") as f:
+        f.write('{"op": "add", "documents": ["tor')
+    files = {path.name: path.stat().st_mtime_ns for path in tmp_path.rglob("*")}
+
+    shared = open_shared_store("base", config)
+    assert shared.count() == 2
+    assert {path.name: path.stat().st_mtime_ns for path in tmp_path.rglob("*")} == files
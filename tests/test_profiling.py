@@ -0,0 +1,63 @@
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from tradingagents.graph.profiling import MetricsRegistry, RunProfiler
+
+
+def _response(text, input_tokens=12, output_tokens=3):
+    message = AIMessage(
+        content=text,
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        },
+    )
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+def test_profiler_attributes_calls_to_nodes_and_tools():
+    profiler = RunProfiler()
+    node_run, llm_run, tool_run, failed_tool = uuid4(), uuid4(), uuid4(), uuid4()
+    metadata = {"langgraph_node": "Trader"}
+
+    profiler.on_chain_start({}, {"x": 1}, run_id=node_run, metadata=metadata, name="Trader")
+    # Runnables nested in the node are not counted as node runs
+    profiler.on_chain_start({}, {}, run_id=uuid4(), metadata=metadata, name="RunnableSequence")
+    profiler.on_chat_model_start({}, [[AIMessage(content="prompt")]], run_id=llm_run, metadata=metadata)
+    profiler.on_llm_end(_response("answer"), run_id=llm_run)
+    profiler.on_tool_start({"name": "get_YFin_data"}, "AAPL", run_id=tool_run)
+    profiler.on_tool_end("rows", run_id=tool_run)
+    profiler.on_tool_start({"name": "get_YFin_data"}, "AAPL", run_id=failed_tool)
+    profiler.on_tool_error(RuntimeError("offline"), run_id=failed_tool)
+    profiler.on_chain_end({"y": 2}, run_id=node_run)
+
+    profile = profiler.profile("AAPL", "2024-05-10")
+    trader = profile["nodes"]["Trader"]
+    assert trader["calls"] == 1
+    assert trader["llm_calls"] == 1
+    assert trader["prompt_tokens"] == 12 and trader["completion_tokens"] == 3
+    assert profile["totals"]["llm_calls"] == 1
+    assert profile["tools"]["get_YFin_data"]["calls"] == 1
+    assert profile["tools"]["get_YFin_data"]["errors"] == 1
+    assert profile["trade_date"] == "2024-05-10"
+
+
+def test_metrics_registry_renders_prometheus_counters():
+    profiler = RunProfiler()
+    llm_run = uuid4()
+    profiler.on_chat_model_start(
+        {}, [[AIMessage(content="prompt")]], run_id=llm_run, metadata={"langgraph_node": 'Risk "Judge"'}
+    )
+    profiler.on_llm_end(_response("answer"), run_id=llm_run)
+
+    registry = MetricsRegistry()
+    registry.record(profiler.profile())
+    registry.record(profiler.profile())
+    text = registry.render()
+
+    assert "# TYPE tradingagents_runs_total counter" in text
+    assert "tradingagents_runs_total 2" in text
+    assert 'tradingagents_llm_calls_total{node="Risk \\"Judge\\""} 2' in text
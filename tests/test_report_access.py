@@ -0,0 +1,108 @@
+from langchain_core.messages import AIMessage, ToolMessage
+
+from tradingagents.agents.researchers.bull_researcher import create_bull_researcher
+from tradingagents.agents.utils.agent_utils import (
+    format_report_context,
+    get_full_report,
+    invoke_with_report_access,
+)
+
+STATE = {
+    "market_report": "RSI at 71 after a breakout above 190.",
+    "sentiment_report": "Upbeat retail chatter.",
+    "news_report": "Antitrust ruling expected Friday.",
+    "fundamentals_report": "",
+    "situation_digest": "- Price & Technicals: overbought\n- News & Macro: ruling pending",
+}
+
+
+class _ToolCallingLLM:
+    """Requests the scripted sections in turn, then answers."""
+
+    def __init__(self, sections):
+        self.sections = list(sections)
+        self.calls = []
+        self.bound = None
+
+    def bind_tools(self, tools):
+        self.bound = [tool.name for tool in tools]
+        return self
+
+    def invoke(self, messages):
+        self.calls.append(messages)
+        if self.sections and not isinstance(messages, str):
+            section = self.sections.pop(0)
+            return AIMessage(
+                content="",
+                tool_calls=[{"name": "get_full_report", "args": {"section": section}, "id": f"call_{len(self.calls)}"}],
+            )
+        return AIMessage(content="Buy on the breakout.")
+
+
+def test_tool_reads_reports_from_state():
+    assert get_full_report.invoke({"section": "news", "state": STATE}) == STATE["news_report"]
+    assert "No fundamentals report" in get_full_report.invoke({"section": "fundamentals", "state": STATE})
+    # The state is injected, so the model only sees the section argument
+    assert list(get_full_report.tool_call_schema.model_json_schema()["properties"]) == ["section"]
+
+
+def test_digest_prompt_points_at_the_tool():
+    context = format_report_context(STATE, ("Market", "Sentiment", "News", "Fundamentals"))
+    assert "get_full_report" in context
+    assert STATE["market_report"] not in context
+
+
+def test_without_digest_the_prompt_is_sent_as_is():
+    llm = _ToolCallingLLM(["news"])
+    response = invoke_with_report_access(llm, "prompt", {**STATE, "situation_digest": ""})
+
+    assert response.content == "Buy on the breakout."
+    assert llm.bound is None
+    assert llm.calls == ["prompt"]
+
+
+def test_requested_report_is_answered_from_state():
+    llm = _ToolCallingLLM(["news"])
+    response = invoke_with_report_access(llm, "prompt", STATE)
+
+    assert response.content == "Buy on the breakout."
+    assert llm.bound == ["get_full_report"]
+    tool_message = llm.calls[-1][-1]
+    assert isinstance(tool_message, ToolMessage)
+    assert tool_message.content == STATE["news_report"]
+
+
+def test_invalid_section_is_reported_to_the_model():
+    llm = _ToolCallingLLM(["earnings"])
+    invoke_with_report_access(llm, "prompt", STATE)
+
+    assert llm.calls[-1][-1].content.startswith("Error:")
+
+
+def test_lookups_are_capped():
+    llm = _ToolCallingLLM(["market", "news", "sentiment"])
+    response = invoke_with_report_access(llm, "prompt", STATE, max_lookups=2)
+
+    assert response.content == "Buy on the breakout."
+    # The final answer is requested without tools, with the reports read inline
+    final_prompt = llm.calls[-1]
+    assert isinstance(final_prompt, str)
+    assert STATE["market_report"] in final_prompt and STATE["news_report"] in final_prompt
+    assert STATE["sentiment_report"] not in final_prompt
+
+
+class _Memory:
+    def get_memories(self, situation, n_matches=1):
+        return []
+
+
+def test_bull_researcher_can_read_a_full_report():
+    llm = _ToolCallingLLM(["market"])
+    state = {
+        **STATE,
+        "investment_debate_state": {"history": "", "bull_history": "", "bear_history": "", "current_response": "", "count": 0},
+    }
+    result = create_bull_researcher(llm, _Memory())(state)
+
+    assert result["investment_debate_state"]["current_response"] == "Bull Analyst: Buy on the breakout."
+    assert llm.calls[-1][-1].content == STATE["market_report"]
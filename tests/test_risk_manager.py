@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+from tradingagents.agents.managers.risk_manager import create_risk_manager
+
+
+class _Memory:
+    def get_memories(self, situation, n_matches=1):
+        return [{"recommendation": "Past lesson"}]
+
+
+class _LLM:
+    def __init__(self, structured=None, prose="Hold the position.\n\nFINAL TRANSACTION PROPOSAL: **HOLD**"):
+        self.structured = structured
+        self.prose = prose
+        self.prompts = []
+
+    def with_structured_output(self, schema):
+        llm = self
+
+        class _Structured:
+            def invoke(self, prompt):
+                if isinstance(llm.structured, Exception):
+                    raise llm.structured
+                return llm.structured
+
+        return _Structured()
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return SimpleNamespace(content=self.prose)
+
+
+def _state():
+    return {
+        "company_of_interest": "AAPL",
+        "market_report": "market",
+        "news_report": "news",
+        "sentiment_report": "sentiment",
+        "investment_plan": "plan",
+        "risk_debate_state": {
+            "history": "Risky: buy. Safe: sell.",
+            "risky_history": "Risky: buy.",
+            "safe_history": "Safe: sell.",
+            "neutral_history": "",
+            "latest_speaker": "Safe",
+            "current_risky_response": "Risky: buy.",
+            "current_safe_response": "Safe: sell.",
+            "current_neutral_response": "",
+            "count": 2,
+        },
+    }
+
+
+def test_structured_decision_is_used():
+    llm = _LLM(structured={"action": "buy", "rationale": "Momentum is strong."})
+    result = create_risk_manager(llm, _Memory(), structured_output=True)(_state())
+
+    assert result["trade_decision"]["action"] == "BUY"
+    assert result["final_trade_decision"].endswith("FINAL TRANSACTION PROPOSAL: **BUY**")
+    assert llm.prompts == []
+
+
+def test_failed_structured_decision_falls_back_to_prose(capsys):
+    llm = _LLM(structured=NotImplementedError("no structured output"))
+    result = create_risk_manager(llm, _Memory(), structured_output=True)(_state())
+
+    assert "trade_decision" not in result
+    assert result["final_trade_decision"] == llm.prose
+    assert result["risk_debate_state"]["latest_speaker"] == "Judge"
+    assert capsys.readouterr().out == ""
+
+
+def test_invalid_structured_action_falls_back_to_prose():
+    llm = _LLM(structured={"action": "maybe", "rationale": "Unclear."})
+    result = create_risk_manager(llm, _Memory(), structured_output=True)(_state())
+
+    assert "trade_decision" not in result
+    assert len(llm.prompts) == 1
@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import config as dataflow_config
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.price_store import PriceStore
+from tradingagents.dataflows.shared_store import MemmapPriceStore, read_price_csv
+
+PRICE_FILE = "AAPL-YFin-data-2015-01-01-2025-03-25.csv"
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    price_dir = tmp_path / "market_data" / "price_data"
+    price_dir.mkdir(parents=True)
+    dates = pd.bdate_range("2024-01-02", periods=60)
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(size=len(dates)))
+    pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": np.arange(len(dates)) * 1000,
+        }
+    ).to_csv(price_dir / PRICE_FILE, index=False)
+    return tmp_path
+
+
+@pytest.fixture
+def store(data_dir, tmp_path):
+    source = PriceStore([str(data_dir / "market_data" / "price_data")])
+    return MemmapPriceStore.build(str(tmp_path / "store"), ["aapl"], source)
+
+
+def test_lookups_match_price_store(data_dir, store):
+    source = PriceStore([str(data_dir / "market_data" / "price_data")])
+
+    assert store.trading_days("AAPL", "2024-01-10", "2024-02-10") == source.trading_days(
+        "AAPL", "2024-01-10", "2024-02-10"
+    )
+    for trade_date in ("2024-01-02", "2024-02-15", "2024-03-20", "2024-03-25"):
+        assert store.realized_return("AAPL", trade_date, 3) == source.realized_return(
+            "AAPL", trade_date, 3
+        )
+        assert store.exit_date("AAPL", trade_date, 3) == source.exit_date("AAPL", trade_date, 3)
+
+
+def test_frame_matches_csv(data_dir, store):
+    path = str(data_dir / "market_data" / "price_data" / PRICE_FILE)
+
+    pd.testing.assert_frame_equal(store.frame(path), pd.read_csv(path))
+    assert store.frame(str(data_dir / "other.csv")) is None
+
+
+def test_price_tools_read_from_the_store(data_dir, store, monkeypatch):
+    monkeypatch.setattr(interface, "DATA_DIR", str(data_dir))
+    expected = interface.get_YFin_data_window("AAPL", "2024-03-01", 10)
+    expected_rsi = interface.get_stockstats_indicator("AAPL", "rsi", "2024-03-01", False)
+
+    monkeypatch.setattr(
+        dataflow_config,
+        "_config",
+        {**dataflow_config.get_config(), "shared_price_store_dir": store.store_dir},
+    )
+    # The CSV is gone, so the tools can only be served by the store
+    os.remove(data_dir / "market_data" / "price_data" / PRICE_FILE)
+    assert interface.get_YFin_data_window("AAPL", "2024-03-01", 10) == expected
+    assert interface.get_stockstats_indicator("AAPL", "rsi", "2024-03-01", False) == expected_rsi
+
+
+def test_read_price_csv_without_store(data_dir):
+    path = str(data_dir / "market_data" / "price_data" / PRICE_FILE)
+    pd.testing.assert_frame_equal(read_price_csv(path), pd.read_csv(path))
@@ -0,0 +1,75 @@
+import pytest
+
+from tradingagents.graph.signal_processing import SignalProcessor, parse_decision
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Momentum is strong.\n\nFINAL TRANSACTION PROPOSAL: **BUY**", "BUY"),
+        ("Recommendation: Sell", "SELL"),
+        ("Final decision: **hold**", "HOLD"),
+        ("คำแนะนำ: **ซื้อ**", "BUY"),
+        ("ข้อเสนอการทำธุรกรรมขั้นสุดท้าย: **ขาย**", "SELL"),
+        ("คำแนะนำ: ถือครอง", "HOLD"),
+        # Bolded action words that agree
+        ("We stay with **SELL** and repeat **Sell**.", "SELL"),
+        # The closing proposal wins over a later, looser label
+        (
+            "FINAL TRANSACTION PROPOSAL: **BUY**\n\n"
+            "Risks to this decision: sell-offs are likely after earnings.",
+            "BUY",
+        ),
+        (
+            "FINAL TRANSACTION PROPOSAL: **BUY**\n\nOur earlier decision: SELL was revised.",
+            "BUY",
+        ),
+        # The last proposal wins when an answer revises itself
+        ("FINAL TRANSACTION PROPOSAL: HOLD ... FINAL TRANSACTION PROPOSAL: **SELL**", "SELL"),
+    ],
+)
+def test_parse_decision(text, expected):
+    assert parse_decision(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Labels must be whole words
+        "The indecision: sell-side analysts disagree.",
+        "indecision: sell",
+        # Hyphenated compounds are not decisions
+        "Decision: sell-offs dominate the tape.",
+        "Recommendation: buy-side demand is thin.",
+        # "ถือว่า" means "considered", not hold
+        "คำแนะนำ: ถือว่าเป็นโอกาสที่ดีในการซื้อ",
+        # Conflicting bolded words
+        "Bulls say **BUY**, bears say **SELL**.",
+        # Options rather than a decision
+        "Decision: BUY / SELL depending on earnings.",
+        "No clear view yet.",
+    ],
+)
+def test_parse_decision_ambiguous(text):
+    assert parse_decision(text) is None
+
+
+class _ScriptedLLM:
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return type("Message", (), {"content": self.answer})()
+
+
+def test_process_signal_falls_back_to_llm_only_when_ambiguous():
+    llm = _ScriptedLLM("SELL")
+    processor = SignalProcessor(llm)
+
+    assert processor.process_signal("FINAL TRANSACTION PROPOSAL: **BUY**") == "BUY"
+    assert llm.calls == 0
+    assert processor.process_signal("คำแนะนำ: ถือว่าเป็นโอกาสที่ดีในการซื้อ") == "SELL"
+    assert llm.calls == 1
+    assert processor.get_stats() == {"parsed": 1, "llm_fallback": 1, "fallback_rate": 0.5}
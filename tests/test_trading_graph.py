@@ -0,0 +1,161 @@
+import threading
+import time
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+
+class _CallTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+
+_tracker = _CallTracker()
+
+
+class _ScriptedModel(BaseChatModel):
+    """Answers every prompt with a short report ending in a proposal, never calling tools."""
+
+    decision: str = "BUY"
+    delay: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        with _tracker.lock:
+            _tracker.calls += 1
+            _tracker.active += 1
+            _tracker.max_active = max(_tracker.max_active, _tracker.active)
+        time.sleep(self.delay)
+        with _tracker.lock:
+            _tracker.active -= 1
+        message = AIMessage(
+            content=f"Analysis complete.\n\nFINAL TRANSACTION PROPOSAL: **{self.decision}**",
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class _ScriptedGraph(TradingAgentsGraph):
+    def __init__(self, llm, **kwargs):
+        self.scripted_llm = llm
+        super().__init__(**kwargs)
+
+    def _create_llms(self, config):
+        # Attach the response cache the way the provider clients get it
+        llm = self.scripted_llm
+        if self.llm_cache is not None:
+            llm = llm.model_copy(update={"cache": self.llm_cache})
+        return llm, llm
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    # State logs and run profiles are written under the working directory
+    monkeypatch.chdir(tmp_path)
+    global _tracker
+    _tracker = _CallTracker()
+
+
+def _graph(tmp_path, llm=None, **overrides):
+    config = {
+        **DEFAULT_CONFIG,
+        "results_dir": str(tmp_path / "results"),
+        "embedding_provider": "local",
+        "local_embedding_dim": 64,
+        "memory_backend": "numpy",
+        "online_tools": False,
+        **overrides,
+    }
+    return _ScriptedGraph(llm or _ScriptedModel(), selected_analysts=["market"], config=config)
+
+
+def test_propagate_profiles_every_llm_call(tmp_path):
+    graph = _graph(tmp_path)
+    _, decision, profile = graph.propagate("AAPL", "2024-05-10", return_profile=True)
+
+    assert decision == "BUY"
+    assert profile["totals"]["llm_calls"] == _tracker.calls
+    assert profile["nodes"]["Risk Judge"]["llm_calls"] == 1
+    assert profile["totals"]["prompt_tokens"] == 10 * _tracker.calls
+    assert (tmp_path / "eval_results/AAPL/TradingAgentsStrategy_logs/run_profile_2024-05-10.json").exists()
+
+
+def test_completed_checkpointed_run_is_not_repeated(tmp_path):
+    graph = _graph(tmp_path, checkpointing=True)
+    first_state, first_decision = graph.propagate("AAPL", "2024-05-10")
+    calls = _tracker.calls
+
+    resumed = _graph(tmp_path, checkpointing=True)
+    state, decision = resumed.propagate("AAPL", "2024-05-10")
+
+    assert _tracker.calls == calls
+    assert decision == first_decision
+    assert state["final_trade_decision"] == first_state["final_trade_decision"]
+
+
+def test_branch_reruns_only_the_forked_stages(tmp_path):
+    graph = _graph(tmp_path, checkpointing=True)
+    source, _ = graph.propagate("AAPL", "2024-05-10")
+    calls = _tracker.calls
+
+    graph.scripted_llm = _ScriptedModel(decision="SELL")
+    state, decision = graph.branch("AAPL", "2024-05-10", "risk_debate")
+
+    assert decision == "SELL"
+    # The analyst reports and the trader's plan come from the source run
+    assert state["market_report"] == source["market_report"]
+    assert state["trader_investment_plan"] == source["trader_investment_plan"]
+    # One round of the three risk debaters, then the judge
+    branch_calls = _tracker.calls - calls
+    assert branch_calls == 4
+
+    # Repeating the same what-if returns the stored branch
+    graph.branch("AAPL", "2024-05-10", "risk_debate")
+    assert _tracker.calls - calls == branch_calls
+
+
+def test_branch_requires_checkpointing(tmp_path):
+    graph = _graph(tmp_path)
+    with pytest.raises(ValueError):
+        graph.branch("AAPL", "2024-05-10", "trader")
+    with pytest.raises(ValueError):
+        _graph(tmp_path, checkpointing=True).branch("AAPL", "2024-05-10", "unknown")
+
+
+def test_propagate_many_caps_llm_concurrency(tmp_path):
+    graph = _graph(tmp_path, llm=_ScriptedModel(delay=0.01))
+    items = [("AAPL", "2024-05-10"), ("MSFT", "2024-05-10"), ("NVDA", "2024-05-10")]
+    results = list(graph.propagate_many(items, max_concurrency=3, max_llm_concurrency=1))
+
+    assert sorted(result["ticker"] for result in results) == ["AAPL", "MSFT", "NVDA"]
+    assert all(result["error"] is None and result["decision"] == "BUY" for result in results)
+    assert _tracker.max_active == 1
+    # With one slot shared by three jobs, calls queue behind each other
+    assert sum(result["profile"]["totals"]["llm_queue_seconds"] for result in results) > 0
+
+
+def test_llm_cache_serves_repeated_runs(tmp_path):
+    graph = _graph(tmp_path, llm_cache=True)
+    graph.propagate("AAPL", "2024-05-10")
+    calls = _tracker.calls
+
+    _, _, profile = _graph(tmp_path, llm_cache=True).propagate(
+        "AAPL", "2024-05-10", return_profile=True
+    )
+
+    assert _tracker.calls == calls
+    assert profile["totals"]["llm_cache_hits"] == profile["totals"]["llm_calls"] > 0
@@ -1,11 +1,17 @@
 from .utils.agent_utils import Toolkit, create_msg_delete
-from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
+from .utils.agent_states import (
+    AgentState,
+    InvestDebateState,
+    RiskDebateState,
+    TradeDecision,
+)
 from .utils.memory import FinancialSituationMemory
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
 from .analysts.news_analyst import create_news_analyst
 from .analysts.social_media_analyst import create_social_media_analyst
+from .analysts.report_digest import create_report_digester
 
 from .researchers.bear_researcher import create_bear_researcher
 from .researchers.bull_researcher import create_bull_researcher
@@ -26,9 +32,11 @@ __all__ = [
     "create_msg_delete",
     "InvestDebateState",
     "RiskDebateState",
+    "TradeDecision",
     "create_bear_researcher",
     "create_bull_researcher",
     "create_research_manager",
+    "create_report_digester",
     "create_fundamentals_analyst",
     "create_market_analyst",
     "create_neutral_debator",
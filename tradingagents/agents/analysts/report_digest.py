@@ -0,0 +1,38 @@
+def create_report_digester(llm, language_prompt=""):
+    def report_digest_node(state) -> dict:
+        ticker = state["company_of_interest"]
+        current_date = state["trade_date"]
+
+        reports = "\n\n".join(
+            f"## {title}\n{report}"
+            for title, report in (
+                ("Market / Technical Report", state["market_report"]),
+                ("Social Media Sentiment Report", state["sentiment_report"]),
+                ("News Report", state["news_report"]),
+                ("Fundamentals Report", state["fundamentals_report"]),
+            )
+            if report
+        )
+
+        prompt = f"""{language_prompt}
+
+You are preparing a briefing for a team of researchers, traders and risk managers who will debate whether to trade {ticker} as of {current_date}. Condense the analyst reports below into a compact, structured situation digest that they will use instead of the full reports.
+
+Use exactly these sections, as short bullet points:
+- Price & Technicals: trend, key levels, momentum and volatility readings with their numbers
+- Sentiment: overall tone and notable shifts
+- News & Macro: the events that matter for this asset
+- Fundamentals: the key metrics and their direction
+- Bullish Factors: the strongest arguments for buying
+- Bearish Factors: the strongest arguments for selling
+- Key Uncertainties: what could change the picture
+
+Keep every figure that a decision could hinge on, do not add information that is not in the reports, and stay under 400 words.
+
+{reports}"""
+
+        response = llm.invoke(prompt)
+
+        return {"situation_digest": response.content}
+
+    return report_digest_node
@@ -1,8 +1,10 @@
 import time
 import json
 
+from tradingagents.agents.utils.debate_history import carry_turns, render_debate_history
 
-def create_research_manager(llm, memory, language_prompt=""):
+
+def create_research_manager(llm, memory, language_prompt="", history_window=0):
     def research_manager_node(state) -> dict:
         history = state["investment_debate_state"].get("history", "")
         market_research_report = state["market_report"]
@@ -11,6 +13,7 @@ def create_research_manager(llm, memory, language_prompt=""):
         fundamentals_report = state["fundamentals_report"]
 
         investment_debate_state = state["investment_debate_state"]
+        debate_history = render_debate_history(investment_debate_state, history_window)
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
@@ -37,7 +40,7 @@ Here are your past reflections on mistakes:
 
 Here is the debate:
 Debate History:
-{history}"""
+{debate_history}"""
         response = llm.invoke(prompt)
 
         new_investment_debate_state = {
@@ -46,6 +49,7 @@ Debate History:
             "bear_history": investment_debate_state.get("bear_history", ""),
             "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": response.content,
+            **carry_turns(investment_debate_state),
             "count": investment_debate_state["count"],
         }
 
@@ -1,14 +1,24 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_states import TradeDecision
+from tradingagents.agents.utils.debate_history import carry_turns, render_debate_history
 
-def create_risk_manager(llm, memory, language_prompt=""):
+
+STRUCTURED_DECISION_INSTRUCTIONS = """
+
+Return your answer in the requested structured format: put your complete written analysis in `rationale`, the final action (BUY, SELL or HOLD) in `action`, your confidence from 0 to 1 in `confidence`, the fraction of the portfolio to allocate from 0 to 1 in `position_size`, and the intended holding period in `horizon`."""
+
+
+def create_risk_manager(
+    llm, memory, language_prompt="", structured_output=False, history_window=0
+):
     def risk_manager_node(state) -> dict:
 
         company_name = state["company_of_interest"]
 
-        history = state["risk_debate_state"]["history"]
         risk_debate_state = state["risk_debate_state"]
+        debate_history = render_debate_history(risk_debate_state, history_window)
         market_research_report = state["market_report"]
         news_report = state["news_report"]
         fundamentals_report = state["news_report"]
@@ -39,16 +49,39 @@ Deliverables:
 ---
 
 **Analysts Debate History:**  
-{history}
+{debate_history}
 
 ---
 
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes."""
 
-        response = llm.invoke(prompt)
+        trade_decision = None
+        if structured_output:
+            try:
+                trade_decision = llm.with_structured_output(TradeDecision).invoke(
+                    prompt + STRUCTURED_DECISION_INSTRUCTIONS
+                )
+            except Exception:
+                # Providers without structured output fall back to the prose decision
+                pass
+            if not trade_decision or str(trade_decision.get("action", "")).upper() not in (
+                "BUY",
+                "SELL",
+                "HOLD",
+            ):
+                trade_decision = None
+
+        if trade_decision is not None:
+            trade_decision["action"] = trade_decision["action"].upper()
+            decision_text = (
+                f"{trade_decision.get('rationale', '')}\n\n"
+                f"FINAL TRANSACTION PROPOSAL: **{trade_decision['action']}**"
+            )
+        else:
+            decision_text = llm.invoke(prompt).content
 
         new_risk_debate_state = {
-            "judge_decision": response.content,
+            "judge_decision": decision_text,
             "history": risk_debate_state["history"],
             "risky_history": risk_debate_state["risky_history"],
             "safe_history": risk_debate_state["safe_history"],
@@ -57,12 +90,16 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
             "current_risky_response": risk_debate_state["current_risky_response"],
             "current_safe_response": risk_debate_state["current_safe_response"],
             "current_neutral_response": risk_debate_state["current_neutral_response"],
+            **carry_turns(risk_debate_state),
             "count": risk_debate_state["count"],
         }
 
-        return {
+        result = {
             "risk_debate_state": new_risk_debate_state,
-            "final_trade_decision": response.content,
+            "final_trade_decision": decision_text,
         }
+        if trade_decision is not None:
+            result["trade_decision"] = trade_decision
+        return result
 
     return risk_manager_node
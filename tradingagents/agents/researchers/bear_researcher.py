@@ -2,11 +2,18 @@ from langchain_core.messages import AIMessage
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import (
+    format_report_context,
+    invoke_with_report_access,
+)
+from tradingagents.agents.utils.debate_history import append_turn, render_debate_history
 
-def create_bear_researcher(llm, memory, language_prompt=""):
+
+def create_bear_researcher(llm, memory, language_prompt="", history_window=0):
     def bear_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
+        debate_history = render_debate_history(investment_debate_state, history_window)
         bear_history = investment_debate_state.get("bear_history", "")
 
         current_response = investment_debate_state.get("current_response", "")
@@ -15,6 +22,16 @@ def create_bear_researcher(llm, memory, language_prompt=""):
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
+        report_context = format_report_context(
+            state,
+            (
+                "Market research report",
+                "Social media sentiment report",
+                "Latest world affairs news",
+                "Company fundamentals report",
+            ),
+        )
+
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
@@ -36,17 +53,14 @@ Key points to focus on:
 
 Resources available:
 
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
+{report_context}
+Conversation history of the debate: {debate_history}
 Last bull argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
 
-        response = llm.invoke(prompt)
+        response = invoke_with_report_access(llm, prompt, state)
 
         argument = f"Bear Analyst: {response.content}"
 
@@ -55,6 +69,9 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
             "bear_history": bear_history + "\n" + argument,
             "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": argument,
+            **append_turn(
+                investment_debate_state, "Bear", argument, llm, history_window, language_prompt
+            ),
             "count": investment_debate_state["count"] + 1,
         }
 
@@ -2,11 +2,18 @@ from langchain_core.messages import AIMessage
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import (
+    format_report_context,
+    invoke_with_report_access,
+)
+from tradingagents.agents.utils.debate_history import append_turn, render_debate_history
 
-def create_bull_researcher(llm, memory, language_prompt=""):
+
+def create_bull_researcher(llm, memory, language_prompt="", history_window=0):
     def bull_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
+        debate_history = render_debate_history(investment_debate_state, history_window)
         bull_history = investment_debate_state.get("bull_history", "")
 
         current_response = investment_debate_state.get("current_response", "")
@@ -15,6 +22,16 @@ def create_bull_researcher(llm, memory, language_prompt=""):
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
+        report_context = format_report_context(
+            state,
+            (
+                "Market research report",
+                "Social media sentiment report",
+                "Latest world affairs news",
+                "Company fundamentals report",
+            ),
+        )
+
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
@@ -34,17 +51,14 @@ Key points to focus on:
 - Engagement: Present your argument in a conversational style, engaging directly with the bear analyst's points and debating effectively rather than just listing data.
 
 Resources available:
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
+{report_context}
+Conversation history of the debate: {debate_history}
 Last bear argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
 
-        response = llm.invoke(prompt)
+        response = invoke_with_report_access(llm, prompt, state)
 
         argument = f"Bull Analyst: {response.content}"
 
@@ -53,6 +67,9 @@ Use this information to deliver a compelling bull argument, refute the bear's co
             "bull_history": bull_history + "\n" + argument,
             "bear_history": investment_debate_state.get("bear_history", ""),
             "current_response": argument,
+            **append_turn(
+                investment_debate_state, "Bull", argument, llm, history_window, language_prompt
+            ),
             "count": investment_debate_state["count"] + 1,
         }
 
@@ -1,20 +1,32 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import (
+    format_report_context,
+    invoke_with_report_access,
+)
+from tradingagents.agents.utils.debate_history import append_turn, render_debate_history
 
-def create_risky_debator(llm, language_prompt=""):
+
+def create_risky_debator(llm, language_prompt="", history_window=0):
     def risky_node(state) -> dict:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
+        debate_history = render_debate_history(risk_debate_state, history_window)
         risky_history = risk_debate_state.get("risky_history", "")
 
         current_safe_response = risk_debate_state.get("current_safe_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
 
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
+        report_context = format_report_context(
+            state,
+            (
+                "Market Research Report",
+                "Social Media Sentiment Report",
+                "Latest World Affairs Report",
+                "Company Fundamentals Report",
+            ),
+        )
 
         trader_decision = state["trader_investment_plan"]
 
@@ -26,15 +38,12 @@ As the Risky Risk Analyst, your role is to actively champion high-reward, high-r
 
 Your task is to create a compelling case for the trader's decision by questioning and critiquing the conservative and neutral stances to demonstrate why your high-reward perspective offers the best path forward. Incorporate insights from the following sources into your arguments:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here are the last arguments from the conservative analyst: {current_safe_response} Here are the last arguments from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
+{report_context}
+Here is the current conversation history: {debate_history} Here are the last arguments from the conservative analyst: {current_safe_response} Here are the last arguments from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        response = invoke_with_report_access(llm, prompt, state)
 
         argument = f"Risky Analyst: {response.content}"
 
@@ -49,6 +58,9 @@ Engage actively by addressing any specific concerns raised, refuting the weaknes
             "current_neutral_response": risk_debate_state.get(
                 "current_neutral_response", ""
             ),
+            **append_turn(
+                risk_debate_state, "Risky", argument, llm, history_window, language_prompt
+            ),
             "count": risk_debate_state["count"] + 1,
         }
 
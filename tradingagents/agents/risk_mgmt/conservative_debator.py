@@ -2,20 +2,32 @@ from langchain_core.messages import AIMessage
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import (
+    format_report_context,
+    invoke_with_report_access,
+)
+from tradingagents.agents.utils.debate_history import append_turn, render_debate_history
 
-def create_safe_debator(llm, language_prompt=""):
+
+def create_safe_debator(llm, language_prompt="", history_window=0):
     def safe_node(state) -> dict:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
+        debate_history = render_debate_history(risk_debate_state, history_window)
         safe_history = risk_debate_state.get("safe_history", "")
 
         current_risky_response = risk_debate_state.get("current_risky_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
 
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
+        report_context = format_report_context(
+            state,
+            (
+                "Market Research Report",
+                "Social Media Sentiment Report",
+                "Latest World Affairs Report",
+                "Company Fundamentals Report",
+            ),
+        )
 
         trader_decision = state["trader_investment_plan"]
 
@@ -27,15 +39,12 @@ As the Safe/Conservative Risk Analyst, your primary objective is to protect asse
 
 Your task is to actively counter the arguments of the Risky and Neutral Analysts, highlighting where their views may overlook potential threats or fail to prioritize sustainability. Respond directly to their points, drawing from the following data sources to build a convincing case for a low-risk approach adjustment to the trader's decision:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here is the last response from the risky analyst: {current_risky_response} Here is the last response from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
+{report_context}
+Here is the current conversation history: {debate_history} Here is the last response from the risky analyst: {current_risky_response} Here is the last response from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
 
 Engage by questioning their optimism and emphasizing the potential downsides they may have overlooked. Address each of their counterpoints to showcase why a conservative stance is ultimately the safest path for the firm's assets. Focus on debating and critiquing their arguments to demonstrate the strength of a low-risk strategy over their approaches. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        response = invoke_with_report_access(llm, prompt, state)
 
         argument = f"Safe Analyst: {response.content}"
 
@@ -52,6 +61,9 @@ Engage by questioning their optimism and emphasizing the potential downsides the
             "current_neutral_response": risk_debate_state.get(
                 "current_neutral_response", ""
             ),
+            **append_turn(
+                risk_debate_state, "Safe", argument, llm, history_window, language_prompt
+            ),
             "count": risk_debate_state["count"] + 1,
         }
 
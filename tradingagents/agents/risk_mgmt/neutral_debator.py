@@ -1,20 +1,32 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import (
+    format_report_context,
+    invoke_with_report_access,
+)
+from tradingagents.agents.utils.debate_history import append_turn, render_debate_history
 
-def create_neutral_debator(llm, language_prompt=""):
+
+def create_neutral_debator(llm, language_prompt="", history_window=0):
     def neutral_node(state) -> dict:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
+        debate_history = render_debate_history(risk_debate_state, history_window)
         neutral_history = risk_debate_state.get("neutral_history", "")
 
         current_risky_response = risk_debate_state.get("current_risky_response", "")
         current_safe_response = risk_debate_state.get("current_safe_response", "")
 
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
+        report_context = format_report_context(
+            state,
+            (
+                "Market Research Report",
+                "Social Media Sentiment Report",
+                "Latest World Affairs Report",
+                "Company Fundamentals Report",
+            ),
+        )
 
         trader_decision = state["trader_investment_plan"]
 
@@ -26,15 +38,12 @@ As the Neutral Risk Analyst, your role is to provide a balanced perspective, wei
 
 Your task is to challenge both the Risky and Safe Analysts, pointing out where each perspective may be overly optimistic or overly cautious. Use insights from the following data sources to support a moderate, sustainable strategy to adjust the trader's decision:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here is the last response from the risky analyst: {current_risky_response} Here is the last response from the safe analyst: {current_safe_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
+{report_context}
+Here is the current conversation history: {debate_history} Here is the last response from the risky analyst: {current_risky_response} Here is the last response from the safe analyst: {current_safe_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
 
 Engage actively by analyzing both sides critically, addressing weaknesses in the risky and conservative arguments to advocate for a more balanced approach. Challenge each of their points to illustrate why a moderate risk strategy might offer the best of both worlds, providing growth potential while safeguarding against extreme volatility. Focus on debating rather than simply presenting data, aiming to show that a balanced view can lead to the most reliable outcomes. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        response = invoke_with_report_access(llm, prompt, state)
 
         argument = f"Neutral Analyst: {response.content}"
 
@@ -49,6 +58,9 @@ Engage actively by analyzing both sides critically, addressing weaknesses in the
             ),
             "current_safe_response": risk_debate_state.get("current_safe_response", ""),
             "current_neutral_response": argument,
+            **append_turn(
+                risk_debate_state, "Neutral", argument, llm, history_window, language_prompt
+            ),
             "count": risk_debate_state["count"] + 1,
         }
 
@@ -1,6 +1,6 @@
 from typing import Annotated, Sequence
 from datetime import date, timedelta, datetime
-from typing_extensions import TypedDict, Optional
+from typing_extensions import TypedDict, Optional, Literal
 from langchain_openai import ChatOpenAI
 from tradingagents.agents import *
 from langgraph.prebuilt import ToolNode
@@ -18,6 +18,9 @@ class InvestDebateState(TypedDict):
     history: Annotated[str, "Conversation history"]  # Conversation history
     current_response: Annotated[str, "Latest response"]  # Last response
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
+    turns: Annotated[list, "Structured list of debate turns"]  # Speaker and content
+    summary: Annotated[str, "Rolling summary of turns outside the window"]
+    summarized_turns: Annotated[int, "Number of turns folded into the summary"]
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
 
@@ -44,9 +47,27 @@ class RiskDebateState(TypedDict):
         str, "Latest response by the neutral analyst"
     ]  # Last response
     judge_decision: Annotated[str, "Judge's decision"]
+    turns: Annotated[list, "Structured list of debate turns"]  # Speaker and content
+    summary: Annotated[str, "Rolling summary of turns outside the window"]
+    summarized_turns: Annotated[int, "Number of turns folded into the summary"]
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
 
+# Structured final decision of the Risk Judge
+class TradeDecision(TypedDict):
+    """Final trading decision with sizing, returned alongside the written analysis."""
+
+    action: Annotated[Literal["BUY", "SELL", "HOLD"], "Final trade action"]
+    confidence: Annotated[float, "Confidence in the decision, from 0 to 1"]
+    position_size: Annotated[
+        float, "Fraction of the portfolio to allocate to the position, from 0 to 1"
+    ]
+    horizon: Annotated[str, "Intended holding period, e.g. '1-2 weeks'"]
+    rationale: Annotated[
+        str, "Full written analysis and reasoning behind the decision"
+    ]
+
+
 class AgentState(MessagesState):
     company_of_interest: Annotated[str, "Company that we are interested in trading"]
     trade_date: Annotated[str, "What date we are trading at"]
@@ -60,6 +81,9 @@ class AgentState(MessagesState):
         str, "Report from the News Researcher of current world affairs"
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
+    situation_digest: Annotated[
+        str, "Compact summary of the analyst reports for downstream agents"
+    ]
 
     # researcher team discussion step
     investment_debate_state: Annotated[
@@ -74,3 +98,6 @@ class AgentState(MessagesState):
         RiskDebateState, "Current state of the debate on evaluating risk"
     ]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
+    trade_decision: Annotated[
+        TradeDecision, "Structured final decision, when structured output is enabled"
+    ]
@@ -1,9 +1,10 @@
 from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage, AIMessage
 from typing import List
-from typing import Annotated
+from typing import Annotated, Literal
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import RemoveMessage
 from langchain_core.tools import tool
+from langgraph.prebuilt import InjectedState
 from datetime import date, timedelta, datetime
 import functools
 import pandas as pd
@@ -31,6 +32,93 @@ def create_msg_delete():
     return delete_messages
 
 
+def format_report_context(state, labels):
+    """Format the analyst reports for a prompt.
+
+    When the report digest stage has run, its compact summary replaces the four
+    raw reports; the raw reports stay in the state and logs.
+
+    Args:
+        state: Agent state
+        labels: Prompt labels for the market, sentiment, news and fundamentals reports
+    """
+    digest = state.get("situation_digest")
+    if digest:
+        return (
+            f"Situation digest (condensed from the analyst reports): {digest}\n"
+            "If your argument hinges on a detail the digest leaves out, read the "
+            "full report with the get_full_report tool."
+        )
+
+    reports = (
+        state["market_report"],
+        state["sentiment_report"],
+        state["news_report"],
+        state["fundamentals_report"],
+    )
+    return "\n".join(f"{label}: {report}" for label, report in zip(labels, reports))
+
+
+# get_full_report sections and the state fields holding their reports
+REPORT_SECTIONS = {
+    "market": "market_report",
+    "sentiment": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+
+@tool
+def get_full_report(
+    section: Annotated[
+        Literal["market", "sentiment", "news", "fundamentals"],
+        "Report to read: market, sentiment, news or fundamentals",
+    ],
+    state: Annotated[dict, InjectedState],
+) -> str:
+    """
+    Retrieve the full analyst report behind one section of the situation digest.
+    Args:
+        section (str): Report to read: market, sentiment, news or fundamentals
+    Returns:
+        str: The complete report written by that analyst for this run.
+    """
+    return state.get(REPORT_SECTIONS[section]) or f"No {section} report was produced for this run."
+
+
+def invoke_with_report_access(llm, prompt, state, max_lookups=2):
+    """Invoke a debater's LLM, letting it read the full reports behind the digest.
+
+    Without a situation digest the prompt already holds the full reports and
+    the LLM is invoked as is. Otherwise get_full_report is bound and its calls
+    are answered from the state, for at most max_lookups rounds; after that the
+    reports read so far are appended to the prompt and the LLM must answer.
+    """
+    if not state.get("situation_digest"):
+        return llm.invoke(prompt)
+
+    report_llm = llm.bind_tools([get_full_report])
+    messages = [HumanMessage(content=prompt)]
+    reports = []
+    for _ in range(max_lookups):
+        response = report_llm.invoke(messages)
+        if not response.tool_calls:
+            return response
+        messages.append(response)
+        for call in response.tool_calls:
+            try:
+                report = get_full_report.invoke({**call["args"], "state": state})
+                reports.append(report)
+            except Exception as e:
+                report = f"Error: {e}"
+            messages.append(ToolMessage(content=report, tool_call_id=call["id"]))
+    # Without tools bound, a conversation holding tool calls is rejected by
+    # some providers, so the final answer gets the reports inline
+    return llm.invoke(
+        prompt + "\n\nFull reports you requested:\n" + "\n\n".join(dict.fromkeys(reports))
+    )
+
+
 class Toolkit:
     _config = DEFAULT_CONFIG.copy()
 
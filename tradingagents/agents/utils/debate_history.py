@@ -0,0 +1,79 @@
+from typing import Any, Dict, List
+
+
+def render_debate_history(debate_state: Dict[str, Any], window: int = 0) -> str:
+    """Render the debate history shown to an agent.
+
+    With window=0 the full concatenated history is returned. Otherwise only
+    the last `window` turns are shown verbatim, preceded by a rolling summary
+    of the older turns, so the prompt size does not grow with debate depth.
+    """
+    if not window:
+        return debate_state.get("history", "")
+
+    turns = debate_state.get("turns", [])[-window:]
+    parts = []
+    summary = debate_state.get("summary", "")
+    if summary:
+        parts.append(f"Summary of the earlier debate: {summary}")
+    parts.extend(turn["content"] for turn in turns)
+    return "\n".join(parts)
+
+
+def _summarize_turns(llm, summary: str, turns: List[Dict[str, str]], language_prompt: str) -> str:
+    """Fold turns into the rolling debate summary with one LLM call."""
+    new_turns = "\n".join(turn["content"] for turn in turns)
+    prompt = f"""{language_prompt}
+
+You maintain a running summary of a debate between analysts. Update the summary with the new arguments below. Keep each side's key claims, the evidence they cite and any points of agreement or concession. Write at most 200 words, without any special formatting.
+
+Current summary:
+{summary or "(none yet)"}
+
+New arguments:
+{new_turns}"""
+    return llm.invoke(prompt).content
+
+
+def append_turn(
+    debate_state: Dict[str, Any],
+    speaker: str,
+    argument: str,
+    llm,
+    window: int = 0,
+    language_prompt: str = "",
+) -> Dict[str, Any]:
+    """Append a turn to the structured turn list.
+
+    Turns that fall out of the verbatim window are summarized exactly once,
+    when they leave it. Returns the turns, summary and summarized_turns
+    fields for the new debate state.
+    """
+    turns = list(debate_state.get("turns", [])) + [
+        {"speaker": speaker, "content": argument}
+    ]
+    summary = debate_state.get("summary", "")
+    summarized_turns = debate_state.get("summarized_turns", 0)
+
+    if window:
+        cutoff = len(turns) - window
+        if cutoff > summarized_turns:
+            summary = _summarize_turns(
+                llm, summary, turns[summarized_turns:cutoff], language_prompt
+            )
+            summarized_turns = cutoff
+
+    return {
+        "turns": turns,
+        "summary": summary,
+        "summarized_turns": summarized_turns,
+    }
+
+
+def carry_turns(debate_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the structured turn fields unchanged into a new debate state."""
+    return {
+        "turns": debate_state.get("turns", []),
+        "summary": debate_state.get("summary", ""),
+        "summarized_turns": debate_state.get("summarized_turns", 0),
+    }
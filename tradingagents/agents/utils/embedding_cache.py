@@ -0,0 +1,192 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """In-memory LRU cache of embeddings keyed by model and content hash.
+
+    One cache is shared by all memories of a graph, so the identical situation
+    text that the researchers, managers and trader look up in the same run is
+    embedded only once. Embeddings are kept as read-only float32 arrays and
+    the least recently used ones are dropped once they exceed max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, backing: "DiskEmbeddingCache" = None):
+        self.max_bytes = max_bytes
+        # Optional persistent cache consulted on misses
+        self.backing = backing
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Hash the model name and text into a cache key."""
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """Get a cached embedding, or None on a miss."""
+        key = self.make_key(model, text)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+            self.misses += 1
+
+        if self.backing is not None:
+            embedding = self.backing.get(model, text)
+            if embedding is not None:
+                embedding = self._remember(key, embedding)
+            return embedding
+        return None
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        """Store an embedding, evicting the least recently used entries."""
+        self._remember(self.make_key(model, text), embedding)
+        if self.backing is not None:
+            self.backing.put(model, text, embedding)
+
+    def _remember(self, key: str, embedding) -> np.ndarray:
+        vector = np.array(embedding, dtype=np.float32)
+        # Shared by every memory of the graph, so callers must not modify it
+        vector.flags.writeable = False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous.nbytes
+            self._entries[key] = vector
+            self._nbytes += vector.nbytes
+            while self._nbytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+        return vector
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached vectors."""
+        with self._lock:
+            return self._nbytes
+
+    def clear(self):
+        """Drop all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+class DiskEmbeddingCache:
+    """Persistent, content-addressed embedding cache in a SQLite file.
+
+    Vectors are keyed by sha256(model, text) and stored compactly as float32 or
+    float16 blobs. When the stored vectors exceed max_bytes, the least recently
+    used entries are evicted. The size is read from the database rather than
+    tracked per instance, so every process sharing the file sees the writes of
+    the others.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, dtype: str = "float32"):
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.dtype = np.dtype(dtype)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, model TEXT NOT NULL, dtype TEXT NOT NULL, "
+                "vector BLOB NOT NULL, nbytes INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_access ON embeddings (last_access)"
+            )
+
+    def _connect(self):
+        # A connection per operation keeps the cache safe across threads and processes
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _stored_bytes(conn) -> int:
+        return conn.execute(
+            "SELECT COALESCE(SUM(length(vector)), 0) FROM embeddings"
+        ).fetchone()[0]
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """Get a stored embedding as a float32 array, or None on a miss."""
+        key = EmbeddingCache.make_key(model, text)
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT dtype, vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            conn.execute(
+                "UPDATE embeddings SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        self._count("hits")
+        return np.frombuffer(row[1], dtype=row[0]).astype(np.float32)
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        """Store an embedding and evict old entries if over the size budget."""
+        key = EmbeddingCache.make_key(model, text)
+        vector = np.asarray(embedding, dtype=self.dtype).tobytes()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings "
+                "(key, model, dtype, vector, nbytes, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, self.dtype.name, vector, len(vector), time.time()),
+            )
+            self._count("writes")
+            # Summed inside the write transaction, so concurrent writers agree
+            stored = self._stored_bytes(conn)
+            if stored > self.max_bytes:
+                self._evict(conn, stored - int(self.max_bytes * 0.9))
+
+    def _evict(self, conn, to_free: int):
+        """Delete least recently used entries until to_free bytes are released."""
+        freed = 0
+        evicted = []
+        for key, nbytes in conn.execute(
+            "SELECT key, length(vector) FROM embeddings ORDER BY last_access"
+        ):
+            if freed >= to_free:
+                break
+            evicted.append((key,))
+            freed += nbytes
+        conn.executemany("DELETE FROM embeddings WHERE key = ?", evicted)
+        self._count("evictions", len(evicted))
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the stored vectors."""
+        with closing(self._connect()) as conn:
+            return self._stored_bytes(conn)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get hit/miss/write/eviction counts, hit rate and stored size."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["size_bytes"] = self.size_bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,81 @@
+import math
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+@lru_cache(maxsize=1 << 16)
+def _hash_feature(feature: str) -> int:
+    return zlib.crc32(feature.encode("utf-8"))
+
+
+class HashingEmbedder:
+    """Deterministic, offline text embeddings by feature hashing.
+
+    Each text is turned into word unigrams plus character n-grams (which also
+    cover Thai, written without spaces between words). Features are hashed
+    into a fixed number of signed buckets, weighted by sublinear term
+    frequency and L2-normalized. Needs no network or model download, so runs,
+    backtests and benchmarks can be reproduced offline.
+    """
+
+    def __init__(self, dim: int = 1024, ngram_range=(3, 5)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    @property
+    def model_name(self) -> str:
+        low, high = self.ngram_range
+        return f"local-hashing-{self.dim}-{low}{high}"
+
+    def _features(self, text: str) -> Counter:
+        text = text.lower()
+        features = Counter(f"w:{word}" for word in _WORD.findall(text))
+        compact = " ".join(text.split())
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            features.update(f"c:{compact[i:i + n]}" for i in range(len(compact) - n + 1))
+        return features
+
+    def embed_one(self, text: str) -> List[float]:
+        features = self._features(text)
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if not features:
+            return vector.tolist()
+        indices = np.empty(len(features), dtype=np.int64)
+        weights = np.empty(len(features), dtype=np.float32)
+        for i, (feature, count) in enumerate(features.items()):
+            h = _hash_feature(feature)
+            indices[i] = h % self.dim
+            # The top bit picks the sign so collisions tend to cancel out
+            weights[i] = (1.0 + math.log(count)) * (1.0 if h & 0x80000000 else -1.0)
+        np.add.at(vector, indices, weights)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector.tolist()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_one(text) for text in texts]
+
+
+def is_local_embeddings_url(url: str) -> bool:
+    return bool(url) and url.startswith("local://")
+
+
+def create_local_embedder(url: str = "local://hashing", dim: int = 1024) -> HashingEmbedder:
+    """Build the local embedder from a local://hashing?dim=N URL."""
+    parsed = urlparse(url)
+    if parsed.netloc not in ("", "hashing"):
+        raise ValueError(f"Unsupported local embeddings provider: {parsed.netloc}")
+    query = parse_qs(parsed.query)
+    if "dim" in query:
+        dim = int(query["dim"][0])
+    return HashingEmbedder(dim=dim)
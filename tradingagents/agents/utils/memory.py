@@ -1,12 +1,99 @@
-import chromadb
-from chromadb.config import Settings
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from openai import OpenAI
+
+from .embedding_cache import EmbeddingCache
+from .local_embeddings import create_local_embedder, is_local_embeddings_url
+from .memory_store import create_memory_store, open_shared_store
+
+def _as_return(value):
+    """Realized return as a float, or None when it is not numeric"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _chunk_text(text, chunk_size):
+    """Split text into chunks of at most chunk_size characters, preferring line breaks"""
+    if not chunk_size or len(text) <= chunk_size:
+        return [text]
+
+    chunks = []
+    current = ""
+    for line in text.splitlines(keepends=True):
+        # Lines longer than a chunk are cut into pieces
+        while len(line) > chunk_size:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:chunk_size])
+            line = line[chunk_size:]
+        if len(current) + len(line) > chunk_size:
+            chunks.append(current)
+            current = ""
+        current += line
+    if current.strip():
+        chunks.append(current)
+    return [chunk for chunk in chunks if chunk.strip()] or [text[:chunk_size]]
+
+
+def _pool(vectors, pooling):
+    """Pool chunk embeddings into one L2-normalized vector"""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    pooled = matrix.max(axis=0) if pooling == "max" else matrix.mean(axis=0)
+    norm = np.linalg.norm(pooled)
+    return (pooled / norm if norm else pooled).tolist()
+
+
+# Sort keys putting the first lessons to evict first. "smallest_move" drops the
+# lessons whose trades moved least in either direction, since large wins and
+# large losses both carry the most signal.
+EVICTION_POLICIES = {
+    "oldest": lambda entry: entry["seq"],
+    "least_retrieved": lambda entry: (entry["retrievals"], entry["seq"]),
+    "smallest_move": lambda entry: (
+        abs(entry["return"]) if entry["return"] is not None else 0.0,
+        entry["seq"],
+    ),
+}
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Get the pooled keep-alive session shared by all memories."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            _http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            _http_session.mount("https://", adapter)
+            _http_session.mount("http://", adapter)
+        return _http_session
 
 
 class FinancialSituationMemory:
-    def __init__(self, name, config):
-        if config["backend_url"] == "http://localhost:11434/v1":
+    def __init__(self, name, config, embedding_cache: EmbeddingCache = None):
+        self.local_embedder = None
+        embeddings_url = config.get("embeddings_url", "")
+        if config.get("embedding_provider") == "local" or is_local_embeddings_url(embeddings_url):
+            # Offline, deterministic feature-hashing embeddings
+            self.local_embedder = create_local_embedder(
+                embeddings_url if is_local_embeddings_url(embeddings_url) else "local://hashing",
+                dim=config.get("local_embedding_dim", 1024),
+            )
+            self.embedding = self.local_embedder.model_name
+            self.use_direct_http = False
+        elif config["backend_url"] == "http://localhost:11434/v1":
             self.embedding = "nomic-embed-text"
             # Use local Ollama for embeddings when using local backend
             self.client = OpenAI(
@@ -20,27 +107,126 @@ class FinancialSituationMemory:
             self.embeddings_url = config["embeddings_url"]
             self.api_key = config["api_key"]
             self.use_direct_http = True
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        
-        # Make collection name unique per session to avoid conflicts
-        session_id = config.get('session_id', 'default')
-        unique_name = f"{name}_{session_id}"
-        
-        # Check if collection already exists, if so delete it and create new one
-        try:
-            existing_collections = [col.name for col in self.chroma_client.list_collections()]
-            if unique_name in existing_collections:
-                self.chroma_client.delete_collection(name=unique_name)
-        except Exception as e:
-            # If there's any issue checking/deleting, just continue
-            pass
-        
-        # Create the collection (now guaranteed to be fresh and unique)
-        self.situation_collection = self.chroma_client.create_collection(name=unique_name)
+        # Optionally shared with other memories so identical texts are embedded once
+        self.embedding_cache = embedding_cache
+        # Request limits: texts per request, characters per request and
+        # concurrent requests
+        self.embedding_batch_size = max(1, config.get("embedding_batch_size", 32))
+        self.embedding_max_request_chars = config.get("embedding_max_request_chars", 64000)
+        self.embedding_max_workers = config.get("embedding_max_workers", 4)
+        # Long situations are embedded in chunks and pooled into one vector
+        self.embedding_chunk_size = config.get("embedding_chunk_size", 0)
+        self.embedding_pooling = config.get("embedding_pooling", "mean")
+        if self.embedding_pooling not in ("mean", "max"):
+            raise ValueError(f"Unsupported embedding_pooling: {self.embedding_pooling}")
+        # Pooled vectors differ from whole-text ones, so they are cached apart
+        self.cache_model = self.embedding
+        if self.embedding_chunk_size:
+            self.cache_model = f"{self.embedding}|chunk={self.embedding_chunk_size}|{self.embedding_pooling}"
+
+        # ephemeral: fresh in-memory store per session (lost on exit)
+        # persistent: on-disk store that keeps lessons across restarts
+        # overlay: read-only persistent base plus an in-memory session overlay
+        self.memory_mode = config.get("memory_mode", "ephemeral")
+        if self.memory_mode not in ("ephemeral", "persistent", "overlay"):
+            raise ValueError(f"Unsupported memory_mode: {self.memory_mode}")
+
+        self.base_store = None
+        if self.memory_mode == "overlay":
+            # One read-only copy of the base per file, shared by all sessions
+            self.base_store = open_shared_store(name, config)
+        self.situation_store = create_memory_store(
+            name, config, persistent=self.memory_mode == "persistent"
+        )
+
+        # Growth limits: 0 disables the capacity limit and de-duplication
+        self.capacity = config.get("memory_capacity", 0)
+        self.dedup_threshold = config.get("memory_dedup_threshold", 0)
+        self.eviction_policy = config.get("memory_eviction", "oldest")
+        if self.eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unsupported memory_eviction: {self.eviction_policy}")
+        self.stats = {"evictions": 0, "merges": 0}
+        self._write_lock = threading.Lock()
 
     def get_embedding(self, text):
         """Get embedding for a text"""
-        
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts):
+        """Get embeddings for several texts, requesting cache misses in batches"""
+        embeddings, missing, chunks, batches = self._plan_batches(texts)
+        if len(batches) > 1 and self.embedding_max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.embedding_max_workers) as executor:
+                results = list(executor.map(self._fetch_embeddings, batches))
+        else:
+            results = [self._fetch_embeddings(batch) for batch in batches]
+        self._store_results(embeddings, missing, chunks, batches, results)
+        return [embeddings[text] for text in texts]
+
+    async def aget_embeddings(self, texts, max_concurrency=4):
+        """Async variant of get_embeddings that sends up to max_concurrency batches at once"""
+        embeddings, missing, chunks, batches = self._plan_batches(texts)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(batch):
+            async with semaphore:
+                return await asyncio.to_thread(self._fetch_embeddings, batch)
+
+        results = await asyncio.gather(*(fetch(batch) for batch in batches))
+        self._store_results(embeddings, missing, chunks, batches, results)
+        return [embeddings[text] for text in texts]
+
+    def _plan_batches(self, texts):
+        """Split texts into cached embeddings and request batches for the misses
+
+        Misses longer than embedding_chunk_size are split into chunks. Batches
+        hold at most embedding_batch_size chunks and embedding_max_request_chars
+        characters, so request sizes stay bounded.
+        """
+        embeddings = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = None
+            if self.embedding_cache is not None:
+                cached = self.embedding_cache.get(self.cache_model, text)
+            if cached is None:
+                missing.append(text)
+            else:
+                embeddings[text] = cached
+
+        chunks = {text: _chunk_text(text, self.embedding_chunk_size) for text in missing}
+        batches = []
+        batch, batch_chars = [], 0
+        for chunk in dict.fromkeys(piece for text in missing for piece in chunks[text]):
+            if batch and (
+                len(batch) >= self.embedding_batch_size
+                or batch_chars + len(chunk) > self.embedding_max_request_chars
+            ):
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(chunk)
+            batch_chars += len(chunk)
+        if batch:
+            batches.append(batch)
+        return embeddings, missing, chunks, batches
+
+    def _store_results(self, embeddings, missing, chunks, batches, results):
+        """Pool chunk embeddings into one vector per text and cache them"""
+        chunk_vectors = {}
+        for batch, vectors in zip(batches, results):
+            chunk_vectors.update(zip(batch, vectors))
+
+        for text in missing:
+            vectors = [chunk_vectors[chunk] for chunk in chunks[text]]
+            vector = vectors[0] if len(vectors) == 1 else _pool(vectors, self.embedding_pooling)
+            embeddings[text] = vector
+            if self.embedding_cache is not None:
+                self.embedding_cache.put(self.cache_model, text, vector)
+
+    def _fetch_embeddings(self, texts):
+        """Request embeddings for a batch of texts from the embeddings endpoint"""
+        if self.local_embedder is not None:
+            return self.local_embedder.embed(texts)
         if self.use_direct_http:
             # Use direct HTTP request for Chutes embeddings
             headers = {
@@ -49,64 +235,96 @@ class FinancialSituationMemory:
             }
             
             data = {
-                "input": text,
+                "input": texts,
                 "model": self.embedding
             }
             
-            response = requests.post(self.embeddings_url, headers=headers, json=data, timeout=30)
+            response = _get_http_session().post(
+                self.embeddings_url, headers=headers, json=data, timeout=30
+            )
             response.raise_for_status()
             
             result = response.json()
-            return result['data'][0]['embedding']
+            items = sorted(result['data'], key=lambda item: item.get('index', 0))
+            return [item['embedding'] for item in items]
         else:
             # Use OpenAI client for local Ollama
-            response = self.client.embeddings.create(model=self.embedding, input=text)
-            return response.data[0].embedding
-
-    def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
-
-        situations = []
-        advice = []
-        ids = []
-        embeddings = []
-
-        offset = self.situation_collection.count()
-
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
-            situations.append(situation)
-            advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
-
-        self.situation_collection.add(
-            documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
-            embeddings=embeddings,
-            ids=ids,
-        )
+            response = self.client.embeddings.create(model=self.embedding, input=texts)
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
 
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
-        query_embedding = self.get_embedding(current_situation)
+    def add_situations(self, situations_and_advice, returns=None):
+        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)
 
-        results = self.situation_collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_matches,
-            include=["metadatas", "documents", "distances"],
-        )
+        returns optionally holds the realized return behind each lesson, used by
+        the "smallest_move" eviction policy.
+        """
+        situations = [situation for situation, _ in situations_and_advice]
+        self._add_embedded(situations_and_advice, self.get_embeddings(situations), returns)
+
+    async def aadd_situations(self, situations_and_advice, returns=None, max_concurrency=4):
+        """Async variant of add_situations for bulk loads"""
+        situations = [situation for situation, _ in situations_and_advice]
+        embeddings = await self.aget_embeddings(situations, max_concurrency)
+        await asyncio.to_thread(self._add_embedded, situations_and_advice, embeddings, returns)
+
+    def _add_embedded(self, situations_and_advice, embeddings, returns=None):
+        if not situations_and_advice:
+            return
+        returns = [_as_return(ret) for ret in returns] if returns else [None] * len(embeddings)
 
-        matched_results = []
-        for i in range(len(results["documents"][0])):
-            matched_results.append(
-                {
-                    "matched_situation": results["documents"][0][i],
-                    "recommendation": results["metadatas"][0][i]["recommendation"],
-                    "similarity_score": 1 - results["distances"][0][i],
-                }
+        with self._write_lock:
+            if not self.dedup_threshold:
+                self.situation_store.add(
+                    documents=[situation for situation, _ in situations_and_advice],
+                    recommendations=[rec for _, rec in situations_and_advice],
+                    embeddings=embeddings,
+                    returns=returns,
+                )
+            else:
+                for (situation, recommendation), embedding, ret in zip(
+                    situations_and_advice, embeddings, returns
+                ):
+                    self._add_or_merge(situation, recommendation, embedding, ret)
+
+            if self.capacity and self.situation_store.count() > self.capacity:
+                self._evict(self.situation_store.count() - self.capacity)
+
+    def _add_or_merge(self, situation, recommendation, embedding, ret):
+        """Fold a lesson into its nearest stored neighbour when they are near-duplicates"""
+        nearest = self.situation_store.query(embedding, 1)
+        if nearest and nearest[0]["similarity_score"] >= self.dedup_threshold:
+            self.situation_store.merge(
+                nearest[0]["id"], situation, recommendation, embedding, ret
             )
+            self.stats["merges"] += 1
+        else:
+            self.situation_store.add([situation], [recommendation], [embedding], [ret])
+
+    def _evict(self, n):
+        """Remove n lessons chosen by the eviction policy"""
+        victims = sorted(self.situation_store.entries(), key=EVICTION_POLICIES[self.eviction_policy])[:n]
+        self.situation_store.delete([entry["id"] for entry in victims])
+        self.stats["evictions"] += len(victims)
+
+    def get_stats(self):
+        """Get eviction and merge counts and the number of stored lessons"""
+        return {**self.stats, "size": self.situation_store.count()}
+
+    def get_memories(self, current_situation, n_matches=1):
+        """Find matching recommendations by embedding similarity"""
+        query_embedding = self.get_embedding(current_situation)
+
+        matched_results = self.situation_store.query(query_embedding, n_matches)
+        if self.eviction_policy == "least_retrieved":
+            self.situation_store.record_retrievals([match["id"] for match in matched_results])
+        if self.base_store is not None:
+            matched_results += self.base_store.query(query_embedding, n_matches)
 
-        return matched_results
+        # Merge the session overlay with the shared base
+        matched_results.sort(key=lambda match: match["similarity_score"], reverse=True)
+        for match in matched_results:
+            match.pop("id", None)
+        return matched_results[:n_matches]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,663 @@
+import io
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Per-lesson bookkeeping kept next to each stored situation:
+#   seq         monotonic insertion number (also the id), used by "oldest" eviction
+#   retrievals  times the lesson was returned by get_memories
+#   merges      near-duplicate lessons folded into this one
+#   return      mean realized return of the merged lessons, when known
+#   returns     number of merged lessons that carried a return
+
+
+def _new_metadata(seq: int, ret: Optional[float]) -> Dict[str, Any]:
+    metadata = {"seq": seq, "retrievals": 0, "merges": 0}
+    if ret is not None:
+        metadata["return"] = ret
+        metadata["returns"] = 1
+    return metadata
+
+
+def _merge_metadata(metadata: Dict[str, Any], ret: Optional[float]) -> Dict[str, Any]:
+    """Fold one more lesson into an entry's metadata.
+
+    The return is averaged over the lessons that carried one, so merging a
+    lesson without a known return leaves it unchanged.
+    """
+    metadata = dict(metadata)
+    metadata["merges"] = metadata.get("merges", 0) + 1
+    if ret is not None:
+        if "return" in metadata:
+            count = metadata.get("returns", 1)
+            metadata["return"] = (metadata["return"] * count + ret) / (count + 1)
+            metadata["returns"] = count + 1
+        else:
+            metadata["return"] = ret
+            metadata["returns"] = 1
+    return metadata
+
+
+class ChromaMemoryStore:
+    """Vector store backed by a Chroma collection.
+
+    Persistent stores use an on-disk collection shared by all sessions;
+    otherwise a fresh in-memory collection is created per session.
+    """
+
+    def __init__(self, name: str, config: Dict[str, Any], persistent: bool = False):
+        # Chroma is slow to import, so only pay for it when this backend is used
+        import chromadb
+        from chromadb.config import Settings
+
+        # Cosine space makes 1 - distance a cosine similarity, as in NumpyMemoryStore
+        metadata = {"hnsw:space": "cosine"}
+
+        if persistent:
+            client = chromadb.PersistentClient(path=memory_dir(config))
+            # Persistent collections are shared by all sessions and never deleted here
+            self.collection = client.get_or_create_collection(name=name, metadata=metadata)
+            self._next_seq = max(
+                (entry["seq"] for entry in self.entries()), default=-1
+            ) + 1
+            return
+
+        client = chromadb.Client(Settings(allow_reset=True))
+
+        # Make collection name unique per session to avoid conflicts
+        session_id = config.get('session_id', 'default')
+        unique_name = f"{name}_{session_id}"
+
+        # Check if collection already exists, if so delete it and create new one
+        try:
+            existing_collections = [col.name for col in client.list_collections()]
+            if unique_name in existing_collections:
+                client.delete_collection(name=unique_name)
+        except Exception as e:
+            # If there's any issue checking/deleting, just continue
+            pass
+
+        # Create the collection (now guaranteed to be fresh and unique)
+        self.collection = client.create_collection(name=unique_name, metadata=metadata)
+        self._next_seq = 0
+
+    def count(self) -> int:
+        return self.collection.count()
+
+    def add(
+        self,
+        documents: List[str],
+        recommendations: List[str],
+        embeddings: List[List[float]],
+        returns: Optional[List[Optional[float]]] = None,
+    ) -> List[str]:
+        returns = returns or [None] * len(documents)
+        seqs = list(range(self._next_seq, self._next_seq + len(documents)))
+        self._next_seq += len(documents)
+        ids = [str(seq) for seq in seqs]
+        self.collection.add(
+            documents=documents,
+            metadatas=[
+                {"recommendation": rec, **_new_metadata(seq, ret)}
+                for rec, seq, ret in zip(recommendations, seqs, returns)
+            ],
+            embeddings=embeddings,
+            ids=ids,
+        )
+        return ids
+
+    def merge(
+        self,
+        entry_id: str,
+        document: str,
+        recommendation: str,
+        embedding: List[float],
+        ret: Optional[float] = None,
+    ):
+        """Replace an entry's lesson and embedding with a newer near-duplicate one."""
+        metadata = self.collection.get(ids=[entry_id], include=["metadatas"])["metadatas"][0]
+        metadata = _merge_metadata(metadata, ret)
+        metadata["recommendation"] = recommendation
+        # Without embeddings Chroma would re-embed the document with its own model
+        self.collection.update(
+            ids=[entry_id], documents=[document], metadatas=[metadata], embeddings=[embedding]
+        )
+
+    def delete(self, ids: List[str]):
+        if ids:
+            self.collection.delete(ids=ids)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Bookkeeping for every stored lesson, used to pick eviction victims."""
+        stored = self.collection.get(include=["metadatas"])
+        return [
+            {
+                "id": entry_id,
+                "seq": metadata.get("seq", int(entry_id) if entry_id.isdigit() else 0),
+                "retrievals": metadata.get("retrievals", 0),
+                "return": metadata.get("return"),
+            }
+            for entry_id, metadata in zip(stored["ids"], stored["metadatas"])
+        ]
+
+    def record_retrievals(self, ids: List[str]):
+        if not ids:
+            return
+        stored = self.collection.get(ids=ids, include=["metadatas"])
+        metadatas = [
+            {**metadata, "retrievals": metadata.get("retrievals", 0) + 1}
+            for metadata in stored["metadatas"]
+        ]
+        self.collection.update(ids=stored["ids"], metadatas=metadatas)
+
+    def query_batch(self, embeddings: List[List[float]], n_results: int) -> List[List[Dict[str, Any]]]:
+        """Top matches for each query embedding."""
+        count = self.collection.count()
+        if not count:
+            return [[] for _ in embeddings]
+        results = self.collection.query(
+            query_embeddings=embeddings,
+            n_results=min(n_results, count),
+            include=["metadatas", "documents", "distances"],
+        )
+        return [
+            [
+                {
+                    "id": entry_id,
+                    "matched_situation": document,
+                    "recommendation": metadata["recommendation"],
+                    "similarity_score": 1 - distance,
+                }
+                for entry_id, document, metadata, distance in zip(
+                    ids, documents, metadatas, distances
+                )
+            ]
+            for ids, documents, metadatas, distances in zip(
+                results["ids"], results["documents"], results["metadatas"], results["distances"]
+            )
+        ]
+
+    def query(self, embedding: List[float], n_results: int) -> List[Dict[str, Any]]:
+        return self.query_batch([embedding], n_results)[0]
+
+    def is_stale(self) -> bool:
+        # Persistent collections read through to the on-disk database
+        return False
+
+
+class NumpyMemoryStore:
+    """In-process vector store holding L2-normalized rows in one matrix.
+
+    Cosine top-k is a matrix multiply over the stored rows. The matrix grows
+    geometrically so appends are amortized O(1). Persistent stores keep a
+    snapshot in an .npz file plus a log of the writes made since; each write
+    appends one line to the log, and every COMPACT_EVERY writes the snapshot
+    is rewritten and the log started afresh. One writer per file is assumed.
+
+    Rows can be kept as float32, float16 or int8 with a per-row scale
+    (memory_dtype), and optionally projected onto memory_pca_dims principal
+    components fitted on the stored corpus once it holds twice that many
+    vectors. Use measure_recall to check the accuracy cost of either option.
+    """
+
+    # Rows dequantized at a time while scoring, bounding the float32 scratch space
+    SCORE_BLOCK_ROWS = 8192
+    # Logged writes after which the .npz snapshot is rewritten
+    COMPACT_EVERY = 256
+
+    def __init__(self, name: str, config: Dict[str, Any], persistent: bool = False):
+        self.path = os.path.join(memory_dir(config), f"{name}.npz") if persistent else None
+        dtype = config.get("memory_dtype", "float32")
+        if dtype not in ("float32", "float16", "int8"):
+            raise ValueError(f"Unsupported memory_dtype: {dtype}")
+        self.dtype = np.dtype(dtype)
+        self.pca_dims = config.get("memory_pca_dims", 0)
+
+        self._matrix = np.empty((0, 0), dtype=self.dtype)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._size = 0
+        self._input_dim = None
+        # PCA projection, set once fitted
+        self._mean = None
+        self._components = None
+        self.documents: List[str] = []
+        self.recommendations: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self._next_seq = 0
+        self._lock = threading.Lock()
+        # Snapshot generation, naming the log of writes made since it was saved
+        self._generation = 0
+        self._logged = 0
+        # Set when the log ends in a torn line, which the next write compacts away
+        self._torn = False
+        if self.path:
+            if os.path.exists(self.path):
+                self._load()
+            self._replay()
+            self._stamp = self._file_stamp()
+
+    def count(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the stored vectors and their scales."""
+        return self._size * (self._matrix.shape[1] * self.dtype.itemsize + self._scales.itemsize)
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _project(self, vectors: np.ndarray) -> np.ndarray:
+        """Map raw embeddings into the stored space (PCA if fitted), normalized."""
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if self._input_dim is not None and vectors.shape[1] != self._input_dim:
+            raise ValueError(
+                f"Embedding size {vectors.shape[1]} does not match the store ({self._input_dim})"
+            )
+        if self._components is not None:
+            vectors = (vectors - self._mean) @ self._components.T
+        return self._normalize(vectors)
+
+    def _encode(self, vectors: np.ndarray):
+        """Quantize normalized rows to the storage dtype, with per-row scales."""
+        if self.dtype == np.int8:
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            encoded = np.round(vectors / scales[:, None]).astype(np.int8)
+            return encoded, scales.astype(np.float32)
+        return vectors.astype(self.dtype), np.ones(len(vectors), dtype=np.float32)
+
+    def _decode(self, start: int, end: int) -> np.ndarray:
+        rows = self._matrix[start:end].astype(np.float32)
+        if self.dtype == np.int8:
+            rows *= self._scales[start:end, None]
+        return rows
+
+    def _reserve(self, rows: int, dim: int):
+        """Make room for rows more vectors, doubling the capacity when full."""
+        capacity = self._matrix.shape[0]
+        if self._size + rows <= capacity:
+            return
+        new_capacity = max(2 * capacity, self._size + rows, 64)
+        matrix = np.empty((new_capacity, dim), dtype=self.dtype)
+        scales = np.empty(new_capacity, dtype=np.float32)
+        # The initial empty matrix has no columns yet, so there is nothing to copy
+        if self._size:
+            matrix[: self._size] = self._matrix[: self._size]
+            scales[: self._size] = self._scales[: self._size]
+        self._matrix, self._scales = matrix, scales
+
+    def _fit_pca(self):
+        """Project the stored corpus onto its top pca_dims principal components.
+
+        The components come from the uncentered rows: centering would change
+        the angles between vectors and with them the cosine ranking that the
+        projection is meant to preserve. The mean stays zero; it is only kept
+        so stores fitted with a centered projection still load.
+        """
+        data = self._decode(0, self._size)
+        self._mean = np.zeros(data.shape[1], dtype=np.float32)
+        _, _, vt = np.linalg.svd(data, full_matrices=False)
+        self._components = np.ascontiguousarray(vt[: self.pca_dims])
+        projected = self._normalize((data - self._mean) @ self._components.T)
+        self._matrix = np.empty((0, self.pca_dims), dtype=self.dtype)
+        self._scales = np.empty(0, dtype=np.float32)
+        size, self._size = self._size, 0
+        self._reserve(size, self.pca_dims)
+        self._matrix[:size], self._scales[:size] = self._encode(projected)
+        self._size = size
+
+    def _index(self, entry_id: str) -> int:
+        seq = int(entry_id)
+        for i, metadata in enumerate(self.metadata):
+            if metadata["seq"] == seq:
+                return i
+        raise KeyError(entry_id)
+
+    def add(
+        self,
+        documents: List[str],
+        recommendations: List[str],
+        embeddings: List[List[float]],
+        returns: Optional[List[Optional[float]]] = None,
+    ) -> List[str]:
+        returns = returns or [None] * len(documents)
+        with self._lock:
+            seqs, fitted = self._insert(documents, recommendations, embeddings, returns)
+            if self.path:
+                if fitted:
+                    # Fitting re-projects every row, which a log entry cannot express
+                    self._save()
+                else:
+                    self._log(
+                        {
+                            "op": "add",
+                            "documents": documents,
+                            "recommendations": recommendations,
+                            "embeddings": np.asarray(embeddings, dtype=np.float32).tolist(),
+                            "returns": returns,
+                        }
+                    )
+        return [str(seq) for seq in seqs]
+
+    def _insert(self, documents, recommendations, embeddings, returns):
+        """Append rows; returns their seqs and whether PCA was fitted as a result."""
+        vectors = self._project(embeddings)
+        if self._input_dim is None:
+            self._input_dim = vectors.shape[1]
+        self._reserve(len(vectors), vectors.shape[1])
+        end = self._size + len(vectors)
+        self._matrix[self._size : end], self._scales[self._size : end] = self._encode(vectors)
+        self._size = end
+        self.documents.extend(documents)
+        self.recommendations.extend(recommendations)
+        seqs = list(range(self._next_seq, self._next_seq + len(documents)))
+        self._next_seq += len(documents)
+        self.metadata.extend(_new_metadata(seq, ret) for seq, ret in zip(seqs, returns))
+
+        fitted = False
+        if (
+            self.pca_dims
+            and self._components is None
+            and self._input_dim > self.pca_dims
+            and self._size >= 2 * self.pca_dims
+        ):
+            self._fit_pca()
+            fitted = True
+        return seqs, fitted
+
+    def merge(
+        self,
+        entry_id: str,
+        document: str,
+        recommendation: str,
+        embedding: List[float],
+        ret: Optional[float] = None,
+    ):
+        """Replace an entry's lesson and embedding with a newer near-duplicate one."""
+        with self._lock:
+            self._merge(entry_id, document, recommendation, embedding, ret)
+            if self.path:
+                self._log(
+                    {
+                        "op": "merge",
+                        "id": entry_id,
+                        "document": document,
+                        "recommendation": recommendation,
+                        "embedding": np.asarray(embedding, dtype=np.float32).tolist(),
+                        "return": ret,
+                    }
+                )
+
+    def _merge(self, entry_id, document, recommendation, embedding, ret):
+        i = self._index(entry_id)
+        self._matrix[i : i + 1], self._scales[i : i + 1] = self._encode(self._project(embedding))
+        self.documents[i] = document
+        self.recommendations[i] = recommendation
+        self.metadata[i] = _merge_metadata(self.metadata[i], ret)
+
+    def delete(self, ids: List[str]):
+        if not ids:
+            return
+        with self._lock:
+            self._delete(ids)
+            if self.path:
+                self._log({"op": "delete", "ids": list(ids)})
+
+    def _delete(self, ids):
+        removed = {int(entry_id) for entry_id in ids}
+        keep = [i for i, metadata in enumerate(self.metadata) if metadata["seq"] not in removed]
+        self._matrix[: len(keep)] = self._matrix[keep]
+        self._scales[: len(keep)] = self._scales[keep]
+        self._size = len(keep)
+        self.documents = [self.documents[i] for i in keep]
+        self.recommendations = [self.recommendations[i] for i in keep]
+        self.metadata = [self.metadata[i] for i in keep]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Bookkeeping for every stored lesson, used to pick eviction victims."""
+        with self._lock:
+            return [
+                {
+                    "id": str(metadata["seq"]),
+                    "seq": metadata["seq"],
+                    "retrievals": metadata["retrievals"],
+                    "return": metadata.get("return"),
+                }
+                for metadata in self.metadata
+            ]
+
+    def record_retrievals(self, ids: List[str]):
+        # Retrieval counts only matter for eviction, so they are not saved on every query
+        with self._lock:
+            for entry_id in ids:
+                self.metadata[self._index(entry_id)]["retrievals"] += 1
+
+    def _scores(self, queries: np.ndarray) -> np.ndarray:
+        if self.dtype == np.float32:
+            return queries @ self._matrix[: self._size].T
+        scores = np.empty((len(queries), self._size), dtype=np.float32)
+        for start in range(0, self._size, self.SCORE_BLOCK_ROWS):
+            end = min(start + self.SCORE_BLOCK_ROWS, self._size)
+            scores[:, start:end] = queries @ self._decode(start, end).T
+        return scores
+
+    def query_batch(self, embeddings: List[List[float]], n_results: int) -> List[List[Dict[str, Any]]]:
+        """Top matches for each query embedding, from one matrix multiply."""
+        with self._lock:
+            if not self._size:
+                return [[] for _ in embeddings]
+            scores = self._scores(self._project(embeddings))
+            k = min(n_results, self._size)
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+            matches = []
+            for row, candidates in zip(scores, top):
+                ranked = candidates[np.argsort(-row[candidates])]
+                matches.append(
+                    [
+                        {
+                            "id": str(self.metadata[i]["seq"]),
+                            "matched_situation": self.documents[i],
+                            "recommendation": self.recommendations[i],
+                            "similarity_score": float(row[i]),
+                        }
+                        for i in ranked
+                    ]
+                )
+            return matches
+
+    def query(self, embedding: List[float], n_results: int) -> List[Dict[str, Any]]:
+        return self.query_batch([embedding], n_results)[0]
+
+    def _file_stamp(self):
+        stamps = []
+        for path in (self.path, self._log_path(self._generation)):
+            try:
+                stat = os.stat(path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def is_stale(self) -> bool:
+        """Whether another writer changed the files since this store loaded them."""
+        return bool(self.path) and self._file_stamp() != self._stamp
+
+    def _log_path(self, generation: int) -> str:
+        return f"{self.path[: -len('.npz')]}.{generation}.log"
+
+    def _log(self, record: Dict[str, Any]):
+        """Record one write, or rewrite the snapshot once enough have been logged."""
+        if self._torn or self._logged + 1 >= self.COMPACT_EVERY:
+            self._save()
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self._log_path(self._generation), "a") as f:
+            f.write(json.dumps(record) + "\n")
+        self._logged += 1
+
+    def _replay(self):
+        """Apply the writes logged since the loaded snapshot."""
+        log_path = self._log_path(self._generation)
+        if not os.path.exists(log_path):
+            return
+        with open(log_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append leaves a torn last line. Readers such
+                    # as shared overlay bases must not write, so the clean
+                    # snapshot is left to this store's next write
+                    self._torn = True
+                    return
+                if record["op"] == "add":
+                    self._insert(
+                        record["documents"],
+                        record["recommendations"],
+                        record["embeddings"],
+                        record["returns"],
+                    )
+                elif record["op"] == "merge":
+                    self._merge(
+                        record["id"],
+                        record["document"],
+                        record["recommendation"],
+                        record["embedding"],
+                        record["return"],
+                    )
+                elif record["op"] == "delete":
+                    self._delete(record["ids"])
+                self._logged += 1
+
+    def _save(self):
+        # Write to a temporary file first so a crash never leaves a torn store.
+        # The new snapshot starts a new generation, so a crash before the old
+        # log is removed never replays writes the snapshot already holds.
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        buffer = io.BytesIO()
+        fitted = self._components is not None
+        previous_log = self._log_path(self._generation)
+        self._generation += 1
+        np.savez(
+            buffer,
+            matrix=self._matrix[: self._size],
+            scales=self._scales[: self._size],
+            input_dim=np.array(self._input_dim or 0),
+            mean=self._mean if fitted else np.empty(0, dtype=np.float32),
+            components=self._components if fitted else np.empty((0, 0), dtype=np.float32),
+            texts=np.array(json.dumps([self.documents, self.recommendations, self.metadata])),
+            generation=np.array(self._generation),
+            next_seq=np.array(self._next_seq),
+        )
+        with open(tmp_path, "wb") as f:
+            f.write(buffer.getvalue())
+        os.replace(tmp_path, self.path)
+        if os.path.exists(previous_log):
+            os.remove(previous_log)
+        self._logged = 0
+        self._torn = False
+
+    def _load(self):
+        with np.load(self.path) as data:
+            matrix = data["matrix"]
+            scales = data["scales"].astype(np.float32)
+            self._input_dim = int(data["input_dim"]) or None
+            if data["components"].size:
+                self._mean = data["mean"]
+                self._components = data["components"]
+            self.documents, self.recommendations, self.metadata = json.loads(str(data["texts"]))
+            # Snapshots written before the write log existed have no generation
+            self._generation = int(data["generation"]) if "generation" in data.files else 0
+            next_seq = int(data["next_seq"]) if "next_seq" in data.files else None
+        self._size = matrix.shape[0]
+        if matrix.dtype == self.dtype:
+            self._matrix, self._scales = np.ascontiguousarray(matrix), scales
+        else:
+            # Stored with another memory_dtype: re-encode into the configured one
+            vectors = matrix.astype(np.float32)
+            if matrix.dtype == np.int8:
+                vectors *= scales[:, None]
+            self._matrix, self._scales = self._encode(vectors)
+        if next_seq is None:
+            next_seq = max((metadata["seq"] for metadata in self.metadata), default=-1) + 1
+        self._next_seq = next_seq
+
+
+def measure_recall(
+    embeddings: List[List[float]],
+    queries: List[List[float]],
+    k: int = 5,
+    dtype: str = "float32",
+    pca_dims: int = 0,
+) -> float:
+    """Mean recall@k of a compact NumpyMemoryStore against exact float32 search.
+
+    Both stores are built from the same corpus; recall is the fraction of the
+    exact top-k matches that the compact store also returns.
+    """
+    exact = NumpyMemoryStore("exact", {})
+    compact = NumpyMemoryStore("compact", {"memory_dtype": dtype, "memory_pca_dims": pca_dims})
+    documents = [str(i) for i in range(len(embeddings))]
+    exact.add(documents, documents, embeddings)
+    compact.add(documents, documents, embeddings)
+
+    recalls = []
+    for expected, found in zip(exact.query_batch(queries, k), compact.query_batch(queries, k)):
+        expected_ids = {match["id"] for match in expected}
+        found_ids = {match["id"] for match in found}
+        recalls.append(len(expected_ids & found_ids) / max(1, len(expected_ids)))
+    return float(np.mean(recalls)) if recalls else 1.0
+
+
+MEMORY_BACKENDS = {
+    "chroma": ChromaMemoryStore,
+    "numpy": NumpyMemoryStore,
+}
+
+
+def memory_dir(config: Dict[str, Any]) -> str:
+    """Directory holding persistent memories."""
+    return config.get("memory_dir") or os.path.join(config["results_dir"], "memory")
+
+
+def create_memory_store(name: str, config: Dict[str, Any], persistent: bool = False):
+    """Create the vector store selected by config["memory_backend"]."""
+    backend = config.get("memory_backend", "chroma")
+    if backend not in MEMORY_BACKENDS:
+        raise ValueError(f"Unsupported memory_backend: {backend}")
+    return MEMORY_BACKENDS[backend](name, config, persistent)
+
+
+# Read-only persistent stores shared by every overlay memory, keyed by file
+_shared_stores: Dict[tuple, Any] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def open_shared_store(name: str, config: Dict[str, Any]):
+    """Persistent store loaded once per path and shared read-only across sessions.
+
+    The store is reloaded when another writer has changed it since it was
+    loaded. Callers must only query it.
+    """
+    key = (
+        config.get("memory_backend", "chroma"),
+        os.path.abspath(memory_dir(config)),
+        name,
+        config.get("memory_dtype", "float32"),
+        config.get("memory_pca_dims", 0),
+    )
+    with _shared_stores_lock:
+        store = _shared_stores.get(key)
+        if store is None or store.is_stale():
+            store = create_memory_store(name, config, persistent=True)
+            _shared_stores[key] = store
+        return store
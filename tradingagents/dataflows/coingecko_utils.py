@@ -4,9 +4,16 @@ import pandas as pd
 from typing import Annotated, Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import time
+import threading
 from .config import DATA_DIR
 import os
 
+# Responses are shared by every CoinGeckoAPI instance in the process, so
+# concurrent analyses of many coins reuse trending/global/coin list payloads.
+CACHE_TTL_SECONDS = 300
+_response_cache: Dict[tuple, tuple] = {}
+_response_cache_lock = threading.Lock()
+
 
 class CoinGeckoAPI:
     """CoinGecko API utilities for cryptocurrency data"""
@@ -70,8 +77,26 @@ class CoinGeckoAPI:
         }
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """Make API request with error handling and rate limiting"""
+        """Make API request with error handling, rate limiting and response caching"""
         url = f"{self.base_url}{endpoint}"
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+        if cached and time.time() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+
+        data = self._fetch(url, params)
+        if data:
+            now = time.time()
+            with _response_cache_lock:
+                # Drop expired entries so long backtests do not grow the cache forever
+                for key in [k for k, v in _response_cache.items() if now - v[0] >= CACHE_TTL_SECONDS]:
+                    del _response_cache[key]
+                _response_cache[cache_key] = (now, data)
+        return data
+
+    def _fetch(self, url: str, params: Dict = None) -> Dict:
+        """Fetch a URL from the API"""
         try:
             response = self.session.get(url, params=params)
             if response.status_code == 429:
@@ -0,0 +1,91 @@
+import glob
+import os
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .config import get_config
+
+
+class PriceStore:
+    """Close-price lookups backed by the local YFin CSV files.
+
+    Prices are read from the offline price store
+    (data_dir/market_data/price_data) and from the online download cache
+    (data_cache_dir), so no network access is needed once data has been fetched.
+    """
+
+    def __init__(self, search_dirs: Optional[List[str]] = None):
+        if search_dirs is None:
+            config = get_config()
+            search_dirs = [
+                os.path.join(config["data_dir"], "market_data", "price_data"),
+                config["data_cache_dir"],
+            ]
+        self.search_dirs = search_dirs
+        self._closes: Dict[str, pd.Series] = {}
+
+    def _find_price_file(self, ticker: str) -> Optional[str]:
+        """Find the most recent YFin CSV for a ticker (crypto falls back to TICKER-USD)."""
+        for symbol in (ticker, f"{ticker}-USD"):
+            for directory in self.search_dirs:
+                matches = sorted(
+                    glob.glob(os.path.join(directory, f"{symbol}-YFin-data-*.csv"))
+                )
+                if matches:
+                    return matches[-1]
+        return None
+
+    def price_file(self, ticker: str) -> str:
+        """Path of the YFin CSV a ticker's prices are read from."""
+        data_file = self._find_price_file(ticker.upper())
+        if data_file is None:
+            raise FileNotFoundError(
+                f"PriceStore: no local price data found for {ticker.upper()} in {self.search_dirs}"
+            )
+        return data_file
+
+    def get_closes(self, ticker: str) -> pd.Series:
+        """Get the close-price series of a ticker indexed by YYYY-MM-DD date strings."""
+        ticker = ticker.upper()
+        if ticker not in self._closes:
+            data = pd.read_csv(self.price_file(ticker))
+            close_col = "Adj Close" if "Adj Close" in data.columns else "Close"
+            closes = pd.Series(
+                data[close_col].astype(float).values,
+                index=data["Date"].astype(str).str[:10],
+            )
+            self._closes[ticker] = closes[~closes.index.duplicated()].sort_index()
+        return self._closes[ticker]
+
+    def trading_days(self, ticker: str, start_date: str, end_date: str) -> List[str]:
+        """Get the dates with a price for a ticker between two dates (inclusive)."""
+        dates = self.get_closes(ticker).index
+        return [d for d in dates if start_date <= d <= end_date]
+
+    def realized_return(
+        self, ticker: str, trade_date: str, holding_days: int = 1
+    ) -> Optional[float]:
+        """Get the close-to-close return from trade_date over holding_days trading days.
+
+        Returns None when the store does not cover the full holding period.
+        """
+        closes = self.get_closes(ticker)
+        entry = closes.index.searchsorted(str(trade_date))
+        exit_ = entry + holding_days
+        if entry >= len(closes) or exit_ >= len(closes):
+            return None
+        return float(closes.iloc[exit_] / closes.iloc[entry] - 1)
+
+    def exit_date(
+        self, ticker: str, trade_date: str, holding_days: int = 1
+    ) -> Optional[str]:
+        """Get the date a position entered on trade_date is closed after holding_days.
+
+        Returns None when the store does not cover the full holding period.
+        """
+        closes = self.get_closes(ticker)
+        exit_ = closes.index.searchsorted(str(trade_date)) + holding_days
+        if exit_ >= len(closes):
+            return None
+        return closes.index[exit_]
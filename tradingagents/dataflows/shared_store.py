@@ -0,0 +1,165 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .price_store import PriceStore
+
+
+class MemmapPriceStore:
+    """Read-only price store backed by memory-mapped NumPy arrays.
+
+    The store is built once from a PriceStore and then opened by any number of
+    worker processes. Pages are shared through the OS page cache, so workers
+    do not each parse the CSV files or hold their own copy of the prices.
+    Offers the same lookups as PriceStore (trading_days, realized_return,
+    exit_date).
+
+    Besides the close series used to score decisions, the store keeps every
+    column of each ticker's YFin CSV. read_price_csv serves the dataflows'
+    price and indicator readers from it in processes where
+    config["shared_price_store_dir"] points at the store.
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self._arrays: Dict[str, tuple] = {}
+        self._columns: Dict[str, list] = {}
+        files_path = os.path.join(store_dir, "files.json")
+        self._files = {}
+        if os.path.exists(files_path):
+            with open(files_path) as f:
+                self._files = json.load(f)
+
+    @classmethod
+    def build(
+        cls,
+        store_dir: str,
+        tickers: List[str],
+        source: Optional[PriceStore] = None,
+    ) -> "MemmapPriceStore":
+        """Write the close series and CSV columns of each ticker to the store and open it."""
+        source = source or PriceStore()
+        os.makedirs(store_dir, exist_ok=True)
+        files = {}
+        for ticker in tickers:
+            ticker = ticker.upper()
+            closes = source.get_closes(ticker)
+            dates = np.array(closes.index.values, dtype="datetime64[D]")
+            np.save(cls._path(store_dir, ticker, "dates"), dates)
+            np.save(cls._path(store_dir, ticker, "close"), closes.values.astype(np.float64))
+
+            price_file = source.price_file(ticker)
+            data = pd.read_csv(price_file)
+            for i, column in enumerate(data.columns):
+                values = data[column].to_numpy()
+                if values.dtype.kind not in "biuf":
+                    values = values.astype(str)
+                np.save(cls._path(store_dir, ticker, f"column{i}"), values)
+            files[os.path.abspath(price_file)] = {
+                "ticker": ticker,
+                "columns": [str(column) for column in data.columns],
+            }
+        tmp_path = os.path.join(store_dir, "files.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(files, f)
+        os.replace(tmp_path, os.path.join(store_dir, "files.json"))
+        return cls(store_dir)
+
+    @staticmethod
+    def _path(store_dir: str, ticker: str, field: str) -> str:
+        return os.path.join(store_dir, f"{ticker.upper()}.{field}.npy")
+
+    def _load(self, ticker: str) -> tuple:
+        ticker = ticker.upper()
+        if ticker not in self._arrays:
+            dates_path = self._path(self.store_dir, ticker, "dates")
+            if not os.path.exists(dates_path):
+                raise FileNotFoundError(
+                    f"MemmapPriceStore: {ticker} is not in the store at {self.store_dir}"
+                )
+            self._arrays[ticker] = (
+                np.load(dates_path, mmap_mode="r"),
+                np.load(self._path(self.store_dir, ticker, "close"), mmap_mode="r"),
+            )
+        return self._arrays[ticker]
+
+    def trading_days(self, ticker: str, start_date: str, end_date: str) -> List[str]:
+        """Get the dates with a price for a ticker between two dates (inclusive)."""
+        dates, _ = self._load(ticker)
+        lo = np.searchsorted(dates, np.datetime64(start_date, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end_date, "D"), side="right")
+        return [str(d) for d in dates[lo:hi]]
+
+    def realized_return(
+        self, ticker: str, trade_date: str, holding_days: int = 1
+    ) -> Optional[float]:
+        """Get the close-to-close return from trade_date over holding_days trading days.
+
+        Returns None when the store does not cover the full holding period.
+        """
+        dates, closes = self._load(ticker)
+        entry = int(np.searchsorted(dates, np.datetime64(str(trade_date), "D")))
+        exit_ = entry + holding_days
+        if entry >= len(closes) or exit_ >= len(closes):
+            return None
+        return float(closes[exit_] / closes[entry] - 1)
+
+    def exit_date(
+        self, ticker: str, trade_date: str, holding_days: int = 1
+    ) -> Optional[str]:
+        """Get the date a position entered on trade_date is closed after holding_days.
+
+        Returns None when the store does not cover the full holding period.
+        """
+        dates, _ = self._load(ticker)
+        exit_ = int(np.searchsorted(dates, np.datetime64(str(trade_date), "D"))) + holding_days
+        if exit_ >= len(dates):
+            return None
+        return str(dates[exit_])
+
+    def frame(self, path: str) -> Optional[pd.DataFrame]:
+        """The CSV at path as pd.read_csv would return it, or None if it is not stored."""
+        entry = self._files.get(os.path.abspath(path))
+        if entry is None:
+            return None
+        ticker = entry["ticker"]
+        if ticker not in self._columns:
+            self._columns[ticker] = [
+                np.load(self._path(self.store_dir, ticker, f"column{i}"), mmap_mode="r")
+                for i in range(len(entry["columns"]))
+            ]
+        return pd.DataFrame(
+            {
+                column: values if values.dtype.kind in "biuf" else values.astype(object)
+                for column, values in zip(entry["columns"], self._columns[ticker])
+            }
+        )
+
+
+# Stores opened in this process, keyed by directory
+_open_stores: Dict[str, MemmapPriceStore] = {}
+_open_stores_lock = threading.Lock()
+
+
+def open_price_store(store_dir: str) -> MemmapPriceStore:
+    """Open a shared price store once per process."""
+    store_dir = os.path.abspath(store_dir)
+    with _open_stores_lock:
+        if store_dir not in _open_stores:
+            _open_stores[store_dir] = MemmapPriceStore(store_dir)
+        return _open_stores[store_dir]
+
+
+def read_price_csv(path: str) -> pd.DataFrame:
+    """Read a YFin price CSV, from the shared price store when it holds the file."""
+    store_dir = get_config().get("shared_price_store_dir")
+    if store_dir:
+        frame = open_price_store(store_dir).frame(path)
+        if frame is not None:
+            return frame
+    return pd.read_csv(path)
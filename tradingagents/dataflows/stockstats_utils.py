@@ -4,6 +4,7 @@ from stockstats import wrap
 from typing import Annotated
 import os
 from .config import get_config
+from .shared_store import read_price_csv
 
 
 class StockstatsUtils:
@@ -30,7 +31,7 @@ class StockstatsUtils:
 
         if not online:
             try:
-                data = pd.read_csv(
+                data = read_price_csv(
                     os.path.join(
                         data_dir,
                         f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
@@ -19,10 +19,80 @@ DEFAULT_CONFIG = {
     "backend_url": os.getenv("LLM_URL", "https://llm.chutes.ai/v1"),
     "embeddings_url": os.getenv("EMBEDDINGS_URL", "https://chutes-qwen-qwen3-embedding-8b.chutes.ai/v1/embeddings"),
     "api_key": os.getenv("OPENAI_API_KEY", ""),
+    # "remote" uses embeddings_url (or Ollama); "local" uses the built-in
+    # feature-hashing embedder, as does embeddings_url="local://hashing?dim=N"
+    "embedding_provider": os.getenv("EMBEDDING_PROVIDER", "remote"),
+    "local_embedding_dim": 1024,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Debate turns shown verbatim in prompts; older turns are folded into a
+    # rolling summary. 0 shows the full history.
+    "debate_history_window": 0,
+    # Condense the analyst reports once into a digest that the debaters use
+    # instead of the four full reports
+    "report_digest": False,
     # Tool settings
     "online_tools": True,
+    # Memory-mapped MemmapPriceStore directory the offline price and indicator
+    # tools read from instead of the YFin CSVs (set by sharded backtests)
+    "shared_price_store_dir": None,
+    # Batch settings
+    "max_llm_concurrency": 4,
+    # Persist graph state under results_dir so failed runs can be resumed
+    "checkpointing": False,
+    # Cross-session analyst report cache (results_dir/report_cache.sqlite).
+    # Reports for past dates are kept permanently, today's expire after the TTL.
+    "report_cache": False,
+    "report_cache_ttl": 3600,
+    # Have the Risk Judge return a typed decision (action, confidence,
+    # position size, horizon) via structured output
+    "structured_decision": False,
+    # Cache chat model responses in results_dir/llm_cache.sqlite so identical
+    # requests in reruns and backtests are served locally. llm_cache_ttl is in
+    # seconds (0 = never expire); llm_cache_nodes limits caching to the named
+    # graph nodes, e.g. ["Market Analyst", "Bull Researcher"] (None = all calls).
+    "llm_cache": False,
+    "llm_cache_ttl": 0,
+    "llm_cache_nodes": None,
+    # Persistent embedding cache (embedding_cache_dir or results_dir /
+    # embedding_cache.sqlite), evicted least recently used above max_bytes.
+    # float16 halves the size at a small precision cost.
+    "embedding_cache_persist": False,
+    "embedding_cache_dir": None,
+    "embedding_cache_max_bytes": 512 * 1024 * 1024,
+    "embedding_cache_dtype": "float32",
+    # Texts sent per embeddings request when memories are loaded in bulk
+    "embedding_batch_size": 32,
+    # Situations longer than embedding_chunk_size characters are embedded in
+    # chunks (at most embedding_max_workers requests at once, each under
+    # embedding_max_request_chars) and pooled by "mean" or "max". 0 (the
+    # default) disables chunking; pooled vectors differ from whole-text ones,
+    # so enable it only for new persistent memories, e.g. with 4000.
+    "embedding_chunk_size": 0,
+    "embedding_pooling": "mean",
+    "embedding_max_request_chars": 64000,
+    "embedding_max_workers": 4,
+    # Agent memory: "ephemeral" (in-memory, lost on exit), "persistent"
+    # (on-disk under memory_dir or results_dir/memory, loaded on startup) or
+    # "overlay" (read-only persistent base plus a per-session in-memory overlay)
+    "memory_mode": "ephemeral",
+    "memory_dir": None,
+    # Vector store for agent memory: "chroma" or "numpy" (in-process matrix,
+    # much faster to start for memories of a few thousand situations)
+    "memory_backend": "chroma",
+    # Bound memory growth in long backtests: at most memory_capacity lessons
+    # per memory (0 = unlimited), evicted by "oldest", "least_retrieved" or
+    # "smallest_move" (smallest absolute return); new lessons at or above memory_dedup_threshold cosine
+    # similarity replace their nearest neighbour (0 = keep all)
+    "memory_capacity": 0,
+    "memory_eviction": "oldest",
+    "memory_dedup_threshold": 0,
+    # Compact vector storage for the numpy memory backend: "float32",
+    # "float16" or "int8" (per-vector scale), optionally reduced to
+    # memory_pca_dims principal components (0 = off). Check the accuracy cost
+    # with memory_store.measure_recall or benchmarks/bench_memory_compression.py.
+    "memory_dtype": "float32",
+    "memory_pca_dims": 0,
 }
@@ -6,6 +6,8 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .backtest import Backtester
+from .factory import GraphFactory, GraphSession
 
 __all__ = [
     "TradingAgentsGraph",
@@ -14,4 +16,7 @@ __all__ = [
     "Propagator",
     "Reflector",
     "SignalProcessor",
+    "Backtester",
+    "GraphFactory",
+    "GraphSession",
 ]
@@ -0,0 +1,205 @@
+# TradingAgents/graph/backtest.py
+
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from tradingagents.dataflows.price_store import PriceStore
+
+
+POSITION_BY_ACTION = {"BUY": 1, "HOLD": 0, "SELL": -1}
+
+
+def normalize_action(decision: str) -> str:
+    """Reduce a processed signal to BUY, SELL or HOLD (HOLD when unclear)."""
+    match = re.search(r"\b(BUY|SELL|HOLD)\b", str(decision).upper())
+    return match.group(1) if match else "HOLD"
+
+
+# State fields the Reflector reads, kept for reflections applied later
+REFLECTION_FIELDS = (
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+    "investment_debate_state",
+    "trader_investment_plan",
+    "risk_debate_state",
+)
+
+
+class Backtester:
+    """Walk-forward backtest driver with checkpoint and resume.
+
+    For each trade date and ticker the driver runs ``propagate``, computes the
+    realized return from the local price store and checkpoints the step.
+    Restarting a run with the same checkpoint path skips every step that has
+    already been completed.
+
+    A step's return is only known once its holding period ends, so its
+    reflection is queued and passed to ``reflect_and_remember`` when the walk
+    reaches the exit date; until then no decision can read the lesson. Queued
+    reflections are kept in the checkpoint. Lessons already applied live in
+    the graph's memories, so give the graph persistent memory (memory_mode
+    "persistent") for resumed runs to keep them.
+    """
+
+    def __init__(
+        self,
+        graph,
+        checkpoint_path: str,
+        price_store: Optional[PriceStore] = None,
+        holding_days: int = 1,
+        reflect: bool = True,
+    ):
+        """Initialize the backtester.
+
+        Args:
+            graph: TradingAgentsGraph used to produce decisions
+            checkpoint_path: JSON file that records completed steps
+            price_store: Source of close prices. Defaults to the local YFin store.
+            holding_days: Trading days between entry and exit of each position
+            reflect: Whether to reflect on each step once its return is realized
+        """
+        self.graph = graph
+        self.checkpoint_path = checkpoint_path
+        self.price_store = price_store or PriceStore()
+        self.holding_days = holding_days
+        self.reflect = reflect
+
+    def plan(self, tickers: List[str], start_date: str, end_date: str) -> List[tuple]:
+        """List the (trade_date, ticker) steps of a run in walk-forward order."""
+        steps = []
+        for ticker in tickers:
+            for trade_date in self.price_store.trading_days(ticker, start_date, end_date):
+                steps.append((trade_date, ticker))
+        return sorted(steps)
+
+    def run(
+        self, tickers: List[str], start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
+        """Run (or resume) the backtest and return one record per step."""
+        params = {
+            "tickers": list(tickers),
+            "start_date": start_date,
+            "end_date": end_date,
+            "holding_days": self.holding_days,
+        }
+        checkpoint = self._load_checkpoint(params)
+        completed = checkpoint["completed"]
+
+        for trade_date, ticker in self.plan(tickers, start_date, end_date):
+            key = f"{ticker}|{trade_date}"
+            if key in completed:
+                continue
+
+            self._apply_reflections(checkpoint, trade_date)
+            completed[key] = self.run_step(ticker, trade_date, checkpoint["pending"])
+            self._save_checkpoint(checkpoint)
+
+        # Past the last trade date nothing reads the memories in this run
+        self._apply_reflections(checkpoint)
+
+        return sorted(
+            completed.values(), key=lambda r: (r["trade_date"], r["ticker"])
+        )
+
+    def run_step(
+        self, ticker: str, trade_date: str, pending: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Propagate and score a single (ticker, trade_date) step.
+
+        When reflecting, the step's reflection is appended to pending, to be
+        applied once the walk reaches its exit date.
+        """
+        start = time.perf_counter()
+        final_state, decision = self.graph.propagate(ticker, trade_date)
+        action = normalize_action(decision)
+
+        market_return = self.price_store.realized_return(
+            ticker, trade_date, self.holding_days
+        )
+        position = POSITION_BY_ACTION[action]
+        strategy_return = None if market_return is None else position * market_return
+
+        if self.reflect and strategy_return is not None and pending is not None:
+            pending.append(
+                {
+                    "ticker": ticker,
+                    "trade_date": trade_date,
+                    "exit_date": self.price_store.exit_date(
+                        ticker, trade_date, self.holding_days
+                    ),
+                    "strategy_return": strategy_return,
+                    "state": {field: final_state.get(field) for field in REFLECTION_FIELDS},
+                }
+            )
+
+        return {
+            "ticker": ticker,
+            "trade_date": trade_date,
+            "decision": action,
+            "position": position,
+            "market_return": market_return,
+            "strategy_return": strategy_return,
+            "elapsed": time.perf_counter() - start,
+        }
+
+    def _apply_reflections(self, checkpoint: Dict[str, Any], trade_date: Optional[str] = None):
+        """Reflect on queued steps whose exit date is at or before trade_date (all if None).
+
+        Each applied reflection is removed from the queue and checkpointed
+        right away, so a resumed run does not apply it twice.
+        """
+        pending = checkpoint["pending"]
+        while pending:
+            due = [
+                entry
+                for entry in pending
+                if trade_date is None or entry["exit_date"] <= trade_date
+            ]
+            if not due:
+                return
+            entry = min(due, key=lambda e: (e["exit_date"], e["trade_date"], e["ticker"]))
+            self.graph.reflect_and_remember(entry["strategy_return"], state=entry["state"])
+            pending.remove(entry)
+            self._save_checkpoint(checkpoint)
+
+    def _load_checkpoint(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Load the checkpoint for a run, or start a new one."""
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+            if checkpoint["params"] != params:
+                raise ValueError(
+                    f"Backtest checkpoint {self.checkpoint_path} was created with "
+                    f"different parameters: {checkpoint['params']}"
+                )
+            checkpoint.setdefault("pending", [])
+            return checkpoint
+        return {"params": params, "completed": {}, "pending": []}
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Atomically write the checkpoint so a crash never leaves it half-written."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f, indent=4)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def summarize_backtest(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute aggregate statistics for a list of backtest records."""
+    scored = [r for r in records if r["strategy_return"] is not None]
+    total = 1.0
+    for r in scored:
+        total *= 1 + r["strategy_return"]
+    wins = [r for r in scored if r["strategy_return"] > 0]
+    return {
+        "steps": len(records),
+        "scored_steps": len(scored),
+        "cumulative_return": total - 1,
+        "hit_rate": len(wins) / len(scored) if scored else 0.0,
+    }
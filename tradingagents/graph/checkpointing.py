@@ -0,0 +1,85 @@
+# TradingAgents/graph/checkpointing.py
+
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, List
+
+# Config keys that change what a run produces; runs that differ in any of them
+# must not resume from each other's checkpoints.
+CHECKPOINT_CONFIG_KEYS = (
+    "llm_provider",
+    "deep_think_llm",
+    "quick_think_llm",
+    "backend_url",
+    "max_debate_rounds",
+    "max_risk_discuss_rounds",
+    "language",
+    "online_tools",
+    "structured_decision",
+    "debate_history_window",
+    "report_digest",
+)
+
+
+def create_checkpointer(results_dir: str):
+    """Create a SQLite checkpointer stored at results_dir/checkpoints.sqlite."""
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "Checkpointing requires the langgraph-checkpoint-sqlite package. "
+            "Install it with: pip install langgraph-checkpoint-sqlite"
+        ) from e
+
+    os.makedirs(results_dir, exist_ok=True)
+    conn = sqlite3.connect(
+        os.path.join(results_dir, "checkpoints.sqlite"), check_same_thread=False
+    )
+    return SqliteSaver(conn)
+
+
+def compute_config_hash(config: Dict[str, Any], selected_analysts: List[str]) -> str:
+    """Hash the parts of the config that determine a run's output."""
+    payload = {key: config.get(key) for key in CHECKPOINT_CONFIG_KEYS}
+    payload["selected_analysts"] = list(selected_analysts)
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def make_thread_id(company_name: str, trade_date: str, config_hash: str) -> str:
+    """Build the checkpoint thread id for a (ticker, trade_date, config) run."""
+    return f"{company_name}:{trade_date}:{config_hash}"
+
+
+# Stages a completed run can be branched from: the first node that is re-run
+# and the state fields recomputed from that node on. Everything else (notably
+# the analyst reports) is reused from the source run.
+BRANCH_STAGES = {
+    "investment_debate": (
+        "Bull Researcher",
+        [
+            "investment_debate_state",
+            "investment_plan",
+            "trader_investment_plan",
+            "risk_debate_state",
+            "final_trade_decision",
+            "trade_decision",
+        ],
+    ),
+    "trader": (
+        "Trader",
+        [
+            "trader_investment_plan",
+            "risk_debate_state",
+            "final_trade_decision",
+            "trade_decision",
+        ],
+    ),
+    "risk_debate": (
+        "Risky Analyst",
+        ["risk_debate_state", "final_trade_decision", "trade_decision"],
+    ),
+}
@@ -0,0 +1,68 @@
+# TradingAgents/graph/concurrency.py
+
+import threading
+import time
+from typing import Any, Dict
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class LLMConcurrencyLimiter(BaseCallbackHandler):
+    """Callback handler that caps the number of in-flight LLM calls.
+
+    A single limiter is shared by every job of a batch run, so the total number
+    of concurrent requests sent to the provider stays bounded no matter how many
+    graph runs are active at the same time.
+    """
+
+    run_inline = True
+    raise_error = True
+
+    def __init__(self, max_concurrency: int):
+        """Initialize with the maximum number of concurrent LLM calls."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._active_runs = set()
+        self._queue_times: Dict[UUID, float] = {}
+
+    def _acquire(self, run_id: UUID):
+        start = time.perf_counter()
+        self._semaphore.acquire()
+        with self._lock:
+            self._active_runs.add(run_id)
+            self._queue_times[run_id] = time.perf_counter() - start
+
+    def _release(self, run_id: UUID):
+        with self._lock:
+            if run_id not in self._active_runs:
+                return
+            self._active_runs.discard(run_id)
+            self._queue_times.pop(run_id, None)
+        self._semaphore.release()
+
+    def queue_time(self, run_id: UUID) -> float:
+        """Seconds an in-flight LLM call waited for its slot."""
+        with self._lock:
+            return self._queue_times.get(run_id, 0.0)
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages, *, run_id: UUID, **kwargs):
+        self._acquire(run_id)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts, *, run_id: UUID, **kwargs):
+        self._acquire(run_id)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+        self._release(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs):
+        self._release(run_id)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of LLM calls currently holding a slot."""
+        with self._lock:
+            return len(self._active_runs)
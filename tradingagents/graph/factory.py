@@ -0,0 +1,158 @@
+# TradingAgents/graph/factory.py
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List
+
+from .trading_graph import TradingAgentsGraph
+
+# Config keys read while a graph is built (LLM clients, memories, caches,
+# checkpointer and workflow); sessions that agree on all of them (and on the
+# selected analysts) can share one compiled graph.
+GRAPH_CONFIG_KEYS = (
+    # Chat models
+    "llm_provider",
+    "quick_think_llm",
+    "deep_think_llm",
+    "backend_url",
+    "api_key",
+    "language",
+    "research_depth",
+    # Workflow
+    "max_debate_rounds",
+    "max_risk_discuss_rounds",
+    "max_llm_concurrency",
+    "online_tools",
+    "structured_decision",
+    "debate_history_window",
+    "report_digest",
+    # Caches and checkpointing
+    "project_dir",
+    "results_dir",
+    "data_dir",
+    "report_cache",
+    "report_cache_ttl",
+    "llm_cache",
+    "llm_cache_ttl",
+    "llm_cache_nodes",
+    "checkpointing",
+    # Memories and their embeddings
+    "embeddings_url",
+    "embedding_provider",
+    "local_embedding_dim",
+    "embedding_cache_persist",
+    "embedding_cache_dir",
+    "embedding_cache_max_bytes",
+    "embedding_cache_dtype",
+    "embedding_batch_size",
+    "embedding_chunk_size",
+    "embedding_pooling",
+    "embedding_max_request_chars",
+    "embedding_max_workers",
+    "memory_mode",
+    "memory_dir",
+    "memory_backend",
+    "memory_capacity",
+    "memory_eviction",
+    "memory_dedup_threshold",
+    "memory_dtype",
+    "memory_pca_dims",
+)
+
+
+class GraphSession:
+    """Per-session view of a pooled graph.
+
+    The compiled graph, LLM clients, toolkit and memories belong to the pool;
+    the session only holds the state of its own run.
+    """
+
+    def __init__(self, graph: TradingAgentsGraph, session_id: str):
+        self.graph = graph
+        self.session_id = session_id
+        self.final_state = None
+
+    @property
+    def propagator(self):
+        return self.graph.propagator
+
+    def stream(self, company_name: str, trade_date: str, **graph_args) -> Iterator[Dict[str, Any]]:
+        """Stream a run of the pooled graph, keeping the last state on the session.
+
+        With several stream modes (e.g. stream_mode=["values", "messages"] for
+        token streaming) chunks are (mode, payload) tuples.
+        """
+        init_agent_state = self.propagator.create_initial_state(company_name, trade_date)
+        args = self.propagator.get_graph_args(**graph_args)
+        multi_mode = isinstance(args["stream_mode"], list)
+        for chunk in self.graph.graph.stream(init_agent_state, **args):
+            if not multi_mode:
+                self.final_state = chunk
+            elif chunk[0] == "values":
+                self.final_state = chunk[1]
+            yield chunk
+
+
+class GraphFactory:
+    """Keeps warm TradingAgentsGraph instances keyed by their build settings.
+
+    Building a graph creates chat model clients, a toolkit, five memories and
+    compiles the workflow, which takes seconds. The factory does this once per
+    distinct (analysts, models, language, depth) combination and hands out
+    lightweight GraphSession objects afterwards.
+    """
+
+    def __init__(self, max_graphs: int = 8):
+        self.max_graphs = max_graphs
+        self._graphs: "OrderedDict[str, TradingAgentsGraph]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def make_key(selected_analysts: List[str], config: Dict[str, Any]) -> str:
+        """Build the pool key for a set of analysts and a config."""
+        payload = {key: config.get(key) for key in GRAPH_CONFIG_KEYS}
+        payload["selected_analysts"] = list(selected_analysts)
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+
+    def get_graph(
+        self, selected_analysts: List[str], config: Dict[str, Any]
+    ) -> TradingAgentsGraph:
+        """Get a pooled graph, building it on first use."""
+        key = self.make_key(selected_analysts, config)
+        with self._lock:
+            if key in self._graphs:
+                self._graphs.move_to_end(key)
+                return self._graphs[key]
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        # Build outside the pool lock so other keys are not blocked
+        with build_lock:
+            with self._lock:
+                if key in self._graphs:
+                    return self._graphs[key]
+
+            # Memory collections belong to the pool entry, not to one session
+            pooled_config = {**config, "session_id": f"pool_{key}"}
+            graph = TradingAgentsGraph(selected_analysts, debug=False, config=pooled_config)
+
+            with self._lock:
+                self._graphs[key] = graph
+                while len(self._graphs) > self.max_graphs:
+                    evicted_key, _ = self._graphs.popitem(last=False)
+                    self._build_locks.pop(evicted_key, None)
+        return graph
+
+    def create_session(
+        self, selected_analysts: List[str], config: Dict[str, Any], session_id: str
+    ) -> GraphSession:
+        """Get a session backed by a pooled graph."""
+        return GraphSession(self.get_graph(selected_analysts, config), session_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._graphs)
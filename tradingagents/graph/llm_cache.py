@@ -0,0 +1,127 @@
+# TradingAgents/graph/llm_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+# Graph node currently running, set by create_cache_scoped_node
+_current_node: ContextVar[Optional[str]] = ContextVar("llm_cache_node", default=None)
+# Whether the latest lookup in this context was a hit, read by RunProfiler
+_last_lookup_hit: ContextVar[bool] = ContextVar("llm_cache_last_hit", default=False)
+
+
+def consume_cache_hit() -> bool:
+    """Whether the LLM call that just finished was served from the cache.
+
+    LangChain looks the response up and reports the end of the call in the
+    same context, so this is read from the call's on_llm_end callback.
+    """
+    hit = _last_lookup_hit.get()
+    if hit:
+        _last_lookup_hit.set(False)
+    return hit
+
+
+class LLMResponseCache(BaseCache):
+    """SQLite-backed LangChain cache of chat model responses.
+
+    LangChain keys each lookup by the serialized messages and the model's
+    llm_string, which covers the provider, model name, temperature and bound
+    tools, so only byte-identical requests hit. Entries older than
+    ttl_seconds are ignored (0 keeps them forever).
+
+    With nodes set, only calls made while one of those graph nodes runs are
+    cached; other calls go straight to the model.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 0, nodes: Optional[Iterable[str]] = None):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.nodes = set(nodes) if nodes is not None else None
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, generations TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        # A connection per operation keeps the cache safe across threads and processes
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def is_enabled(self) -> bool:
+        """Whether the current call should use the cache."""
+        return self.nodes is None or _current_node.get() in self.nodes
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        # Cleared on every lookup so a miss is never reported as an earlier hit
+        _last_lookup_hit.set(False)
+        if not self.is_enabled():
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT generations, created_at FROM responses WHERE key = ?",
+                (self.make_key(prompt, llm_string),),
+            ).fetchone()
+        if row is None or (self.ttl_seconds and time.time() - row[1] > self.ttl_seconds):
+            self._count("misses")
+            return None
+        self._count("hits")
+        _last_lookup_hit.set(True)
+        return [loads(generation) for generation in json.loads(row[0])]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        if not self.is_enabled():
+            return
+        generations = json.dumps([dumps(generation) for generation in return_val])
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, generations, created_at) VALUES (?, ?, ?)",
+                (self.make_key(prompt, llm_string), generations, time.time()),
+            )
+        self._count("writes")
+
+    def clear(self, **kwargs: Any) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get hit/miss/write counts and the hit rate."""
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+def create_cache_scoped_node(node, name: str):
+    """Wrap a graph node so LLM calls inside it are attributed to the node."""
+
+    def cache_scoped_node(state):
+        token = _current_node.set(name)
+        try:
+            return node(state)
+        finally:
+            _current_node.reset(token)
+
+    return cache_scoped_node
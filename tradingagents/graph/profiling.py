@@ -0,0 +1,298 @@
+# TradingAgents/graph/profiling.py
+
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .llm_cache import consume_cache_hit
+
+
+def _payload_size(payload: Any) -> int:
+    """Approximate serialized size of a node or tool payload in bytes."""
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    try:
+        return len(json.dumps(payload, default=str, ensure_ascii=False).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(payload).encode("utf-8"))
+
+
+def _token_usage(response) -> Tuple[int, int]:
+    """Prompt and completion tokens reported for an LLM call."""
+    prompt = completion = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt += usage.get("input_tokens", 0)
+                completion += usage.get("output_tokens", 0)
+    if prompt or completion:
+        return prompt, completion
+    usage = (response.llm_output or {}).get("token_usage") or {}
+    return usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+
+
+def _new_node_stats() -> Dict[str, float]:
+    return {
+        "calls": 0,
+        "wall_seconds": 0.0,
+        "input_bytes": 0,
+        "output_bytes": 0,
+        "errors": 0,
+        "llm_calls": 0,
+        "llm_seconds": 0.0,
+        "llm_queue_seconds": 0.0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "prompt_bytes": 0,
+        "completion_bytes": 0,
+        "llm_cache_hits": 0,
+        "llm_errors": 0,
+    }
+
+
+def _new_tool_stats() -> Dict[str, float]:
+    return {
+        "calls": 0,
+        "wall_seconds": 0.0,
+        "input_bytes": 0,
+        "output_bytes": 0,
+        "errors": 0,
+    }
+
+
+class RunProfiler(BaseCallbackHandler):
+    """Callback handler that records where the time of a graph run goes.
+
+    Per graph node it records wall time, payload sizes and the node's LLM
+    calls (time, time queued behind the concurrency limiter, prompt and
+    completion tokens and response cache hits); per tool it records
+    calls, wall time and payload sizes.
+    """
+
+    run_inline = True
+
+    def __init__(self, limiter=None):
+        """Initialize, optionally with the LLMConcurrencyLimiter of the run."""
+        self.limiter = limiter
+        self.nodes: Dict[str, Dict[str, float]] = defaultdict(_new_node_stats)
+        self.tools: Dict[str, Dict[str, float]] = defaultdict(_new_tool_stats)
+        self._runs: Dict[UUID, Tuple[str, str, float]] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._finished = None
+
+    def _start(self, run_id: UUID, kind: str, name: str):
+        with self._lock:
+            self._runs[run_id] = (kind, name, time.perf_counter())
+
+    def _end(self, run_id: UUID, kind: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None or run[0] != kind:
+            return None
+        return run[1], time.perf_counter() - run[2]
+
+    # Graph nodes
+
+    def on_chain_start(self, serialized, inputs, *, run_id: UUID, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        # Only the node's own run, not the runnables nested inside it
+        if node is None or kwargs.get("name") != node:
+            return
+        self._start(run_id, "node", node)
+        size = _payload_size(inputs)
+        with self._lock:
+            self.nodes[node]["input_bytes"] += size
+
+    def on_chain_end(self, outputs, *, run_id: UUID, **kwargs):
+        ended = self._end(run_id, "node")
+        if ended is None:
+            return
+        node, seconds = ended
+        size = _payload_size(outputs)
+        with self._lock:
+            stats = self.nodes[node]
+            stats["calls"] += 1
+            stats["wall_seconds"] += seconds
+            stats["output_bytes"] += size
+        self._finished = time.perf_counter()
+
+    def on_chain_error(self, error, *, run_id: UUID, **kwargs):
+        ended = self._end(run_id, "node")
+        if ended is None:
+            return
+        node, seconds = ended
+        with self._lock:
+            self.nodes[node]["errors"] += 1
+            self.nodes[node]["wall_seconds"] += seconds
+
+    # LLM calls
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node", "(outside graph)")
+        self._start(run_id, "llm", node)
+        size = sum(_payload_size(message.content) for batch in messages for message in batch)
+        with self._lock:
+            self.nodes[node]["prompt_bytes"] += size
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node", "(outside graph)")
+        self._start(run_id, "llm", node)
+        with self._lock:
+            self.nodes[node]["prompt_bytes"] += sum(_payload_size(prompt) for prompt in prompts)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+        ended = self._end(run_id, "llm")
+        if ended is None:
+            return
+        node, seconds = ended
+        queued = self.limiter.queue_time(run_id) if self.limiter is not None else 0.0
+        cached = consume_cache_hit()
+        prompt_tokens, completion_tokens = (0, 0) if cached else _token_usage(response)
+        completion_bytes = sum(
+            _payload_size(generation.text)
+            for generations in response.generations
+            for generation in generations
+        )
+        with self._lock:
+            stats = self.nodes[node]
+            stats["llm_calls"] += 1
+            stats["llm_seconds"] += seconds - queued
+            stats["llm_queue_seconds"] += queued
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+            stats["completion_bytes"] += completion_bytes
+            stats["llm_cache_hits"] += int(cached)
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+        ended = self._end(run_id, "llm")
+        if ended is None:
+            return
+        with self._lock:
+            self.nodes[ended[0]]["llm_errors"] += 1
+
+    # Tool calls
+
+    def on_tool_start(self, serialized, input_str, *, run_id: UUID, **kwargs):
+        name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        self._start(run_id, "tool", name)
+        size = _payload_size(input_str)
+        with self._lock:
+            self.tools[name]["input_bytes"] += size
+
+    def on_tool_end(self, output, *, run_id: UUID, **kwargs):
+        ended = self._end(run_id, "tool")
+        if ended is None:
+            return
+        name, seconds = ended
+        size = _payload_size(getattr(output, "content", output))
+        with self._lock:
+            stats = self.tools[name]
+            stats["calls"] += 1
+            stats["wall_seconds"] += seconds
+            stats["output_bytes"] += size
+
+    def on_tool_error(self, error, *, run_id: UUID, **kwargs):
+        ended = self._end(run_id, "tool")
+        if ended is None:
+            return
+        name, seconds = ended
+        with self._lock:
+            self.tools[name]["errors"] += 1
+            self.tools[name]["wall_seconds"] += seconds
+
+    def profile(self, ticker: str = None, trade_date: str = None) -> Dict[str, Any]:
+        """Structured profile of the run so far, with totals across nodes."""
+        with self._lock:
+            nodes = {name: dict(stats) for name, stats in self.nodes.items()}
+            tools = {name: dict(stats) for name, stats in self.tools.items()}
+        totals = _new_node_stats()
+        for stats in nodes.values():
+            for key, value in stats.items():
+                totals[key] += value
+        end = self._finished or time.perf_counter()
+        return {
+            "ticker": ticker,
+            "trade_date": str(trade_date) if trade_date is not None else None,
+            "wall_seconds": end - self._started,
+            "totals": totals,
+            "nodes": nodes,
+            "tools": tools,
+        }
+
+
+class MetricsRegistry:
+    """Process-wide counters fed from run profiles, exported in Prometheus text format."""
+
+    # (metric, help, source key) for per-node counters
+    NODE_METRICS = [
+        ("tradingagents_node_calls_total", "Graph node executions", "calls"),
+        ("tradingagents_node_seconds_total", "Wall time spent in graph nodes", "wall_seconds"),
+        ("tradingagents_node_errors_total", "Graph node failures", "errors"),
+        ("tradingagents_node_input_bytes_total", "Serialized node input size", "input_bytes"),
+        ("tradingagents_node_output_bytes_total", "Serialized node output size", "output_bytes"),
+        ("tradingagents_llm_calls_total", "LLM calls", "llm_calls"),
+        ("tradingagents_llm_seconds_total", "Time spent in LLM calls, excluding queueing", "llm_seconds"),
+        ("tradingagents_llm_queue_seconds_total", "Time LLM calls waited for a concurrency slot", "llm_queue_seconds"),
+        ("tradingagents_llm_prompt_tokens_total", "Prompt tokens sent to the LLM", "prompt_tokens"),
+        ("tradingagents_llm_completion_tokens_total", "Completion tokens received from the LLM", "completion_tokens"),
+        ("tradingagents_llm_cache_hits_total", "LLM calls served from the response cache", "llm_cache_hits"),
+        ("tradingagents_llm_errors_total", "Failed LLM calls", "llm_errors"),
+    ]
+    TOOL_METRICS = [
+        ("tradingagents_tool_calls_total", "Tool calls", "calls"),
+        ("tradingagents_tool_seconds_total", "Wall time spent in tools", "wall_seconds"),
+        ("tradingagents_tool_errors_total", "Failed tool calls", "errors"),
+        ("tradingagents_tool_output_bytes_total", "Tool output size", "output_bytes"),
+    ]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = defaultdict(float)
+        self._help = {
+            "tradingagents_runs_total": "Completed graph runs",
+            "tradingagents_run_seconds_total": "Wall time of completed graph runs",
+        }
+        for metric, help_text, _ in self.NODE_METRICS + self.TOOL_METRICS:
+            self._help[metric] = help_text
+
+    def record(self, profile: Dict[str, Any]):
+        """Add a run profile to the counters."""
+        with self._lock:
+            self._values[("tradingagents_runs_total", ())] += 1
+            self._values[("tradingagents_run_seconds_total", ())] += profile["wall_seconds"]
+            for node, stats in profile["nodes"].items():
+                for metric, _, key in self.NODE_METRICS:
+                    self._values[(metric, (("node", node),))] += stats[key]
+            for tool, stats in profile["tools"].items():
+                for metric, _, key in self.TOOL_METRICS:
+                    self._values[(metric, (("tool", tool),))] += stats[key]
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def render(self) -> str:
+        """Render all counters in the Prometheus text exposition format."""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = []
+        current = None
+        for (metric, labels), value in values:
+            if metric != current:
+                lines.append(f"# HELP {metric} {self._help.get(metric, metric)}")
+                lines.append(f"# TYPE {metric} counter")
+                current = metric
+            label_text = ",".join(f'{key}="{self._escape(val)}"' for key, val in labels)
+            lines.append(f"{metric}{{{label_text}}} {value}" if label_text else f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# Shared by every graph in the process; the web app exports it at /metrics
+RUN_METRICS = MetricsRegistry()
@@ -24,7 +24,14 @@ class Propagator:
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
             "investment_debate_state": InvestDebateState(
-                {"history": "", "current_response": "", "count": 0}
+                {
+                    "history": "",
+                    "current_response": "",
+                    "turns": [],
+                    "summary": "",
+                    "summarized_turns": 0,
+                    "count": 0,
+                }
             ),
             "risk_debate_state": RiskDebateState(
                 {
@@ -32,6 +39,9 @@ class Propagator:
                     "current_risky_response": "",
                     "current_safe_response": "",
                     "current_neutral_response": "",
+                    "turns": [],
+                    "summary": "",
+                    "summarized_turns": 0,
                     "count": 0,
                 }
             ),
@@ -39,11 +49,21 @@ class Propagator:
             "fundamentals_report": "",
             "sentiment_report": "",
             "news_report": "",
+            "situation_digest": "",
         }
 
-    def get_graph_args(self) -> Dict[str, Any]:
-        """Get arguments for the graph invocation."""
+    def get_graph_args(self, callbacks=None, thread_id=None, stream_mode="values") -> Dict[str, Any]:
+        """Get arguments for the graph invocation.
+
+        stream_mode can be a list such as ["values", "messages"] to also stream
+        LLM tokens; the graph then yields (mode, payload) tuples.
+        """
+        config = {"recursion_limit": self.max_recur_limit}
+        if callbacks:
+            config["callbacks"] = callbacks
+        if thread_id:
+            config["configurable"] = {"thread_id": thread_id}
         return {
-            "stream_mode": "values",
-            "config": {"recursion_limit": self.max_recur_limit},
+            "stream_mode": stream_mode,
+            "config": config,
         }
@@ -0,0 +1,114 @@
+# TradingAgents/graph/report_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import date
+from typing import Optional
+
+from langchain_core.messages import AIMessage
+
+# State field written by each analyst type
+ANALYST_REPORT_FIELDS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+
+class ReportCache:
+    """SQLite-backed cache of analyst reports shared across sessions.
+
+    Reports for past trade dates never change and are kept permanently. Reports
+    for today (or later) are live and expire after ttl_seconds.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS reports ("
+                "key TEXT PRIMARY KEY, report TEXT NOT NULL, "
+                "created_at REAL NOT NULL, live INTEGER NOT NULL)"
+            )
+
+    def _connect(self):
+        # A connection per operation keeps the cache safe across threads and processes
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_key(
+        ticker: str,
+        trade_date: str,
+        analyst: str,
+        model: str,
+        language: str,
+        data_signature: str,
+    ) -> str:
+        """Hash everything an analyst report depends on into a cache key."""
+        payload = [ticker.upper(), str(trade_date), analyst, model, language, data_signature]
+        return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_live(trade_date: str) -> bool:
+        """Whether data for a trade date can still change."""
+        return str(trade_date) >= date.today().isoformat()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a stored report, or None when missing or expired."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT report, created_at, live FROM reports WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        report, created_at, live = row
+        if live and time.time() - created_at > self.ttl_seconds:
+            return None
+        return report
+
+    def put(self, key: str, trade_date: str, report: str):
+        """Store a report."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO reports (key, report, created_at, live) "
+                "VALUES (?, ?, ?, ?)",
+                (key, report, time.time(), int(self.is_live(trade_date))),
+            )
+
+
+def create_cached_analyst(
+    node, analyst_type: str, cache: ReportCache, model: str, language: str, data_signature: str
+):
+    """Wrap an analyst node so it returns a stored report on a cache hit.
+
+    On a hit the node emits the report as a plain AIMessage without tool calls,
+    so the graph moves straight on to the analyst's message-clear node.
+    """
+    report_field = ANALYST_REPORT_FIELDS[analyst_type]
+
+    def cached_analyst_node(state):
+        key = cache.make_key(
+            state["company_of_interest"],
+            state["trade_date"],
+            analyst_type,
+            model,
+            language,
+            data_signature,
+        )
+        report = cache.get(key)
+        if report is not None:
+            return {"messages": [AIMessage(content=report)], report_field: report}
+
+        result = node(state)
+        if result.get(report_field):
+            cache.put(key, state["trade_date"], result[report_field])
+        return result
+
+    return cached_analyst_node
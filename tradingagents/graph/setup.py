@@ -1,5 +1,7 @@
 # TradingAgents/graph/setup.py
 
+import json
+import os
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
@@ -10,6 +12,8 @@ from tradingagents.agents.utils.agent_states import AgentState
 from tradingagents.agents.utils.agent_utils import Toolkit
 
 from .conditional_logic import ConditionalLogic
+from .llm_cache import create_cache_scoped_node
+from .report_cache import ReportCache, create_cached_analyst
 
 
 class GraphSetup:
@@ -28,6 +32,7 @@ class GraphSetup:
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
         language_prompt: str = "",
+        config: Dict[str, Any] = None,
     ):
         """Initialize with required components."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -41,9 +46,12 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
         self.language_prompt = language_prompt
+        self.config = config or {}
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        checkpointer=None,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -53,6 +61,8 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            checkpointer: Optional LangGraph checkpointer that persists the state
+                after every node so interrupted runs can be resumed
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -90,46 +100,101 @@ class GraphSetup:
             delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
+        # Serve analyst reports from the cross-session cache when enabled
+        if self.config.get("report_cache"):
+            report_cache = ReportCache(
+                os.path.join(self.config["results_dir"], "report_cache.sqlite"),
+                ttl_seconds=self.config.get("report_cache_ttl", 3600),
+            )
+            # The model itself is part of the key already
+            data_signature = json.dumps(
+                {
+                    "online_tools": self.config.get("online_tools"),
+                    "llm_provider": self.config.get("llm_provider"),
+                    "backend_url": self.config.get("backend_url"),
+                    "data_dir": os.path.abspath(self.config.get("data_dir", "")),
+                },
+                sort_keys=True,
+            )
+            for analyst_type in list(analyst_nodes):
+                analyst_nodes[analyst_type] = create_cached_analyst(
+                    analyst_nodes[analyst_type],
+                    analyst_type,
+                    report_cache,
+                    self.config.get("quick_think_llm", ""),
+                    self.config.get("language", "english"),
+                    data_signature,
+                )
+
         # Create researcher and manager nodes
+        history_window = self.config.get("debate_history_window", 0)
         bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory, self.language_prompt
+            self.quick_thinking_llm, self.bull_memory, self.language_prompt, history_window
         )
         bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory, self.language_prompt
+            self.quick_thinking_llm, self.bear_memory, self.language_prompt, history_window
         )
         research_manager_node = create_research_manager(
-            self.deep_thinking_llm, self.invest_judge_memory, self.language_prompt
+            self.deep_thinking_llm,
+            self.invest_judge_memory,
+            self.language_prompt,
+            history_window,
         )
         trader_node = create_trader(self.quick_thinking_llm, self.trader_memory, self.language_prompt)
 
         # Create risk analysis nodes
-        risky_analyst = create_risky_debator(self.quick_thinking_llm, self.language_prompt)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm, self.language_prompt)
-        safe_analyst = create_safe_debator(self.quick_thinking_llm, self.language_prompt)
+        risky_analyst = create_risky_debator(
+            self.quick_thinking_llm, self.language_prompt, history_window
+        )
+        neutral_analyst = create_neutral_debator(
+            self.quick_thinking_llm, self.language_prompt, history_window
+        )
+        safe_analyst = create_safe_debator(
+            self.quick_thinking_llm, self.language_prompt, history_window
+        )
         risk_manager_node = create_risk_manager(
-            self.deep_thinking_llm, self.risk_manager_memory, self.language_prompt
+            self.deep_thinking_llm,
+            self.risk_manager_memory,
+            self.language_prompt,
+            structured_output=self.config.get("structured_decision", False),
+            history_window=history_window,
         )
 
+        use_digest = self.config.get("report_digest", False)
+
         # Create workflow
         workflow = StateGraph(AgentState)
 
+        # With per-node LLM caching, nodes record their name for the cache
+        scope_llm_cache = self.config.get("llm_cache") and self.config.get("llm_cache_nodes") is not None
+
+        def add_node(name, node):
+            if scope_llm_cache:
+                node = create_cache_scoped_node(node, name)
+            workflow.add_node(name, node)
+
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+            add_node(f"{analyst_type.capitalize()} Analyst", node)
             workflow.add_node(
                 f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
             )
             workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
         # Add other nodes
-        workflow.add_node("Bull Researcher", bull_researcher_node)
-        workflow.add_node("Bear Researcher", bear_researcher_node)
-        workflow.add_node("Research Manager", research_manager_node)
-        workflow.add_node("Trader", trader_node)
-        workflow.add_node("Risky Analyst", risky_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Safe Analyst", safe_analyst)
-        workflow.add_node("Risk Judge", risk_manager_node)
+        add_node("Bull Researcher", bull_researcher_node)
+        add_node("Bear Researcher", bear_researcher_node)
+        add_node("Research Manager", research_manager_node)
+        add_node("Trader", trader_node)
+        add_node("Risky Analyst", risky_analyst)
+        add_node("Neutral Analyst", neutral_analyst)
+        add_node("Safe Analyst", safe_analyst)
+        add_node("Risk Judge", risk_manager_node)
+        if use_digest:
+            add_node(
+                "Report Digest",
+                create_report_digester(self.quick_thinking_llm, self.language_prompt),
+            )
 
         # Define edges
         # Start with the first analyst
@@ -150,10 +215,14 @@ class GraphSetup:
             )
             workflow.add_edge(current_tools, current_analyst)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
+            # Connect to next analyst, or to the researchers (through the
+            # report digest when enabled) if this is the last analyst
             if i < len(selected_analysts) - 1:
                 next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
                 workflow.add_edge(current_clear, next_analyst)
+            elif use_digest:
+                workflow.add_edge(current_clear, "Report Digest")
+                workflow.add_edge("Report Digest", "Bull Researcher")
             else:
                 workflow.add_edge(current_clear, "Bull Researcher")
 
@@ -204,4 +273,4 @@ class GraphSetup:
         workflow.add_edge("Risk Judge", END)
 
         # Compile and return
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
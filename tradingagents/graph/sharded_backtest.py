@@ -0,0 +1,108 @@
+# TradingAgents/graph/sharded_backtest.py
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from tradingagents.dataflows.shared_store import MemmapPriceStore, open_price_store
+
+from .backtest import Backtester
+
+# Per-process settings and price store, set once by the pool initializer
+_worker_settings: Dict[str, Any] = {}
+
+
+def _init_worker(config, selected_analysts, store_dir, holding_days):
+    """Open the shared price store inside a worker process."""
+    _worker_settings.update(
+        config=config,
+        selected_analysts=selected_analysts,
+        store_dir=store_dir,
+        price_store=open_price_store(store_dir),
+        holding_days=holding_days,
+    )
+
+
+def _run_ticker(ticker, start_date, end_date, checkpoint_path, memory_dir):
+    """Run the steps of one ticker with its own checkpoint file and memories.
+
+    Memories are persistent so a resumed ticker keeps the lessons it had
+    learned; each ticker writes its own memory_dir, so workers never share a
+    store file.
+    """
+    from .trading_graph import TradingAgentsGraph
+
+    config = {
+        **_worker_settings["config"],
+        "memory_mode": "persistent",
+        "memory_dir": memory_dir,
+        # The agents' price and indicator tools read from the shared store too
+        "shared_price_store_dir": _worker_settings["store_dir"],
+    }
+    graph = TradingAgentsGraph(_worker_settings["selected_analysts"], config=config)
+    backtester = Backtester(
+        graph,
+        checkpoint_path,
+        price_store=_worker_settings["price_store"],
+        holding_days=_worker_settings["holding_days"],
+    )
+    return backtester.run([ticker], start_date, end_date)
+
+
+def run_sharded_backtest(
+    config: Dict[str, Any],
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    output_dir: str,
+    num_workers: int = 4,
+    holding_days: int = 1,
+    selected_analysts=["market", "social", "news", "fundamentals"],
+) -> List[Dict[str, Any]]:
+    """Run a backtest sharded by ticker across a process pool.
+
+    Each ticker is one task, so every ticker's dates stay in one process and
+    its reflections happen in walk-forward order. Each ticker's YFin prices are
+    written once to a memory-mapped store under output_dir; all workers score
+    decisions from it, and their agents' price and indicator tools read it
+    instead of parsing the CSV files in every process. News and fundamentals
+    are still read by each worker. Each ticker checkpoints to output_dir/shards/{ticker}.json
+    and keeps persistent memories under output_dir/memory/{ticker}, so an
+    interrupted sweep resumes per ticker with any number of workers. Results
+    are merged into output_dir/decision_log.json ordered by
+    (trade_date, ticker), independent of completion order.
+
+    Returns:
+        The merged list of backtest records.
+    """
+    tickers = sorted({ticker.upper() for ticker in tickers})
+    store_dir = os.path.join(output_dir, "price_store")
+    MemmapPriceStore.build(store_dir, tickers)
+
+    # spawn avoids forking a parent that may already hold threads and DB clients
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(num_workers, len(tickers))),
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(config, selected_analysts, store_dir, holding_days),
+    ) as pool:
+        futures = [
+            pool.submit(
+                _run_ticker,
+                ticker,
+                start_date,
+                end_date,
+                os.path.join(output_dir, "shards", f"{ticker}.json"),
+                os.path.join(output_dir, "memory", ticker),
+            )
+            for ticker in tickers
+        ]
+        records = [record for future in futures for record in future.result()]
+
+    records.sort(key=lambda r: (r["trade_date"], r["ticker"]))
+    with open(os.path.join(output_dir, "decision_log.json"), "w") as f:
+        json.dump(records, f, indent=4)
+    return records
@@ -1,25 +1,91 @@
 # TradingAgents/graph/signal_processing.py
 
+import re
+import threading
+from typing import Dict, Optional
+
 from langchain_openai import ChatOpenAI
 
 
+# Action words the agents use, in English and Thai. The bare Thai "ถือ" is
+# left out: it also starts unrelated words such as "ถือว่า" ("considered").
+ACTION_WORDS = {
+    "BUY": ["BUY", "ซื้อ"],
+    "SELL": ["SELL", "ขาย"],
+    "HOLD": ["HOLD", "ถือครอง", "คงสถานะ"],
+}
+_WORD_TO_ACTION = {
+    word: action for action, words in ACTION_WORDS.items() for word in words
+}
+# English words need word boundaries and must not be part of a hyphenated
+# compound ("sell-off", "buy-side"); Thai is written without spaces
+_ACTION_PATTERN = "|".join(
+    rf"(?<!-)\b{word}\b(?!-)" if word.isascii() else word
+    for word in sorted(_WORD_TO_ACTION, key=len, reverse=True)
+)
+_DECISION_VALUE = rf"\s*[:：]?\s*[*_\"'\s]*({_ACTION_PATTERN})(?!\s*/)"
+
+# "FINAL TRANSACTION PROPOSAL: **BUY**", which closes every agent's answer
+_FINAL_PROPOSAL = re.compile(
+    r"(?:\bFINAL\s+TRANSACTION\s+PROPOSAL|ข้อเสนอการทำธุรกรรมขั้นสุดท้าย)" + _DECISION_VALUE,
+    re.IGNORECASE,
+)
+# "Recommendation: Sell", "Final decision: HOLD", "คำแนะนำ: **ซื้อ**"
+_LABELLED_DECISION = re.compile(
+    r"(?:\bFINAL\s+(?:DECISION|RECOMMENDATION)\b|\bRECOMMENDATION\b|\bDECISION\b"
+    r"|การตัดสินใจ(?:ขั้นสุดท้าย)?|คำแนะนำ)" + _DECISION_VALUE,
+    re.IGNORECASE,
+)
+_BOLD_DECISION = re.compile(rf"\*\*\s*({_ACTION_PATTERN})\s*\*\*", re.IGNORECASE)
+
+
+def parse_decision(text: str) -> Optional[str]:
+    """Extract BUY, SELL or HOLD from agent output without an LLM call.
+
+    A FINAL TRANSACTION PROPOSAL takes precedence over any other label, and
+    the last one wins. Otherwise the last labelled decision wins, and without
+    one, bolded action words are used if they all agree. Returns None when the
+    text is ambiguous.
+    """
+    for pattern in (_FINAL_PROPOSAL, _LABELLED_DECISION):
+        labelled = pattern.findall(text)
+        if labelled:
+            return _WORD_TO_ACTION[labelled[-1].upper()]
+
+    bolded = {_WORD_TO_ACTION[word.upper()] for word in _BOLD_DECISION.findall(text)}
+    if len(bolded) == 1:
+        return bolded.pop()
+    return None
+
+
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
 
     def __init__(self, quick_thinking_llm: ChatOpenAI):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        self.stats = {"parsed": 0, "llm_fallback": 0}
+        self._stats_lock = threading.Lock()
 
     def process_signal(self, full_signal: str) -> str:
         """
         Process a full trading signal to extract the core decision.
 
+        The decision is parsed deterministically when possible; the LLM is only
+        asked when the text is ambiguous.
+
         Args:
             full_signal: Complete trading signal text
 
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
+        decision = parse_decision(full_signal)
+        if decision is not None:
+            self._count("parsed")
+            return decision
+
+        self._count("llm_fallback")
         messages = [
             (
                 "system",
@@ -28,4 +94,23 @@ class SignalProcessor:
             ("human", full_signal),
         ]
 
-        return self.quick_thinking_llm.invoke(messages).content
+        content = self.quick_thinking_llm.invoke(messages).content
+        return parse_decision(f"Decision: {content}") or content
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    @property
+    def fallback_rate(self) -> float:
+        """Fraction of processed signals that needed the LLM fallback."""
+        with self._stats_lock:
+            total = self.stats["parsed"] + self.stats["llm_fallback"]
+            return self.stats["llm_fallback"] / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get parse/fallback counts and the fallback rate."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["fallback_rate"] = self.fallback_rate
+        return stats
@@ -1,10 +1,12 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import time
 from pathlib import Path
 import json
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Tuple, List, Optional, Iterable, Iterator
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -15,6 +17,7 @@ from langgraph.prebuilt import ToolNode
 from tradingagents.agents import *
 from tradingagents.dataflows.config import get_config
 from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.embedding_cache import DiskEmbeddingCache, EmbeddingCache
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -22,7 +25,16 @@ from tradingagents.agents.utils.agent_states import (
 )
 from tradingagents.dataflows.interface import set_config
 
+from .checkpointing import (
+    BRANCH_STAGES,
+    compute_config_hash,
+    create_checkpointer,
+    make_thread_id,
+)
+from .concurrency import LLMConcurrencyLimiter
 from .conditional_logic import ConditionalLogic
+from .llm_cache import LLMResponseCache
+from .profiling import RUN_METRICS, RunProfiler
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
@@ -47,6 +59,7 @@ class TradingAgentsGraph:
         """
         self.debug = debug
         self.config = config or get_config()
+        self.selected_analysts = list(selected_analysts)
 
         # Update the interface's config
         set_config(self.config)
@@ -61,55 +74,47 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
-        # Initialize LLMs
-        if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(
-                model=self.config["deep_think_llm"], 
-                base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
-            )
-            self.quick_thinking_llm = ChatOpenAI(
-                model=self.config["quick_think_llm"], 
-                base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
-            )
-        elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(
-                model=self.config["deep_think_llm"], 
-                base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
-            )
-            self.quick_thinking_llm = ChatAnthropic(
-                model=self.config["quick_think_llm"], 
-                base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
-            )
-        elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(
-                model=self.config["deep_think_llm"],
-                google_api_key=self.config["api_key"]
+        # Cache of chat model responses shared by both LLMs when enabled
+        self.llm_cache = None
+        if self.config.get("llm_cache"):
+            self.llm_cache = LLMResponseCache(
+                os.path.join(self.config["results_dir"], "llm_cache.sqlite"),
+                ttl_seconds=self.config.get("llm_cache_ttl", 0),
+                nodes=self.config.get("llm_cache_nodes"),
             )
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(
-                model=self.config["quick_think_llm"],
-                google_api_key=self.config["api_key"]
-            )
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
-        
+
+        # Initialize LLMs
+        self.deep_thinking_llm, self.quick_thinking_llm = self._create_llms(self.config)
+
         self.toolkit = Toolkit(config=self.config)
 
-        # Initialize memories
-        self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
-        self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
-        self.trader_memory = FinancialSituationMemory("trader_memory", self.config)
-        self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
-        self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
+        # Initialize memories; they share one embedding cache so each distinct
+        # situation is embedded once per run rather than once per agent
+        disk_embedding_cache = None
+        if self.config.get("embedding_cache_persist"):
+            disk_embedding_cache = DiskEmbeddingCache(
+                os.path.join(
+                    self.config.get("embedding_cache_dir") or self.config["results_dir"],
+                    "embedding_cache.sqlite",
+                ),
+                max_bytes=self.config.get("embedding_cache_max_bytes", 512 * 1024 * 1024),
+                dtype=self.config.get("embedding_cache_dtype", "float32"),
+            )
+        self.embedding_cache = EmbeddingCache(backing=disk_embedding_cache)
+        self.bull_memory = FinancialSituationMemory("bull_memory", self.config, self.embedding_cache)
+        self.bear_memory = FinancialSituationMemory("bear_memory", self.config, self.embedding_cache)
+        self.trader_memory = FinancialSituationMemory("trader_memory", self.config, self.embedding_cache)
+        self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config, self.embedding_cache)
+        self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config, self.embedding_cache)
 
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
 
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
+        self.conditional_logic = ConditionalLogic(
+            max_debate_rounds=self.config["max_debate_rounds"],
+            max_risk_discuss_rounds=self.config["max_risk_discuss_rounds"],
+        )
         self.graph_setup = GraphSetup(
             self.quick_thinking_llm,
             self.deep_thinking_llm,
@@ -122,6 +127,7 @@ class TradingAgentsGraph:
             self.risk_manager_memory,
             self.conditional_logic,
             self.language_prompt,
+            config=self.config,
         )
 
         self.propagator = Propagator()
@@ -133,8 +139,62 @@ class TradingAgentsGraph:
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
 
+        # Persist state after every node so failed runs can be resumed
+        self.checkpointer = None
+        self.config_hash = compute_config_hash(self.config, self.selected_analysts)
+        if self.config.get("checkpointing"):
+            self.checkpointer = create_checkpointer(self.config["results_dir"])
+
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts, checkpointer=self.checkpointer
+        )
+
+    def _create_llms(self, config):
+        """Create the deep and quick thinking chat models for a config."""
+        # Responses are served from the LLM cache when it is enabled
+        cache_kwargs = {"cache": self.llm_cache} if self.llm_cache is not None else {}
+        if config["llm_provider"].lower() == "openai" or config["llm_provider"] == "ollama" or config["llm_provider"] == "openrouter":
+            deep_thinking_llm = ChatOpenAI(
+                model=config["deep_think_llm"], 
+                base_url=config["backend_url"],
+                api_key=config["api_key"],
+                **cache_kwargs,
+            )
+            quick_thinking_llm = ChatOpenAI(
+                model=config["quick_think_llm"], 
+                base_url=config["backend_url"],
+                api_key=config["api_key"],
+                **cache_kwargs,
+            )
+        elif config["llm_provider"].lower() == "anthropic":
+            deep_thinking_llm = ChatAnthropic(
+                model=config["deep_think_llm"], 
+                base_url=config["backend_url"],
+                api_key=config["api_key"],
+                **cache_kwargs,
+            )
+            quick_thinking_llm = ChatAnthropic(
+                model=config["quick_think_llm"], 
+                base_url=config["backend_url"],
+                api_key=config["api_key"],
+                **cache_kwargs,
+            )
+        elif config["llm_provider"].lower() == "google":
+            deep_thinking_llm = ChatGoogleGenerativeAI(
+                model=config["deep_think_llm"],
+                google_api_key=config["api_key"],
+                **cache_kwargs,
+            )
+            quick_thinking_llm = ChatGoogleGenerativeAI(
+                model=config["quick_think_llm"],
+                google_api_key=config["api_key"],
+                **cache_kwargs,
+            )
+        else:
+            raise ValueError(f"Unsupported LLM provider: {config['llm_provider']}")
+
+        return deep_thinking_llm, quick_thinking_llm
 
     def _set_language_prompts(self):
         """Set language-specific prompts for AI responses."""
@@ -209,16 +269,238 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def propagate(self, company_name, trade_date, return_profile=False):
+        """Run the trading agents graph for a company on a specific date.
+
+        The run is profiled per node and tool, and the profile is written next
+        to the state log. With return_profile=True it is also returned as a
+        third element.
+        """
 
         self.ticker = company_name
 
+        profiler = RunProfiler()
+        final_state = self._run_graph(company_name, trade_date, callbacks=[profiler])
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state
+        self._log_state(trade_date, final_state)
+        profile = self._finish_profile(profiler, company_name, trade_date)
+
+        # Return decision and processed signal
+        if return_profile:
+            return final_state, self.get_signal(final_state), profile
+        return final_state, self.get_signal(final_state)
+
+    def propagate_many(
+        self,
+        items: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+        max_llm_concurrency: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Run the graph for many (ticker, trade_date) jobs concurrently.
+
+        Jobs share the compiled graph, LLM clients and data caches, but each one
+        gets its own state and state log. A single limiter caps the number of
+        in-flight LLM calls across all jobs.
+
+        Args:
+            items: Iterable of (company_name, trade_date) pairs
+            max_concurrency: Maximum number of jobs running at the same time
+            max_llm_concurrency: Maximum number of concurrent LLM calls across
+                all jobs. Defaults to config["max_llm_concurrency"], or to
+                max_concurrency when that is not set.
+
+        Yields:
+            One dict per job, in completion order, with the keys ticker,
+            trade_date, final_state, decision, elapsed (seconds), profile
+            (see RunProfiler.profile) and error (None on success).
+        """
+        if max_llm_concurrency is None:
+            max_llm_concurrency = (
+                self.config.get("max_llm_concurrency") or max_concurrency
+            )
+        limiter = LLMConcurrencyLimiter(max_llm_concurrency)
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            futures = [
+                executor.submit(self._run_job, company_name, trade_date, limiter)
+                for company_name, trade_date in items
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Drop jobs that have not started if the caller stops iterating early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def branch(
+        self,
+        company_name,
+        trade_date,
+        stage: str,
+        config_overrides: Optional[Dict[str, Any]] = None,
+    ):
+        """Fork a completed, checkpointed run at a stage and re-run from there.
+
+        The analyst reports (and any stage before the fork point) are taken from
+        the stored run, so only the forked stages spend LLM calls. The branch is
+        checkpointed under its own thread id, so repeating the same what-if
+        returns the stored result.
+
+        Args:
+            company_name: Ticker of the source run
+            trade_date: Trade date of the source run
+            stage: One of "investment_debate", "trader" or "risk_debate"
+            config_overrides: Config values for the branch, e.g.
+                {"max_debate_rounds": 3} or {"deep_think_llm": "..."}
+
+        Returns:
+            Final state and processed signal of the branch, like propagate
+        """
+        if self.checkpointer is None:
+            raise ValueError("Branching requires config['checkpointing'] to be enabled")
+        if stage not in BRANCH_STAGES:
+            raise ValueError(
+                f"Unknown branch stage '{stage}'. Options: {', '.join(BRANCH_STAGES)}"
+            )
+
+        source_args = self.propagator.get_graph_args(
+            thread_id=make_thread_id(company_name, trade_date, self.config_hash)
+        )
+        source = self.graph.get_state(source_args["config"])
+        if not source.values or source.next:
+            raise ValueError(
+                f"No completed checkpointed run for {company_name} on {trade_date} to branch from"
+            )
+
+        branch_config = {**self.config, **(config_overrides or {})}
+        branch_hash = compute_config_hash(branch_config, self.selected_analysts)
+        args = self.propagator.get_graph_args(
+            thread_id=f"{make_thread_id(company_name, trade_date, branch_hash)}:branch:{stage}"
+        )
+        branch_graph = self._create_branch_graph(branch_config)
+
+        snapshot = branch_graph.get_state(args["config"])
+        if not snapshot.values:
+            first_node, reset_fields = BRANCH_STAGES[stage]
+            initial_state = self.propagator.create_initial_state(company_name, trade_date)
+            values = {k: v for k, v in source.values.items() if k != "messages"}
+            for field in reset_fields:
+                values[field] = initial_state.get(field, "")
+            last_analyst_node = (
+                "Report Digest"
+                if branch_config.get("report_digest")
+                else f"Msg Clear {self.selected_analysts[-1].capitalize()}"
+            )
+            predecessor = {
+                "Bull Researcher": last_analyst_node,
+                "Trader": "Research Manager",
+                "Risky Analyst": "Trader",
+            }[first_node]
+            branch_graph.update_state(args["config"], values, as_node=predecessor)
+            snapshot = branch_graph.get_state(args["config"])
+
+        if snapshot.next:
+            final_state = branch_graph.invoke(None, **args)
+        else:
+            final_state = snapshot.values
+
+        return final_state, self.get_signal(final_state)
+
+    def _create_branch_graph(self, branch_config):
+        """Compile a graph for a branch config, sharing memories, tools and checkpointer."""
+        deep_thinking_llm, quick_thinking_llm = self._create_llms(branch_config)
+        conditional_logic = ConditionalLogic(
+            max_debate_rounds=branch_config["max_debate_rounds"],
+            max_risk_discuss_rounds=branch_config["max_risk_discuss_rounds"],
+        )
+        graph_setup = GraphSetup(
+            quick_thinking_llm,
+            deep_thinking_llm,
+            self.toolkit,
+            self.tool_nodes,
+            self.bull_memory,
+            self.bear_memory,
+            self.trader_memory,
+            self.invest_judge_memory,
+            self.risk_manager_memory,
+            conditional_logic,
+            self.language_prompt,
+            config=branch_config,
+        )
+        return graph_setup.setup_graph(
+            self.selected_analysts, checkpointer=self.checkpointer
+        )
+
+    def _run_job(self, company_name, trade_date, limiter):
+        """Run a single batch job in isolation and time it."""
+        start = time.perf_counter()
+        result = {
+            "ticker": company_name,
+            "trade_date": str(trade_date),
+            "final_state": None,
+            "decision": None,
+            "elapsed": 0.0,
+            "profile": None,
+            "error": None,
+        }
+        # The profiler goes first so it sees each LLM call's queue time
+        # before the limiter releases the call's slot
+        profiler = RunProfiler(limiter)
+        try:
+            final_state = self._run_graph(
+                company_name, trade_date, callbacks=[profiler, limiter]
+            )
+            self._write_state_log(
+                company_name,
+                trade_date,
+                {str(trade_date): self._build_state_log(final_state)},
+            )
+            result["final_state"] = final_state
+            result["decision"] = self.get_signal(final_state)
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["profile"] = self._finish_profile(profiler, company_name, trade_date)
+        result["elapsed"] = time.perf_counter() - start
+        return result
+
+    def _finish_profile(self, profiler, ticker, trade_date):
+        """Record a run profile in the process metrics and save it next to the state log."""
+        profile = profiler.profile(ticker, trade_date)
+        RUN_METRICS.record(profile)
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"run_profile_{trade_date}.json", "w") as f:
+            json.dump(profile, f, indent=4)
+        return profile
+
+    def _run_graph(self, company_name, trade_date, callbacks=None):
+        """Invoke the compiled graph and return the final state.
+
+        With checkpointing enabled, runs are keyed by (ticker, trade_date,
+        config hash): an interrupted run resumes from its last completed node
+        and a completed run returns its stored final state.
+        """
+
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
+        thread_id = None
+        if self.checkpointer is not None:
+            thread_id = make_thread_id(company_name, trade_date, self.config_hash)
+        args = self.propagator.get_graph_args(callbacks=callbacks, thread_id=thread_id)
+
+        if thread_id is not None:
+            snapshot = self.graph.get_state(args["config"])
+            if snapshot.next:
+                # Resume from the last completed node
+                init_agent_state = None
+            elif snapshot.values:
+                return snapshot.values
 
         if self.debug:
             # Debug mode with tracing
@@ -230,29 +512,26 @@ class TradingAgentsGraph:
                     chunk["messages"][-1].pretty_print()
                     trace.append(chunk)
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            return trace[-1]
 
-        # Store current state for reflection
-        self.curr_state = final_state
-
-        # Log state
-        self._log_state(trade_date, final_state)
-
-        # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        # Standard mode without tracing
+        return self.graph.invoke(init_agent_state, **args)
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        self.log_states_dict[str(trade_date)] = self._build_state_log(final_state)
+        self._write_state_log(self.ticker, trade_date, self.log_states_dict)
+
+    def _build_state_log(self, final_state):
+        """Build the JSON-serializable log entry for a final state."""
+        return {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
             "sentiment_report": final_state["sentiment_report"],
             "news_report": final_state["news_report"],
             "fundamentals_report": final_state["fundamentals_report"],
+            "situation_digest": final_state.get("situation_digest", ""),
             "investment_debate_state": {
                 "bull_history": final_state["investment_debate_state"]["bull_history"],
                 "bear_history": final_state["investment_debate_state"]["bear_history"],
@@ -274,36 +553,54 @@ class TradingAgentsGraph:
             },
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
+            "trade_decision": final_state.get("trade_decision"),
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+    def _write_state_log(self, ticker, trade_date, log_states_dict):
+        """Save state log entries for a ticker to its JSON log file."""
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(log_states_dict, f, indent=4)
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+    def reflect_and_remember(self, returns_losses, state=None):
+        """Reflect on decisions and update memory based on returns.
+
+        Reflects on state, a final state from an earlier run, or on the last
+        propagated state when state is None.
+        """
+        state = self.curr_state if state is None else state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            state, returns_losses, self.risk_manager_memory
         )
 
+    def get_signal(self, final_state):
+        """Get the BUY/SELL/HOLD signal of a final state.
+
+        Uses the Risk Judge's structured decision when present, so no extra
+        signal processing is needed.
+        """
+        trade_decision = final_state.get("trade_decision")
+        if trade_decision:
+            return trade_decision["action"]
+        return self.process_signal(final_state["final_trade_decision"])
+
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Response, render_template, request, jsonify, session
 from flask_socketio import SocketIO, emit
 import datetime
 import json
@@ -9,7 +9,10 @@ from typing import Dict, List, Optional
 import os
 import re
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph
+from langchain_core.messages import AIMessageChunk
+
+from tradingagents.graph.factory import GraphFactory
+from tradingagents.graph.profiling import RUN_METRICS, RunProfiler
 from tradingagents.default_config import DEFAULT_CONFIG
 
 # Security utility for safe logging
@@ -56,6 +59,9 @@ socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 # Global storage for analysis sessions
 analysis_sessions = {}
 
+# Warm pool of compiled graphs shared by sessions with the same settings
+graph_factory = GraphFactory()
+
 class WebMessageBuffer:
     def __init__(self, session_id):
         self.session_id = session_id
@@ -108,6 +114,18 @@ class WebMessageBuffer:
                 'content': content
             }, room=self.session_id)
 
+    def add_delta(self, agent, stream_id, content, done=False):
+        """Push a partial LLM output; deltas with the same stream_id belong to one message"""
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        socketio.emit('new_message', {
+            "timestamp": timestamp,
+            "type": agent,
+            "content": content,
+            "delta": True,
+            "stream_id": stream_id,
+            "done": done,
+        }, room=self.session_id)
+
     def update_progress(self, progress, step):
         self.progress = progress
         self.current_step = step
@@ -116,6 +134,54 @@ class WebMessageBuffer:
             'step': step
         }, room=self.session_id)
 
+# Graph node names that are shown under a different agent name
+NODE_AGENT_NAMES = {"Risk Judge": "Portfolio Manager"}
+
+class TokenStreamCoalescer:
+    """Coalesces LLM token deltas into throttled new_message events.
+
+    Tokens are buffered per stream and flushed at most every flush_interval
+    seconds, or sooner once max_pending_chars are waiting, so a fast model
+    does not flood Socket.IO with one event per token. Flushing happens on
+    the graph's streaming thread, which also bounds the backlog: the graph
+    does not pull more tokens while events are being sent.
+    """
+
+    def __init__(self, buffer, flush_interval=0.1, max_pending_chars=2048):
+        self.buffer = buffer
+        self.flush_interval = flush_interval
+        self.max_pending_chars = max_pending_chars
+        self.pending = {}
+        self.pending_chars = 0
+        self.open_streams = {}
+        self.last_flush = time.monotonic()
+
+    def add(self, node, stream_id, text):
+        agent = NODE_AGENT_NAMES.get(node, node)
+        if stream_id not in self.open_streams:
+            self.open_streams[stream_id] = agent
+            if agent in self.buffer.agent_status:
+                self.buffer.update_agent_status(agent, "in_progress")
+        self.pending[stream_id] = self.pending.get(stream_id, "") + text
+        self.pending_chars += len(text)
+        if (
+            self.pending_chars >= self.max_pending_chars
+            or time.monotonic() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self, done=False):
+        """Send pending deltas; with done=True also close all open streams"""
+        for stream_id, text in self.pending.items():
+            self.buffer.add_delta(self.open_streams[stream_id], stream_id, text)
+        self.pending = {}
+        self.pending_chars = 0
+        self.last_flush = time.monotonic()
+        if done:
+            for stream_id, agent in self.open_streams.items():
+                self.buffer.add_delta(agent, stream_id, "", done=True)
+            self.open_streams = {}
+
 def cleanup_session_collections(session_id):
     """Clean up ChromaDB collections for a specific session to prevent memory leaks"""
     try:
@@ -153,6 +219,11 @@ def health_check():
         'service': 'TradingAgents Crypto'
     })
 
+@app.route('/metrics')
+def metrics():
+    """Per-node and per-tool run metrics in the Prometheus text format"""
+    return Response(RUN_METRICS.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/start_analysis', methods=['POST'])
 def start_analysis():
     data = request.json
@@ -343,29 +414,23 @@ def run_analysis_background(session_id: str, config: Dict):
             'deep_think_llm': config.get('deep_thinker', DEFAULT_CONFIG['deep_think_llm']),      # Map frontend name to backend config
             'research_depth': config['research_depth'],
             'session_id': session_id,  # Add session ID for unique memory collections
-            'language': config.get('language', 'english')  # Add language preference
+            'language': config.get('language', 'english'),  # Add language preference
+            'report_cache': True,  # Share analyst reports across sessions for the same ticker/date
         })
         
         if not is_production():
             print(f"[DEBUG] LLM provider: {updated_config['llm_provider']}")
         
-        # Initialize the graph with correct parameters
-        graph = TradingAgentsGraph(
-            selected_analysts=config['analysts'],
-            debug=False,
-            config=updated_config
+        # Get a pooled graph for these settings (built only on first use)
+        graph_session = graph_factory.create_session(
+            config['analysts'],
+            updated_config,
+            session_id
         )
         buffer.add_message("System", "Graph initialized successfully")
         
         if not is_production():
             print("[DEBUG] Graph initialized successfully")
-            print(f"[DEBUG] Creating initial state for {config['ticker']} on {config['analysis_date']}")
-        # Create initial state
-        init_state = graph.propagator.create_initial_state(
-            config['ticker'], 
-            config['analysis_date']
-        )
-        buffer.add_message("System", "Initial state created successfully")
         
         buffer.add_message("System", f"Starting analysis for {config['ticker']} on {config['analysis_date']}")
         buffer.update_progress(10, "Initializing analysis...")
@@ -376,14 +441,33 @@ def run_analysis_background(session_id: str, config: Dict):
             'analysis_date': config['analysis_date']
         }, room=session_id)
         
-        # Get graph args
-        args = graph.propagator.get_graph_args()
-        
         # Stream the analysis
         step_count = 0
         total_steps = len(config['analysts']) * 2 + 5  # Rough estimate
         
-        for chunk in graph.graph.stream(init_state, **args):
+        # Stream LLM tokens as well as node results so output appears as it is generated
+        coalescer = TokenStreamCoalescer(buffer)
+        profiler = RunProfiler()
+        for mode, payload in graph_session.stream(
+            config['ticker'],
+            config['analysis_date'],
+            stream_mode=["values", "messages"],
+            callbacks=[profiler],
+        ):
+            if mode == "messages":
+                message_chunk, metadata = payload
+                node = metadata.get("langgraph_node", "Analysis")
+                # Only agent tokens; tool nodes emit raw data dumps as ToolMessages
+                if not isinstance(message_chunk, AIMessageChunk) or node.startswith("tools_"):
+                    continue
+                text = message_chunk.content if isinstance(message_chunk.content, str) else ""
+                if text:
+                    coalescer.add(node, message_chunk.id or node, text)
+                continue
+
+            # A node finished: send the rest of its tokens before its result
+            coalescer.flush(done=True)
+            chunk = payload
             step_count += 1
             progress = min(90, (step_count / total_steps) * 80 + 10)
             
@@ -462,6 +546,10 @@ def run_analysis_background(session_id: str, config: Dict):
         
         buffer.update_progress(100, "Analysis completed successfully!")
         analysis_sessions[session_id]['status'] = 'completed'
+        analysis_sessions[session_id]['profile'] = profiler.profile(
+            config['ticker'], config['analysis_date']
+        )
+        RUN_METRICS.record(analysis_sessions[session_id]['profile'])
         
         # Clean up ChromaDB collections for this session after completion
         cleanup_session_collections(session_id)